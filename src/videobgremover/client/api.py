@@ -2,7 +2,8 @@
 
 import time
 import requests
-from typing import Optional, Dict, Any, Callable
+from requests.adapters import HTTPAdapter
+from typing import Optional, Dict, Any, Callable, Tuple
 from ..__version__ import __version__
 from .models import (
     CreateJobFileUpload,
@@ -16,6 +17,23 @@ from .models import (
     ProcessingError,
 )
 
+# Connection pool sizing for the default session; status polling and
+# concurrent jobs all talk to the same API host
+_POOL_CONNECTIONS = 4
+_POOL_MAXSIZE = 16
+
+
+def _new_session() -> requests.Session:
+    """Create a session with a pooled keep-alive adapter for the API."""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=_POOL_CONNECTIONS, pool_maxsize=_POOL_MAXSIZE
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers["Connection"] = "keep-alive"
+    return session
+
 
 class VideoBGRemoverClient:
     """Client for interacting with the VideoBGRemover API."""
@@ -33,11 +51,13 @@ class VideoBGRemoverClient:
         Args:
             api_key: Your VideoBGRemover API key
             base_url: Base URL for the API (default: production)
-            session: Optional requests session to use
+            session: Optional requests session to use. By default the client
+                creates its own pooled session, so sequential calls (credits,
+                uploads, status polls) reuse one keep-alive connection.
             timeout: Request timeout in seconds
         """
         self.base_url = base_url.rstrip("/")
-        self.session = session or requests.Session()
+        self.session = session or _new_session()
         self.timeout = timeout
 
         # Set up authentication header
@@ -45,8 +65,26 @@ class VideoBGRemoverClient:
             {"X-Api-Key": api_key, "User-Agent": f"videobgremover-python/{__version__}"}
         )
 
+    def close(self) -> None:
+        """Close the underlying session and its pooled connections."""
+        self.session.close()
+
+    def __enter__(self) -> "VideoBGRemoverClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
     def _request(self, method: str, endpoint: str, **kwargs) -> Dict[str, Any]:
         """Make a request to the API with error handling."""
+        response = self._send(method, endpoint, **kwargs)
+        try:
+            return response.json()
+        except ValueError as e:
+            raise ApiError(f"Request failed: {str(e)}")
+
+    def _send(self, method: str, endpoint: str, **kwargs) -> requests.Response:
+        """Send a request to the API and map error responses to exceptions."""
         url = f"{self.base_url}{endpoint}"
 
         # Set timeout if not provided
@@ -97,7 +135,7 @@ class VideoBGRemoverClient:
                     )
 
             response.raise_for_status()
-            return response.json()
+            return response
 
         except requests.exceptions.Timeout:
             raise ApiError(f"Request timed out after {self.timeout} seconds")
@@ -156,8 +194,33 @@ class VideoBGRemoverClient:
         Returns:
             Current job status
         """
-        response = self._request("GET", f"/v1/jobs/{job_id}/status")
-        return JobStatus.model_validate(response)
+        return self._status_with_hint(job_id)[0]
+
+    def _status_with_hint(self, job_id: str) -> Tuple[JobStatus, Optional[float]]:
+        """Get job status plus the server's suggested delay before the next poll.
+
+        The hint comes from a numeric ``Retry-After`` header or an ``eta_ms``
+        field in the response body, in that order.
+        """
+        response = self._send("GET", f"/v1/jobs/{job_id}/status")
+        try:
+            data = response.json()
+        except ValueError as e:
+            raise ApiError(f"Request failed: {str(e)}")
+
+        hint = None
+        retry_after = response.headers.get("Retry-After")
+        if retry_after:
+            try:
+                hint = float(retry_after)
+            except ValueError:
+                pass  # HTTP-date form; fall back to the backoff schedule
+        if hint is None and isinstance(data.get("eta_ms"), (int, float)):
+            hint = data["eta_ms"] / 1000
+        if hint is not None and hint < 0:
+            hint = None
+
+        return JobStatus.model_validate(data), hint
 
     def wait(
         self,
@@ -165,15 +228,27 @@ class VideoBGRemoverClient:
         poll_seconds: float = 2.0,
         timeout: Optional[float] = None,
         on_status: Optional[Callable[[str], None]] = None,
+        max_poll_seconds: float = 8.0,
+        poll_backoff: float = 1.6,
     ) -> JobStatus:
         """
         Wait for a job to complete.
 
+        Polling starts at ``poll_seconds`` and the interval grows by
+        ``poll_backoff`` after every unchanged status, up to
+        ``max_poll_seconds``. A status change resets the interval, and a
+        ``Retry-After`` header or ``eta_ms`` hint from the server replaces it
+        for that round (but never drops below ``poll_seconds``). No sleep
+        extends past ``timeout``. Pass ``poll_backoff=1.0`` for a fixed
+        interval.
+
         Args:
             job_id: The job ID to wait for
-            poll_seconds: Polling interval in seconds
+            poll_seconds: Initial polling interval in seconds
             timeout: Maximum time to wait (None for no timeout)
             on_status: Status callback function (receives status strings)
+            max_poll_seconds: Upper bound for the polling interval
+            poll_backoff: Factor applied to the interval after each poll
 
         Returns:
             Final job status
@@ -182,11 +257,12 @@ class VideoBGRemoverClient:
             TimeoutError: If timeout is reached
             ProcessingError: If job fails
         """
-        start_time = time.time()
+        start_time = time.monotonic()
         last_status = None
+        delay = poll_seconds
 
         while True:
-            status = self.status(job_id)
+            status, hint = self._status_with_hint(job_id)
 
             if status.status == "completed":
                 return status
@@ -197,17 +273,27 @@ class VideoBGRemoverClient:
                 )
 
             # Check timeout
-            if timeout and time.time() - start_time > timeout:
+            if timeout and time.monotonic() - start_time >= timeout:
                 raise TimeoutError(
                     f"Job {job_id} did not complete within {timeout} seconds"
                 )
 
-            # Call status callback only when status changes
-            if on_status and status.status != last_status:
-                on_status(status.status)
+            # Call status callback only when status changes; a new status
+            # also restarts the backoff from the initial interval
+            if status.status != last_status:
+                if on_status:
+                    on_status(status.status)
                 last_status = status.status
-
-            time.sleep(poll_seconds)
+                delay = poll_seconds
+
+            # A server hint never polls faster than poll_seconds, and no sleep
+            # runs past the timeout
+            pause = max(hint, poll_seconds) if hint is not None else delay
+            if timeout:
+                remaining = timeout - (time.monotonic() - start_time)
+                pause = max(min(pause, remaining), 0.0)
+            time.sleep(pause)
+            delay = min(delay * poll_backoff, max(max_poll_seconds, poll_seconds))
 
     def credits(self) -> CreditBalance:
         """
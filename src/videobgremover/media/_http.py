@@ -0,0 +1,39 @@
+"""Shared HTTP session for media downloads."""
+
+import threading
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# Enough pooled connections per host for concurrent downloads
+_POOL_SIZE = 8
+
+_SESSION: Optional[requests.Session] = None
+_SESSION_LOCK = threading.Lock()
+
+
+def http_session() -> requests.Session:
+    """
+    Get the process-wide session used for media downloads.
+
+    Reusing one session keeps connections alive between downloads, so
+    repeated requests to the same host (e.g. several assets on one CDN) skip
+    the DNS lookup and TLS handshake after the first one.
+
+    Returns:
+        Shared requests session with a pooled keep-alive adapter
+    """
+    global _SESSION
+    if _SESSION is None:
+        with _SESSION_LOCK:
+            if _SESSION is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=_POOL_SIZE, pool_maxsize=_POOL_SIZE
+                )
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                session.headers["Connection"] = "keep-alive"
+                _SESSION = session
+    return _SESSION
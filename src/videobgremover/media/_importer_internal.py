@@ -6,7 +6,6 @@ This module is internal and should not be used directly by SDK users.
 import os
 import subprocess
 import mimetypes
-import requests
 import zipfile
 from pathlib import Path
 from urllib.parse import urlparse
@@ -26,6 +25,7 @@ from ..client.models import (
 from ..core.types import BackgroundType, TransparentFormat
 from .remove_bg import RemoveBGOptions, Prefer
 from .context import MediaContext
+from ._http import http_session
 
 
 class Importer:
@@ -51,7 +51,7 @@ class Importer:
             video: Video to process
             client: API client
             options: Processing options
-            wait_poll_seconds: Polling interval
+            wait_poll_seconds: Initial polling interval
             on_status: Status callback (receives status strings)
 
         Returns:
@@ -131,7 +131,14 @@ class Importer:
 
     def _create_job(self, video: Video, client: VideoBGRemoverClient) -> str:
         """Create a job for the video."""
-        if video.kind == "url" and self._public_url_ok(str(video.src)):
+        if video.kind == "url":
+            # Unreachable URLs can be neither downloaded by the API nor
+            # uploaded from here, so fail before creating a job
+            if not self._public_url_ok(str(video.src)):
+                raise RuntimeError(
+                    f"Video URL is not publicly accessible or exceeds 1GB: {video.src}"
+                )
+
             # Use URL download
             response = client.create_job_url(
                 CreateJobUrlDownload(video_url=HttpUrl(str(video.src)))
@@ -143,15 +150,7 @@ class Importer:
             if content_type not in {"video/mp4", "video/mov", "video/webm"}:
                 content_type = "video/mp4"  # Default
 
-            # Extract filename from URL or file path using proper parsing
-            if video.kind == "url":
-                try:
-                    parsed_url = urlparse(str(video.src))
-                    filename = Path(parsed_url.path).name or "video.mp4"
-                except Exception:
-                    filename = "video.mp4"  # Fallback
-            else:
-                filename = Path(str(video.src)).name
+            filename = Path(str(video.src)).name
 
             # Create upload job
             response = client.create_job_file(
@@ -171,7 +170,7 @@ class Importer:
     def _public_url_ok(self, url: str) -> bool:
         """Check if URL is publicly accessible and within size limits."""
         try:
-            response = requests.head(url, allow_redirects=True, timeout=5)
+            response = http_session().head(url, allow_redirects=True, timeout=5)
 
             if response.status_code not in (200, 204):
                 return False
@@ -190,10 +189,14 @@ class Importer:
             return False
 
     def _signed_put(self, url: str, file_path: str, content_type: str) -> None:
-        """Upload file to signed URL."""
+        """Upload file to signed URL.
+
+        The open file is passed as the request body, so it is streamed to the
+        socket in blocks rather than read into memory first.
+        """
         try:
             with open(file_path, "rb") as f:
-                response = requests.put(
+                response = http_session().put(
                     url,
                     data=f,
                     headers={"Content-Type": content_type},
@@ -234,7 +237,7 @@ class Importer:
     def _download_file(self, url: str, local_path: str) -> str:
         """Download file from URL to local path."""
         try:
-            response = requests.get(url, timeout=300)  # 5 minute timeout
+            response = http_session().get(url, timeout=300)  # 5 minute timeout
             response.raise_for_status()
 
             with open(local_path, "wb") as f:
@@ -289,16 +292,18 @@ class Importer:
     def _is_stacked_video(self, video_path: str) -> bool:
         """Check if video is in stacked format (height is double width aspect ratio)."""
         try:
+            # Only ask for the two fields we need, as bare "width,height"
             result = subprocess.run(
                 [
                     self.ctx.ffprobe,
                     "-v",
                     "quiet",
-                    "-print_format",
-                    "json",
-                    "-show_streams",
                     "-select_streams",
                     "v:0",
+                    "-show_entries",
+                    "stream=width,height",
+                    "-of",
+                    "csv=p=0",
                     video_path,
                 ],
                 capture_output=True,
@@ -306,19 +311,12 @@ class Importer:
                 timeout=30,
             )
 
-            if result.returncode != 0:
+            if result.returncode != 0 or not result.stdout.strip():
                 return False
 
-            import json
-
-            data = json.loads(result.stdout)
-
-            if not data.get("streams"):
-                return False
-
-            stream = data["streams"][0]
-            width = int(stream.get("width", 0))
-            height = int(stream.get("height", 0))
+            width, height = (
+                int(value) for value in result.stdout.strip().split(",")[:2]
+            )
 
             # Stacked video should have height roughly double the width
             # (allowing for some tolerance)
@@ -0,0 +1,72 @@
+"""Memoized ffprobe execution for local media files."""
+
+import os
+import subprocess
+from functools import lru_cache
+from typing import List, Tuple
+
+
+def run_ffprobe(
+    cmd: List[str], source: str, timeout: float
+) -> subprocess.CompletedProcess:
+    """
+    Run an ffprobe command, reusing earlier results for unchanged local files.
+
+    Results for local files are cached on (command, resolved path, mtime, size),
+    so probing the same file again skips the subprocess entirely while any
+    modification of the file invalidates the entry. Failed probes and URLs or
+    streams are never cached.
+
+    Args:
+        cmd: Complete ffprobe command
+        source: File path or URL being probed
+        timeout: Subprocess timeout in seconds
+
+    Returns:
+        Completed process with text stdout/stderr
+    """
+    try:
+        stat = os.stat(source)
+    except (OSError, ValueError):
+        # Not a local file (URL, stream or missing path)
+        return subprocess.run(cmd, capture_output=True, text=True, timeout=timeout)
+
+    try:
+        returncode, stdout, stderr = _run_cached(
+            tuple(cmd),
+            os.path.realpath(source),
+            stat.st_mtime_ns,
+            stat.st_size,
+            timeout,
+        )
+    except _ProbeFailed as e:
+        return e.result
+    return subprocess.CompletedProcess(list(cmd), returncode, stdout, stderr)
+
+
+class _ProbeFailed(Exception):
+    """Raised by _run_cached for a failed ffprobe run, which must not be cached."""
+
+    def __init__(self, result: subprocess.CompletedProcess):
+        super().__init__(result.returncode)
+        self.result = result
+
+
+@lru_cache(maxsize=256)
+def _run_cached(
+    cmd: Tuple[str, ...], realpath: str, mtime_ns: int, size: int, timeout: float
+) -> Tuple[int, str, str]:
+    """Run ffprobe; the path, mtime and size only serve as cache key.
+
+    Failures raise _ProbeFailed instead of returning, so lru_cache keeps only
+    successful results and a transient error is retried on the next probe.
+    """
+    result = subprocess.run(list(cmd), capture_output=True, text=True, timeout=timeout)
+    if result.returncode != 0:
+        raise _ProbeFailed(result)
+    return result.returncode, result.stdout, result.stderr
+
+
+def clear_probe_cache() -> None:
+    """Forget all memoized ffprobe results."""
+    _run_cached.cache_clear()
@@ -2,6 +2,7 @@
 
 import subprocess
 import json
+import struct
 import requests
 import os
 from mimetypes import guess_extension
@@ -12,6 +13,8 @@ from abc import ABC, abstractmethod
 from .video import Video
 from .video_source import VideoSource
 from .context import MediaContext, default_context
+from ._http import http_session
+from ._probe import run_ffprobe
 
 
 class BaseBackground(BaseModel, ABC):
@@ -57,22 +60,16 @@ class BaseBackground(BaseModel, ABC):
         Returns:
             New background instance with updated audio settings
         """
-        # Create new instance with same properties but different audio settings
-        new_instance = self.__class__(
-            **{
-                **self.model_dump(),
+        # Shallow copy with different audio settings; model_copy() also copies
+        # private attributes, so the probed _video_info (needed for has_audio())
+        # carries over without re-probing the source
+        return self.model_copy(
+            update={
                 "audio_enabled": enabled,
                 "audio_volume": max(0.0, min(1.0, volume)),  # Clamp volume to 0.0-1.0
             }
         )
 
-        # Copy the probed video info if it exists (same pattern as subclip())
-        # This is needed for has_audio() to work correctly on the new instance
-        if hasattr(self, "_video_info"):
-            setattr(new_instance, "_video_info", getattr(self, "_video_info"))
-
-        return new_instance
-
     def has_audio(self) -> bool:
         """Check if this background type can have audio."""
         return False  # Most backgrounds don't have audio
@@ -189,20 +186,9 @@ class VideoBackground(BaseBackground, VideoSource):
         Returns:
             New VideoBackground instance with trimming applied
         """
-        # Create a new instance with the same properties but different trim
-        new_bg = VideoBackground(
-            source=self.source,
-            width=self.width,
-            height=self.height,
-            fps=self.fps,
-            source_trim=(start, end),
-            audio_enabled=self.audio_enabled,  # Preserve audio settings
-            audio_volume=self.audio_volume,
-        )
-        # Copy the probed video info
-        if hasattr(self, "_video_info"):
-            new_bg._video_info = self._video_info
-        return new_bg
+        # Shallow copy with a different trim; the probed _video_info is carried
+        # over in memory, so the source is never re-probed
+        return self.model_copy(update={"source_trim": (start, end)})
 
 
 class EmptyBackground(BaseBackground):
@@ -243,7 +229,7 @@ def _download_image_to_temp(image_url: str, ctx: MediaContext) -> str:
     ctx.logger.debug(f"Downloading image from URL: {image_url}")
 
     try:
-        response = requests.get(image_url, stream=True, timeout=30)
+        response = http_session().get(image_url, stream=True, timeout=30)
         response.raise_for_status()
     except requests.RequestException as e:
         raise RuntimeError(f"Failed to download image from {image_url}: {e}")
@@ -288,8 +274,89 @@ def _download_image_to_temp(image_url: str, ctx: MediaContext) -> str:
     return temp_file_path
 
 
+# JPEG start-of-frame markers (baseline, progressive, lossless, ...); C4, C8
+# and CC are DHT/JPG/DAC, which share the range but carry no frame size
+_JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+
+def _read_image_size(image_path: str) -> Optional[Tuple[int, int]]:
+    """
+    Read image dimensions from the file header (PNG, JPEG, GIF, WebP).
+
+    Only the first bytes of the file are parsed (plus JPEG marker headers),
+    no pixels are decoded.
+
+    Args:
+        image_path: Local image file path
+
+    Returns:
+        (width, height), or None if the format is not recognized
+    """
+    try:
+        with open(image_path, "rb") as f:
+            head = f.read(32)
+
+            # PNG: signature, then the IHDR chunk
+            if head.startswith(b"\x89PNG\r\n\x1a\n") and head[12:16] == b"IHDR":
+                width, height = struct.unpack(">II", head[16:24])
+                return width, height
+
+            # GIF87a / GIF89a: logical screen size
+            if head[:6] in (b"GIF87a", b"GIF89a"):
+                width, height = struct.unpack("<HH", head[6:10])
+                return width, height
+
+            # WebP: RIFF container with a VP8 / VP8L / VP8X chunk
+            if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+                chunk = head[12:16]
+                if chunk == b"VP8 " and head[23:26] == b"\x9d\x01\x2a":
+                    width, height = struct.unpack("<HH", head[26:30])
+                    return width & 0x3FFF, height & 0x3FFF
+                if chunk == b"VP8L" and head[20:21] == b"\x2f":
+                    bits = int.from_bytes(head[21:25], "little")
+                    return (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1
+                if chunk == b"VP8X":
+                    width = int.from_bytes(head[24:27], "little") + 1
+                    height = int.from_bytes(head[27:30], "little") + 1
+                    return width, height
+                return None
+
+            # JPEG: walk marker segments up to the first start-of-frame
+            if head[:2] == b"\xff\xd8":
+                f.seek(2)
+                while True:
+                    marker = f.read(2)
+                    if len(marker) < 2 or marker[0] != 0xFF:
+                        return None
+                    code = marker[1]
+                    if code == 0xFF:  # Fill byte, marker follows
+                        f.seek(-1, os.SEEK_CUR)
+                        continue
+                    if code == 0xD8 or 0xD0 <= code <= 0xD7:  # No payload
+                        continue
+                    length_bytes = f.read(2)
+                    if len(length_bytes) < 2:
+                        return None
+                    (length,) = struct.unpack(">H", length_bytes)
+                    if code in _JPEG_SOF_MARKERS:
+                        frame = f.read(5)
+                        if len(frame) < 5:
+                            return None
+                        height, width = struct.unpack(">HH", frame[1:5])
+                        return width, height
+                    f.seek(length - 2, os.SEEK_CUR)
+    except (OSError, struct.error):
+        return None
+
+    return None
+
+
 def _probe_image_dimensions(image_path: str, ctx: MediaContext) -> Tuple[int, int]:
-    """Probe image dimensions using ffprobe."""
+    """Probe image dimensions from the file header, falling back to ffprobe."""
+    size = _read_image_size(image_path)
+    if size and size[0] > 0 and size[1] > 0:
+        return size
+
     try:
         cmd = [
             ctx.ffprobe,
@@ -304,7 +371,7 @@ def _probe_image_dimensions(image_path: str, ctx: MediaContext) -> Tuple[int, in
             image_path,
         ]
 
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
+        result = run_ffprobe(cmd, image_path, timeout=10)
 
         if result.returncode != 0:
             raise RuntimeError(f"Failed to probe image {image_path}: {result.stderr}")
@@ -348,7 +415,7 @@ def _probe_video_dimensions(
             video_path,
         ]
 
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=15)
+        result = run_ffprobe(cmd, video_path, timeout=15)
 
         if result.returncode != 0:
             raise RuntimeError(f"Failed to probe video {video_path}: {result.stderr}")
@@ -1,13 +1,39 @@
 """Video composition system with layer handling and canvas rules."""
 
 import subprocess
-from typing import List, Optional, Tuple, Literal, Dict, Any
+import sys
 from contextlib import contextmanager
+from typing import IO, Any, Dict, List, Literal, Optional, Tuple
+
+from ..core.types import Anchor, ProgressCb, SizeMode
 from .backgrounds import Background, BaseBackground
-from .foregrounds import Foreground
-from .encoders import EncoderProfile
 from .context import MediaContext, default_context
-from ..core.types import Anchor, SizeMode, ProgressCb
+from .encoders import EncoderProfile
+from .foregrounds import Foreground
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None  # type: ignore[assignment]
+
+
+# Buffer size for FFmpeg pipes: large enough that streamed frames move in a
+# few big reads/writes instead of many 4-64 KB ones
+_PIPE_BUFFER_SIZE = 1 << 20
+
+# fcntl.F_SETPIPE_SZ is only exposed by Python 3.10+; the value is Linux's
+_F_SETPIPE_SZ = getattr(fcntl, "F_SETPIPE_SZ", 1031) if fcntl else None
+
+
+def _grow_pipe(pipe: Optional[IO[Any]]) -> None:
+    """Enlarge the kernel buffer of a subprocess pipe (Linux only, best effort)."""
+    if pipe is None or _F_SETPIPE_SZ is None or not sys.platform.startswith("linux"):
+        return
+    try:
+        fcntl.fcntl(pipe.fileno(), _F_SETPIPE_SZ, _PIPE_BUFFER_SIZE)
+    except (OSError, ValueError):
+        # Above /proc/sys/fs/pipe-max-size or not a real pipe: keep the default
+        pass
 
 
 class LayerHandle:
@@ -23,7 +49,7 @@ class LayerHandle:
         self, anchor: Anchor = Anchor.CENTER, dx: int = 0, dy: int = 0
     ) -> "LayerHandle":
         """Set layer position using anchor and offset."""
-        layer = self._comp._layers[self._idx]
+        layer = self._comp._edit_layer(self._idx)
         layer["anchor"] = anchor
         layer["dx"] = dx
         layer["dy"] = dy
@@ -31,7 +57,7 @@ class LayerHandle:
 
     def xy(self, x_expr: str, y_expr: str) -> "LayerHandle":
         """Set layer position using custom expressions."""
-        layer = self._comp._layers[self._idx]
+        layer = self._comp._edit_layer(self._idx)
         layer["x_expr"] = x_expr
         layer["y_expr"] = y_expr
         return self
@@ -46,45 +72,45 @@ class LayerHandle:
         scale: Optional[float] = None,
     ) -> "LayerHandle":
         """Set layer size mode and parameters."""
-        layer = self._comp._layers[self._idx]
+        layer = self._comp._edit_layer(self._idx)
         layer["size"] = (mode, width, height, percent, scale)
         return self
 
     # Visual effects
     def opacity(self, alpha: float) -> "LayerHandle":
         """Set layer opacity (0.0 to 1.0)."""
-        layer = self._comp._layers[self._idx]
+        layer = self._comp._edit_layer(self._idx)
         layer["opacity"] = max(0.0, min(1.0, alpha))
         return self
 
     def rotate(self, degrees: float) -> "LayerHandle":
         """Set layer rotation in degrees."""
-        layer = self._comp._layers[self._idx]
+        layer = self._comp._edit_layer(self._idx)
         layer["rotate"] = degrees
         return self
 
     def crop(self, x: int, y: int, w: int, h: int) -> "LayerHandle":
         """Set layer crop rectangle."""
-        layer = self._comp._layers[self._idx]
+        layer = self._comp._edit_layer(self._idx)
         layer["crop"] = (x, y, w, h)
         return self
 
     # Timing methods - Composition timing (when to show in final video)
     def start(self, seconds: float) -> "LayerHandle":
         """Set when this layer starts appearing in the composition timeline."""
-        layer = self._comp._layers[self._idx]
+        layer = self._comp._edit_layer(self._idx)
         layer["comp_start"] = seconds
         return self
 
     def end(self, seconds: float) -> "LayerHandle":
         """Set when this layer stops appearing in the composition timeline."""
-        layer = self._comp._layers[self._idx]
+        layer = self._comp._edit_layer(self._idx)
         layer["comp_end"] = seconds
         return self
 
     def duration(self, seconds: float) -> "LayerHandle":
         """Set how long this layer appears in the composition (from its start time)."""
-        layer = self._comp._layers[self._idx]
+        layer = self._comp._edit_layer(self._idx)
         layer["comp_duration"] = seconds
         return self
 
@@ -97,7 +123,7 @@ class LayerHandle:
             start: Start time in source video (seconds)
             end: End time in source video (seconds, None = use until end)
         """
-        layer = self._comp._layers[self._idx]
+        layer = self._comp._edit_layer(self._idx)
         layer["source_trim"] = (start, end)
         return self
 
@@ -110,7 +136,7 @@ class LayerHandle:
             enabled: Whether to include audio from this layer
             volume: Audio volume (0.0 to 1.0, where 1.0 is full volume)
         """
-        layer = self._comp._layers[self._idx]
+        layer = self._comp._edit_layer(self._idx)
         layer["audio_enabled"] = enabled
         layer["audio_volume"] = max(0.0, min(1.0, volume))  # Clamp volume to 0.0-1.0
         return self
@@ -118,7 +144,7 @@ class LayerHandle:
     # Z-order
     def z(self, index: int) -> "LayerHandle":
         """Set layer z-index (rendering order)."""
-        layer = self._comp._layers[self._idx]
+        layer = self._comp._edit_layer(self._idx)
         layer["z"] = index
         return self
 
@@ -132,7 +158,7 @@ class LayerHandle:
         Returns:
             LayerHandle for method chaining
         """
-        layer = self._comp._layers[self._idx]
+        layer = self._comp._edit_layer(self._idx)
         layer["alpha_enabled"] = enabled
         return self
 
@@ -157,11 +183,15 @@ class Composition:
         self._layers: List[Dict[str, Any]] = []
         self._canvas_hint: Optional[Tuple[int, int, float]] = None
         self._explicit_duration: Optional[float] = None  # For rule 3: explicit override
+        self._dry_run_cmd: Optional[str] = (
+            None  # Cleared whenever the composition changes
+        )
 
     # Background/Canvas setup
     def background(self, bg: BaseBackground) -> "Composition":
         """Set composition background."""
         self._background = bg
+        self._dry_run_cmd = None
         return self
 
     @staticmethod
@@ -174,11 +204,13 @@ class Composition:
     def set_canvas(self, width: int, height: int, fps: float) -> "Composition":
         """Set explicit canvas dimensions."""
         self._canvas_hint = (width, height, fps)
+        self._dry_run_cmd = None
         return self
 
     def set_duration(self, seconds: float) -> "Composition":
         """Set explicit composition duration (Rule 3: Override)."""
         self._explicit_duration = seconds
+        self._dry_run_cmd = None
         return self
 
     # Layer management
@@ -221,8 +253,14 @@ class Composition:
         }
 
         self._layers.append(layer)
+        self._dry_run_cmd = None
         return LayerHandle(self, len(self._layers) - 1)
 
+    def _edit_layer(self, idx: int) -> Dict[str, Any]:
+        """Return a layer for modification, dropping the cached dry-run command."""
+        self._dry_run_cmd = None
+        return self._layers[idx]
+
     # Export methods
     def to_file(
         self,
@@ -270,11 +308,18 @@ class Composition:
         """
         Generate FFmpeg command without executing.
 
+        The command is cached until the composition or one of its layers is
+        modified, so repeated calls do not rebuild the filter graph.
+
         Returns:
             FFmpeg command string
         """
-        argv = self._build_ffmpeg_argv("OUT.mp4", EncoderProfile.h264(), to_pipe=False)
-        return " ".join(map(str, argv))
+        if self._dry_run_cmd is None:
+            argv = self._build_ffmpeg_argv(
+                "OUT.mp4", EncoderProfile.h264(), to_pipe=False
+            )
+            self._dry_run_cmd = " ".join(map(str, argv))
+        return self._dry_run_cmd
 
     # Internal methods
     def _get_canvas_size(self) -> Tuple[int, int, float]:
@@ -388,6 +433,14 @@ class Composition:
         # Add layer inputs with timing and collect audio info simultaneously
         audio_inputs = []
 
+        # Layers that share the same source (same files and source trim) and
+        # the same composition timing reuse the first layer's inputs, so FFmpeg
+        # decodes each source only once and fans the decoded frames out to
+        # every filter chain that references it. Layers at different times get
+        # their own input: a shared decoder would have to buffer frames for the
+        # later-starting branches until their setpts offset is reached.
+        source_inputs: Dict[Tuple[Any, ...], int] = {}
+
         for i, layer in enumerate(self._layers):
             fg = layer["fg"]
 
@@ -409,12 +462,30 @@ class Composition:
             source_trim_args = get_source_trim_args()
             composition_timing_args = get_composition_timing_args()
 
+            source_key = (
+                fg.format,
+                fg.primary_path,
+                fg.mask_path,
+                fg.audio_path,
+                fg.source_trim,
+                layer["comp_start"],
+                layer["comp_end"],
+                layer["comp_duration"],
+            )
+            shared_idx = source_inputs.get(source_key)
+
             ffmpeg_args, input_map_updates, audio_input_key = fg.get_ffmpeg_inputs(
-                input_idx, i, self.ctx, source_trim_args, composition_timing_args
+                input_idx if shared_idx is None else shared_idx,
+                i,
+                self.ctx,
+                source_trim_args,
+                composition_timing_args,
             )
 
-            # Add the FFmpeg arguments
-            argv.extend(ffmpeg_args)
+            # Add the FFmpeg arguments (only once per unique source)
+            if shared_idx is None:
+                source_inputs[source_key] = input_idx
+                argv.extend(ffmpeg_args)
 
             # Update input map
             input_map.update(input_map_updates)
@@ -1204,7 +1275,10 @@ class Composition:
                     stderr=subprocess.PIPE,
                     text=True,
                     stdin=subprocess.DEVNULL,
+                    bufsize=_PIPE_BUFFER_SIZE,
                 )
+                _grow_pipe(process.stdout)
+                _grow_pipe(process.stderr)
 
                 # Simple progress tracking (could be enhanced)
                 if on_progress:
@@ -1233,7 +1307,10 @@ class Composition:
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
             stdin=subprocess.DEVNULL,
+            bufsize=_PIPE_BUFFER_SIZE,
         )
+        _grow_pipe(process.stdout)
+        _grow_pipe(process.stderr)
 
         try:
             yield process.stdout
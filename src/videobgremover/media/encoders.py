@@ -3,6 +3,13 @@
 from pydantic import BaseModel
 from typing import List, Optional, Literal
 
+# Constant-quality flag of the hardware H.264 encoders; the profile's crf is
+# passed through as its value
+_HW_QUALITY_FLAGS = {
+    "h264_nvenc": "-cq",
+    "h264_qsv": "-global_quality",
+}
+
 
 class EncoderProfile(BaseModel):
     """Encoder profile that generates FFmpeg arguments."""
@@ -17,22 +24,47 @@ class EncoderProfile(BaseModel):
     ]
     crf: Optional[int] = None
     preset: Optional[str] = None
+    tune: Optional[str] = None
+    threads: Optional[int] = None
+    x264_params: Optional[str] = None
+    codec: Optional[str] = None
     layout: Optional[Literal["vertical", "horizontal"]] = None
     fps: Optional[float] = None
 
     @staticmethod
-    def h264(crf: int = 18, preset: str = "medium") -> "EncoderProfile":
+    def h264(
+        crf: int = 18,
+        preset: str = "medium",
+        tune: Optional[str] = None,
+        threads: Optional[int] = None,
+        x264_params: Optional[str] = None,
+        codec: Optional[str] = None,
+    ) -> "EncoderProfile":
         """
         H.264 encoder profile for standard video output.
 
         Args:
             crf: Constant Rate Factor (lower = higher quality)
             preset: Encoding preset (ultrafast, superfast, veryfast, faster, fast, medium, slow, slower, veryslow)
+            tune: Optional x264 tuning (film, animation, stillimage, fastdecode, zerolatency, ...)
+            threads: Optional encoder thread count (0 lets x264 decide)
+            x264_params: Optional raw x264 options (e.g. "sliced-threads=1")
+            codec: Optional FFmpeg H.264 encoder to use instead of libx264
+                (e.g. "h264_nvenc", "h264_videotoolbox", "h264_qsv"). preset,
+                tune, threads and x264_params only apply to libx264.
 
         Returns:
             H.264 encoder profile
         """
-        return EncoderProfile(kind="h264", crf=crf, preset=preset)
+        return EncoderProfile(
+            kind="h264",
+            crf=crf,
+            preset=preset,
+            tune=tune,
+            threads=threads,
+            x264_params=x264_params,
+            codec=codec,
+        )
 
     @staticmethod
     def vp9(crf: int = 32) -> "EncoderProfile":
@@ -108,7 +140,14 @@ class EncoderProfile(BaseModel):
         Returns:
             List of FFmpeg arguments
         """
-        if self.kind == "h264":
+        if self.kind == "h264" and self.codec not in (None, "libx264"):
+            # Hardware encoder: x264 options don't apply
+            args = ["-c:v", self.codec, "-pix_fmt", "yuv420p"]
+            quality_flag = _HW_QUALITY_FLAGS.get(self.codec)
+            if quality_flag and self.crf is not None:
+                args.extend([quality_flag, str(self.crf)])
+
+        elif self.kind == "h264":
             args = [
                 "-c:v",
                 "libx264",
@@ -119,6 +158,12 @@ class EncoderProfile(BaseModel):
                 "-pix_fmt",
                 "yuv420p",
             ]
+            if self.tune:
+                args.extend(["-tune", self.tune])
+            if self.threads is not None:
+                args.extend(["-threads", str(self.threads)])
+            if self.x264_params:
+                args.extend(["-x264-params", self.x264_params])
 
         elif self.kind == "vp9":
             args = [
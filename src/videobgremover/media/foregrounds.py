@@ -188,19 +188,9 @@ class Foreground(VideoSource):
         Returns:
             New Foreground instance with trimming applied
         """
-        # Create a new instance with the same properties but different trim
-        new_fg = Foreground(
-            format=self.format,
-            primary_path=self.primary_path,
-            mask_path=self.mask_path,
-            audio_path=self.audio_path,
-            source_trim=(start, end),
-            matte=self.matte,  # Preserve matte flag
-        )
-        # Copy the probed video info
-        if hasattr(self, "_video_info"):
-            new_fg._video_info = self._video_info
-        return new_fg
+        # Shallow copy with a different trim; matte flag and the probed
+        # _video_info are carried over in memory, so nothing is re-probed
+        return self.model_copy(update={"source_trim": (start, end)})
 
     @staticmethod
     def _get_file_extension(path: str) -> str:
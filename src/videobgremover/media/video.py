@@ -57,7 +57,8 @@ class Video(BaseModel):
             client: VideoBGRemover API client
             options: Background removal configuration options
             on_status: Optional callback for status updates
-            wait_poll_seconds: Polling interval for job status
+            wait_poll_seconds: Initial polling interval for job status (backs off
+                while the status is unchanged)
             ctx: Optional media context (uses default if not provided)
             webhook_url: Optional webhook URL for job notifications
 
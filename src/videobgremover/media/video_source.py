@@ -7,6 +7,7 @@ from typing import Dict, Any, Optional
 from urllib.parse import urlparse
 from pydantic import BaseModel
 from .context import MediaContext
+from ._probe import run_ffprobe
 
 
 class VideoSource(BaseModel):
@@ -43,9 +44,7 @@ class VideoSource(BaseModel):
 
             # Longer timeout for URLs
             timeout = 10 if self._detect_source_type(source) == "url" else 5
-            result = subprocess.run(
-                cmd, capture_output=True, text=True, timeout=timeout
-            )
+            result = run_ffprobe(cmd, source, timeout=timeout)
 
             if result.returncode != 0:
                 ctx.logger.warning(f"ffprobe failed for {source}: {result.stderr}")
@@ -1,8 +1,24 @@
 """Shared test fixtures and configuration."""
 
 import pytest
+import shutil
 import tempfile
 import os
+import re
+import socket
+import subprocess
+import time
+from urllib.parse import urlparse
+from pathlib import Path
+
+from videobgremover import EncoderProfile
+from videobgremover.media._probe import run_ffprobe
+
+# PyAV (optional) reads durations in-process instead of spawning ffprobe
+try:
+    import av
+except ImportError:
+    av = None
 
 # Auto-load .env file for tests
 try:
@@ -13,6 +29,177 @@ except ImportError:
     pass  # dotenv not available, use regular env vars
 
 
+# Encoder for tests that only need a valid mp4 on disk: output quality is
+# irrelevant, so trade it for the cheapest libx264 settings.
+# Two sliced threads per encode so parallel (-n auto) workers don't oversubscribe
+TEST_ENCODER = EncoderProfile.h264(
+    crf=28,
+    preset="ultrafast",
+    tune="zerolatency",
+    threads=2,
+    x264_params="sliced-threads=1:sync-lookahead=0",
+)
+
+
+def _encoder_works(name: str) -> bool:
+    """Check that an FFmpeg encoder is available by encoding a single frame."""
+    try:
+        result = subprocess.run(
+            [
+                "ffmpeg",
+                "-hide_banner",
+                "-loglevel",
+                "error",
+                "-f",
+                "lavfi",
+                "-i",
+                "color=c=black:s=256x256:d=0.1",
+                "-frames:v",
+                "1",
+                "-c:v",
+                name,
+                "-f",
+                "null",
+                "-",
+            ],
+            capture_output=True,
+            timeout=30,
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return False
+    return result.returncode == 0
+
+
+@pytest.fixture(scope="session")
+def test_encoder():
+    """Encoder for test exports: TEST_ENCODER unless VBGR_TEST_ENCODER is set.
+
+    VBGR_TEST_ENCODER opts in to another H.264 encoder by FFmpeg name, e.g. a
+    hardware one ("h264_nvenc", "h264_videotoolbox", "h264_qsv"). It is
+    checked once with a single-frame trial encode.
+    """
+    name = os.getenv("VBGR_TEST_ENCODER")
+    if not name or name == "libx264":
+        return TEST_ENCODER
+    if not _encoder_works(name):
+        pytest.fail(f"VBGR_TEST_ENCODER={name} cannot encode on this machine")
+    return EncoderProfile.h264(crf=28, codec=name)
+
+
+def get_video_duration(file_path: str) -> float:
+    """Get actual video duration, 0.0 if it cannot be determined.
+
+    Uses PyAV when installed, which opens the container in-process without
+    a fork/exec. Otherwise (or if PyAV fails) falls back to ffprobe through
+    the library's memoized runner, so re-measuring an unchanged file (same
+    path, size and mtime) skips the subprocess.
+    """
+    if av is not None:
+        # Cap network reads for URL sources (microseconds)
+        options = {"rw_timeout": "10000000"} if "://" in file_path else {}
+        try:
+            with av.open(
+                file_path, options=options, metadata_errors="ignore"
+            ) as container:
+                if container.duration:
+                    return container.duration / av.time_base
+        except Exception:
+            pass
+
+    try:
+        cmd = [
+            "ffprobe",
+            "-v",
+            "quiet",
+            "-show_entries",
+            "format=duration",
+            "-of",
+            "default=nw=1:nk=1",
+            file_path,
+        ]
+        result = run_ffprobe(cmd, file_path, timeout=10)
+        if result.returncode == 0:
+            duration = result.stdout.strip()
+            return float(duration) if duration and duration != "N/A" else 0.0
+        return 0.0
+    except Exception:
+        return 0.0
+
+
+def assert_all_present(cmd: str, tokens, msg: str = "") -> None:
+    """Assert that every token occurs in an FFmpeg command string.
+
+    All tokens are matched in a single scan of ``cmd``; tokens shadowed by a
+    longer token at the same position fall back to a plain substring check.
+    """
+    tokens = list(tokens)
+    pattern = "|".join(re.escape(t) for t in sorted(tokens, key=len, reverse=True))
+    found = set(re.findall(f"(?=({pattern}))", cmd))
+    missing = [t for t in tokens if t not in found and t not in cmd]
+    assert not missing, f"{msg} (missing {missing})" if msg else f"Missing {missing}"
+
+
+def assert_valid_video(path) -> int:
+    """Assert that an encoded output exists and is a readable video.
+
+    Existence and a non-zero size are always checked, with one stat call
+    whose size is returned so callers need not stat the file again.
+    With PyAV installed the container is also opened in-process and its
+    first video packet demuxed, which catches truncated outputs (e.g. a
+    missing moov atom) that still pass the size check.
+    """
+    # A single stat covers both checks (FileNotFoundError if never written)
+    size = Path(path).stat().st_size
+    assert size > 0, f"Output is empty: {path}"
+
+    if av is None:
+        return size
+
+    with av.open(str(path)) as container:
+        assert container.streams.video, f"No video stream in {path}"
+        assert container.duration and container.duration > 0, f"No duration in {path}"
+        assert next(container.demux(video=0), None) is not None, (
+            f"No video packets in {path}"
+        )
+    return size
+
+
+def time_null_render(comp) -> float:
+    """Run a composition into FFmpeg's null muxer and return the elapsed time.
+
+    Decoding and the filter graph run exactly as for an export, while the
+    encode, muxing and disk writes are skipped. Raises if FFmpeg fails.
+    """
+    profile = EncoderProfile.h264()
+    argv = comp._build_ffmpeg_argv("-", profile, to_pipe=False)
+    # Drop the encoder arguments and output path, then discard the frames
+    argv = argv[: -len(profile.args("-"))] + ["-f", "null", "-"]
+
+    start = time.perf_counter()
+    comp._run(argv)
+    return time.perf_counter() - start
+
+
+def pytest_addoption(parser):
+    """Register command line options for the test suite."""
+    parser.addoption(
+        "--run-slow",
+        action="store_true",
+        default=False,
+        help="run tests marked slow (real FFmpeg encodes)",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip tests marked slow unless --run-slow is given."""
+    if config.getoption("--run-slow"):
+        return
+    skip_slow = pytest.mark.skip(reason="slow test, use --run-slow to run")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
 @pytest.fixture
 def temp_dir():
     """Create a temporary directory for test files."""
@@ -20,6 +207,223 @@ def temp_dir():
         yield tmp_dir
 
 
+@pytest.fixture(scope="session")
+def output_root():
+    """Root directory for encoded test outputs.
+
+    Outputs are only checked for existence and size, so by default they are
+    written to a temporary directory under the system temp dir and removed at
+    the end of the session. Set TEST_OUTPUT_DIR to place that directory
+    elsewhere (e.g. /dev/shm on machines with a large enough tmpfs), or
+    KEEP_TEST_OUTPUTS=1 to write to ./test_outputs for manual inspection.
+    """
+    if os.getenv("KEEP_TEST_OUTPUTS"):
+        root = Path("test_outputs")
+        root.mkdir(exist_ok=True)
+        yield root
+        return
+
+    root = Path(
+        tempfile.mkdtemp(
+            prefix="vbr_test_outputs_", dir=os.getenv("TEST_OUTPUT_DIR") or None
+        )
+    )
+    try:
+        yield root
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+@pytest.fixture(scope="session")
+def test_video_host_dns():
+    """Resolve the TEST_VIDEO_URL host once and pin it for the session.
+
+    urllib3 (and so requests) looks the host up again for every new
+    connection, and the system resolver may not cache. Connections to that
+    host reuse the address resolved here instead. TLS still verifies and
+    sends SNI for the original hostname, only the lookup is skipped.
+    """
+    import urllib3.util.connection as urllib3_connection
+
+    url = get_test_video_sources()["url"]
+    host = urlparse(url).hostname if url else None
+    try:
+        ip = socket.gethostbyname(host) if host else None
+    except OSError:
+        ip = None  # Leave lookups alone; test_video_url reports the failure
+
+    if ip is None:
+        yield None
+        return
+
+    create_connection = urllib3_connection.create_connection
+
+    def pinned_create_connection(address, *args, **kwargs):
+        if address[0] == host:
+            address = (ip, address[1])
+        return create_connection(address, *args, **kwargs)
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(urllib3_connection, "create_connection", pinned_create_connection)
+        yield ip
+
+
+@pytest.fixture(scope="session")
+def test_video_url(test_video_host_dns):
+    """TEST_VIDEO_URL, validated once per session.
+
+    Validation fetches the first byte with a ranged GET rather than a HEAD:
+    some CDNs reject HEAD, and a 206 also confirms the server supports the
+    range requests FFmpeg's HTTP demuxer relies on. The body is never read.
+    The probe goes through the SDK's pooled session, so the URL tests' own
+    requests to the same host reuse its connection.
+    """
+    from videobgremover.media._http import http_session
+
+    url = get_test_video_sources()["url"]
+
+    if not url:
+        pytest.skip("Set TEST_VIDEO_URL environment variable to run URL-based tests")
+
+    try:
+        response = http_session().get(
+            url,
+            headers={"Range": "bytes=0-0"},
+            stream=True,
+            timeout=10,
+            allow_redirects=True,
+        )
+        response.close()
+    except Exception as e:
+        pytest.skip(f"Test video URL validation failed: {e}")
+
+    if response.status_code not in (200, 206):
+        pytest.skip(f"Test video URL not accessible: {response.status_code}")
+
+    return url
+
+
+@pytest.fixture
+def mock_client():
+    """API client stand-in for workflow tests that patch remove_background.
+
+    An autospec of VideoBGRemoverClient: it keeps the real client's interface
+    but builds no requests.Session and can never reach the network. A fresh
+    mock per test, so recorded calls and configured return values never leak
+    into the next test.
+    """
+    from unittest.mock import create_autospec
+
+    from videobgremover import VideoBGRemoverClient
+
+    return create_autospec(VideoBGRemoverClient, instance=True)
+
+
+@pytest.fixture(scope="session")
+def media_ctx():
+    """MediaContext built once for unit tests, with the FFmpeg checks mocked.
+
+    The patch only covers construction; tests that exercise methods calling
+    FFmpeg patch subprocess.run themselves.
+    """
+    from unittest.mock import Mock, patch
+
+    from videobgremover.media import MediaContext
+
+    with patch("subprocess.run", return_value=Mock(returncode=0, stderr="")):
+        ctx = MediaContext()
+    yield ctx
+    ctx.cleanup()
+
+
+@pytest.fixture
+def stub_probes(monkeypatch):
+    """Report every background as 1920x1080 @ 30 fps without probing files."""
+    monkeypatch.setattr(
+        "videobgremover.media.backgrounds._probe_image_dimensions",
+        lambda *args, **kwargs: (1920, 1080),
+    )
+    monkeypatch.setattr(
+        "videobgremover.media.backgrounds._probe_video_dimensions",
+        lambda *args, **kwargs: (1920, 1080, 30.0),
+    )
+
+
+@pytest.fixture(scope="session")
+def placeholder_fg():
+    """WebM foreground for a nonexistent path, for tests that only build layers.
+
+    Building it still runs (and fails) an ffprobe, so it is created once.
+    """
+    from videobgremover import Foreground
+
+    return Foreground.from_webm_vp9("/path/to/video.webm")
+
+
+@pytest.fixture(scope="session")
+def image_bg_1080p():
+    """test_assets/background_image.png as a 1920x1080 @ 30 fps background.
+
+    The dimensions are stubbed, so command-building tests don't depend on the
+    asset's actual size (or presence).
+    """
+    from unittest.mock import patch
+
+    from videobgremover import Background
+
+    with patch(
+        "videobgremover.media.backgrounds._probe_image_dimensions",
+        return_value=(1920, 1080),
+    ):
+        return Background.from_image("test_assets/background_image.png", fps=30.0)
+
+
+# Session-scoped test assets: each one is opened/probed once per test run.
+# Backgrounds and foregrounds are immutable, so tests derive variants with
+# .subclip() / .audio(), which reuse the already-probed video info.
+@pytest.fixture(scope="session")
+def green_screen_video():
+    """Green screen source video used as remove_background input."""
+    from videobgremover import Video
+
+    return Video.open("test_assets/default_green_screen.mp4")
+
+
+@pytest.fixture(scope="session")
+def long_background_bg():
+    """Long video background (test_assets/long_background_video.mp4)."""
+    from videobgremover import Background
+
+    return Background.from_video("test_assets/long_background_video.mp4")
+
+
+@pytest.fixture(scope="session")
+def audio_background_bg():
+    """Video background with an audio track (test_assets/audio_background.mp4)."""
+    from videobgremover import Background
+
+    return Background.from_video("test_assets/audio_background.mp4")
+
+
+@pytest.fixture(scope="session")
+def gdrive_background_bg():
+    """Vertical video background (test_assets/background-video-gdrive.mp4)."""
+    from videobgremover import Background
+
+    return Background.from_video("test_assets/background-video-gdrive.mp4")
+
+
+@pytest.fixture(scope="session")
+def ai_actor_fg():
+    """AI actor foreground, using the same video as a dummy mask."""
+    from videobgremover import Foreground
+
+    return Foreground.from_video_and_mask(
+        video_path="test_assets/ai-actor.mp4",
+        mask_path="test_assets/ai-actor.mp4",
+    )
+
+
 # Removed mock_ffmpeg fixture - we shouldn't mock FFmpeg in unit tests
 # FFmpeg command generation is core business logic that must be tested properly
 
@@ -32,6 +32,17 @@ class TestVideoBGRemoverClient:
         client = VideoBGRemoverClient("test_key", base_url="https://custom.api.com/")
         assert client.base_url == "https://custom.api.com"
 
+    def test_default_session_pools_connections(self):
+        """Test the default session reuses keep-alive connections."""
+        with VideoBGRemoverClient("test_key") as client:
+            adapter = client.session.get_adapter("https://api.videobgremover.com")
+            assert adapter._pool_maxsize == 16
+            assert client.session.headers["Connection"] == "keep-alive"
+
+        with patch.object(client.session, "close") as close:
+            client.close()
+        close.assert_called_once()
+
     @responses.activate
     def test_create_job_file_success(self):
         """Test successful file job creation."""
@@ -188,6 +199,164 @@ class TestVideoBGRemoverClient:
             with pytest.raises(TimeoutError):
                 client.wait("job_123", poll_seconds=0.1, timeout=0.2)
 
+    @responses.activate
+    def test_wait_backs_off_and_resets_on_status_change(self):
+        """Test polling grows while unchanged and restarts on a new status."""
+        for state in ["processing", "processing", "processing", "uploaded"]:
+            responses.add(
+                responses.GET,
+                "https://api.videobgremover.com/v1/jobs/job_123/status",
+                json={
+                    "id": "job_123",
+                    "status": state,
+                    "filename": "test.mp4",
+                    "created_at": "2024-01-01T10:00:00Z",
+                },
+                status=200,
+            )
+        responses.add(
+            responses.GET,
+            "https://api.videobgremover.com/v1/jobs/job_123/status",
+            json={
+                "id": "job_123",
+                "status": "completed",
+                "filename": "test.mp4",
+                "created_at": "2024-01-01T10:00:00Z",
+            },
+            status=200,
+        )
+
+        client = VideoBGRemoverClient("test_key")
+
+        with patch("time.sleep") as sleep:
+            client.wait("job_123", poll_seconds=1.0, max_poll_seconds=3.0)
+
+        delays = [call.args[0] for call in sleep.call_args_list]
+        assert delays == pytest.approx([1.0, 1.6, 2.56, 1.0])
+
+    @responses.activate
+    def test_wait_honors_server_hints(self):
+        """Test Retry-After and eta_ms replace the backoff interval."""
+        responses.add(
+            responses.GET,
+            "https://api.videobgremover.com/v1/jobs/job_123/status",
+            json={
+                "id": "job_123",
+                "status": "processing",
+                "filename": "test.mp4",
+                "created_at": "2024-01-01T10:00:00Z",
+            },
+            headers={"Retry-After": "5"},
+            status=200,
+        )
+        responses.add(
+            responses.GET,
+            "https://api.videobgremover.com/v1/jobs/job_123/status",
+            json={
+                "id": "job_123",
+                "status": "processing",
+                "filename": "test.mp4",
+                "created_at": "2024-01-01T10:00:00Z",
+                "eta_ms": 1500,
+            },
+            status=200,
+        )
+        responses.add(
+            responses.GET,
+            "https://api.videobgremover.com/v1/jobs/job_123/status",
+            json={
+                "id": "job_123",
+                "status": "completed",
+                "filename": "test.mp4",
+                "created_at": "2024-01-01T10:00:00Z",
+            },
+            status=200,
+        )
+
+        client = VideoBGRemoverClient("test_key")
+
+        with patch("time.sleep") as sleep:
+            client.wait("job_123", poll_seconds=1.0)
+
+        assert [call.args[0] for call in sleep.call_args_list] == [5.0, 1.5]
+
+    @responses.activate
+    def test_wait_zero_hint_keeps_poll_interval(self):
+        """Test a zero Retry-After / eta_ms hint does not poll in a tight loop."""
+        responses.add(
+            responses.GET,
+            "https://api.videobgremover.com/v1/jobs/job_123/status",
+            json={
+                "id": "job_123",
+                "status": "processing",
+                "filename": "test.mp4",
+                "created_at": "2024-01-01T10:00:00Z",
+            },
+            headers={"Retry-After": "0"},
+            status=200,
+        )
+        responses.add(
+            responses.GET,
+            "https://api.videobgremover.com/v1/jobs/job_123/status",
+            json={
+                "id": "job_123",
+                "status": "processing",
+                "filename": "test.mp4",
+                "created_at": "2024-01-01T10:00:00Z",
+                "eta_ms": 0,
+            },
+            status=200,
+        )
+        responses.add(
+            responses.GET,
+            "https://api.videobgremover.com/v1/jobs/job_123/status",
+            json={
+                "id": "job_123",
+                "status": "completed",
+                "filename": "test.mp4",
+                "created_at": "2024-01-01T10:00:00Z",
+            },
+            status=200,
+        )
+
+        client = VideoBGRemoverClient("test_key")
+
+        with patch("time.sleep") as sleep:
+            client.wait("job_123", poll_seconds=2.0)
+
+        assert [call.args[0] for call in sleep.call_args_list] == [2.0, 2.0]
+
+    @responses.activate
+    def test_wait_long_hint_capped_by_timeout(self):
+        """Test a hint longer than the remaining timeout is cut short."""
+        responses.add(
+            responses.GET,
+            "https://api.videobgremover.com/v1/jobs/job_123/status",
+            json={
+                "id": "job_123",
+                "status": "processing",
+                "filename": "test.mp4",
+                "created_at": "2024-01-01T10:00:00Z",
+            },
+            headers={"Retry-After": "600"},
+            status=200,
+        )
+
+        client = VideoBGRemoverClient("test_key")
+        clock = [1000.0]
+
+        def fake_sleep(seconds):
+            clock[0] += seconds
+
+        with patch("time.monotonic", side_effect=lambda: clock[0]):
+            with patch("time.sleep", side_effect=fake_sleep) as sleep:
+                with pytest.raises(TimeoutError):
+                    client.wait("job_123", timeout=10)
+
+        delays = [call.args[0] for call in sleep.call_args_list]
+        assert delays[0] == pytest.approx(10.0)
+        assert sum(delays) <= 10.0 + 1e-9
+
     @responses.activate
     def test_credits_success(self):
         """Test successful credits check."""
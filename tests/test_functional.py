@@ -23,45 +23,30 @@ URL Testing:
 from pathlib import Path
 from unittest.mock import patch
 import pytest
-import subprocess
-import json
 import tempfile
 import os
-import requests
+import hashlib
+import json
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from videobgremover import (
-    VideoBGRemoverClient,
     Video,
     Background,
     Composition,
     EncoderProfile,
+    Foreground,
     RemoveBGOptions,
     Anchor,
     SizeMode,
     Model,
 )
-
-
-def get_video_duration(file_path: str) -> float:
-    """Get actual video duration using ffprobe."""
-    try:
-        cmd = [
-            "ffprobe",
-            "-v",
-            "quiet",
-            "-print_format",
-            "json",
-            "-show_entries",
-            "format=duration",
-            file_path,
-        ]
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
-        if result.returncode == 0:
-            data = json.loads(result.stdout)
-            duration = data.get("format", {}).get("duration")
-            return float(duration) if duration else 0.0
-        return 0.0
-    except Exception:
-        return 0.0
+from .conftest import (
+    assert_all_present,
+    assert_valid_video,
+    get_video_duration,
+    time_null_render,
+)
 
 
 def export_and_measure_duration(comp: Composition, encoder: EncoderProfile) -> float:
@@ -91,43 +76,442 @@ def export_and_measure_duration_to_output(
     return get_video_duration(str(output_path))
 
 
-@pytest.fixture
-def test_video_url():
-    """Test video URL fixture with validation."""
-    from .conftest import get_test_video_sources
+@lru_cache(maxsize=None)
+def _fg_webm():
+    """Transparent WebM foreground, probed once per module.
 
-    sources = get_test_video_sources()
-    url = sources["url"]
+    Foreground is frozen, so the same instance can back every mocked
+    ``remove_background`` call.
+    """
+    return Foreground.from_webm_vp9("test_assets/transparent_webm_vp9.webm")
 
-    if not url:
-        pytest.skip("Set TEST_VIDEO_URL environment variable to run URL-based tests")
 
-    # Validate URL is accessible (HEAD request only - no download)
-    try:
-        response = requests.head(url, timeout=10, allow_redirects=True)
-        if response.status_code not in (200, 204):
-            pytest.skip(f"Test video URL not accessible: {response.status_code}")
-    except Exception as e:
-        pytest.skip(f"Test video URL validation failed: {e}")
+# Downloaded URL assets survive across sessions (output_root is wiped), keyed
+# by URL and revalidated against the server's ETag / Last-Modified on every
+# use. Override with TEST_URL_CACHE_DIR.
+URL_CACHE_DIR = Path(
+    os.getenv("TEST_URL_CACHE_DIR")
+    or Path(tempfile.gettempdir()) / "videobgremover_test_url_cache"
+)
 
-    return url
+
+@pytest.fixture
+def cached_image_downloads():
+    """Serve ``Background.from_image`` URL downloads from URL_CACHE_DIR.
+
+    Each use sends a conditional request with the cached validators; only a
+    304 Not Modified reuses the cached file, so an image changed upstream is
+    fetched again. Responses without an ETag or Last-Modified are never
+    cached. The library still copies the image to its own
+    ``downloaded_image_`` temp file.
+    """
+    from videobgremover.media import backgrounds
+    from videobgremover.media._http import http_session
+
+    download = backgrounds._download_image_to_temp
+
+    def cached_download(image_url, ctx):
+        key = hashlib.sha256(image_url.encode()).hexdigest()
+        meta_path = URL_CACHE_DIR / f"{key}.json"
+        meta = json.loads(meta_path.read_text()) if meta_path.exists() else {}
+        cached = URL_CACHE_DIR / f"{key}{meta.get('suffix', '')}"
+
+        headers = {}
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+        # Headers only: the body of a changed image is fetched by download()
+        with http_session().get(
+            image_url, headers=headers, stream=True, timeout=30
+        ) as response:
+            validators = {
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+            }
+            unchanged = headers and response.status_code == 304
+
+        if unchanged and cached.is_file():
+            temp_path = ctx.temp_path(suffix=cached.suffix, prefix="downloaded_image_")
+            shutil.copyfile(cached, temp_path)
+            return temp_path
+
+        temp_path = download(image_url, ctx)
+        if not any(validators.values()):
+            return temp_path  # Nothing to revalidate against: don't cache
+
+        # Image first, then its validators, each replaced atomically so
+        # parallel workers never read a half-written entry
+        URL_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        suffix = Path(temp_path).suffix
+        partial = URL_CACHE_DIR / f"{key}{suffix}.{os.getpid()}.tmp"
+        shutil.copyfile(temp_path, partial)
+        os.replace(partial, URL_CACHE_DIR / f"{key}{suffix}")
+        partial = meta_path.with_name(f"{meta_path.name}.{os.getpid()}.tmp")
+        partial.write_text(json.dumps({**validators, "suffix": suffix}))
+        os.replace(partial, meta_path)
+        return temp_path
+
+    with patch.object(backgrounds, "_download_image_to_temp", cached_download):
+        yield URL_CACHE_DIR
+
+
+# Layer positions for the multi-layer timing stress test
+STRESS_ANCHORS = [
+    Anchor.TOP_LEFT,
+    Anchor.TOP_CENTER,
+    Anchor.TOP_RIGHT,
+    Anchor.CENTER_LEFT,
+    Anchor.CENTER_RIGHT,
+    Anchor.BOTTOM_LEFT,
+    Anchor.BOTTOM_CENTER,
+    Anchor.BOTTOM_RIGHT,
+]
+
+
+# SCALE mode variants: (layers, output file name, expected scale expression).
+# Each layer is (name, anchor, dx, dy, size mode, size kwargs, opacity).
+SCALE_VARIANTS = [
+    pytest.param(
+        [
+            (
+                "uniform_scale",
+                Anchor.CENTER,
+                0,
+                0,
+                SizeMode.SCALE,
+                {"scale": 1.5},
+                None,
+            )
+        ],
+        "scale_uniform_150percent.mp4",
+        "scale=iw*1.5:ih*1.5",
+        id="uniform_150",
+    ),
+    pytest.param(
+        [
+            (
+                "nonuniform_scale",
+                Anchor.CENTER,
+                0,
+                0,
+                SizeMode.SCALE,
+                {"width": 2.0, "height": 0.8},
+                None,
+            )
+        ],
+        "scale_nonuniform_200w_80h.mp4",
+        "scale=iw*2.0:ih*0.8",
+        id="nonuniform_200w_80h",
+    ),
+    pytest.param(
+        [
+            (
+                "width_scale",
+                Anchor.CENTER,
+                0,
+                0,
+                SizeMode.SCALE,
+                {"width": 1.2},
+                None,
+            )
+        ],
+        "scale_width_only_120percent.mp4",
+        "scale=iw*1.2:ih*1.2",
+        id="width_only_120",
+    ),
+    pytest.param(
+        [
+            (
+                "height_scale",
+                Anchor.CENTER,
+                0,
+                0,
+                SizeMode.SCALE,
+                {"height": 0.7},
+                None,
+            )
+        ],
+        "scale_height_only_70percent.mp4",
+        None,
+        id="height_only_70",
+    ),
+    pytest.param(
+        [
+            (
+                "small_scale",
+                Anchor.CENTER,
+                0,
+                0,
+                SizeMode.SCALE,
+                {"scale": 0.5},
+                None,
+            )
+        ],
+        "scale_small_50percent.mp4",
+        None,
+        id="small_50",
+    ),
+    pytest.param(
+        [
+            (
+                "large_scale",
+                Anchor.CENTER,
+                0,
+                0,
+                SizeMode.SCALE,
+                {"scale": 2.5},
+                None,
+            )
+        ],
+        "scale_large_250percent.mp4",
+        None,
+        id="large_250",
+    ),
+    pytest.param(
+        [
+            (
+                "scale_tl",
+                Anchor.TOP_LEFT,
+                50,
+                50,
+                SizeMode.SCALE,
+                {"scale": 0.3},
+                0.8,
+            ),
+            (
+                "scale_tr",
+                Anchor.TOP_RIGHT,
+                -50,
+                50,
+                SizeMode.SCALE,
+                {"scale": 0.6},
+                0.8,
+            ),
+            (
+                "scale_bl",
+                Anchor.BOTTOM_LEFT,
+                50,
+                -50,
+                SizeMode.SCALE,
+                {"scale": 1.0},
+                0.8,
+            ),
+            (
+                "scale_br",
+                Anchor.BOTTOM_RIGHT,
+                -50,
+                -50,
+                SizeMode.SCALE,
+                {"scale": 1.5},
+                0.8,
+            ),
+            (
+                "scale_center",
+                Anchor.CENTER,
+                0,
+                0,
+                SizeMode.SCALE,
+                {"width": 0.8, "height": 1.2},
+                0.6,
+            ),
+        ],
+        "scale_multi_layer_showcase.mp4",
+        None,
+        id="multi_layer",
+    ),
+    pytest.param(
+        [
+            (
+                "scale_mode",
+                Anchor.CENTER_LEFT,
+                100,
+                0,
+                SizeMode.SCALE,
+                {"scale": 0.5},
+                0.9,
+            ),
+            (
+                "canvas_percent_mode",
+                Anchor.CENTER_RIGHT,
+                -100,
+                0,
+                SizeMode.CANVAS_PERCENT,
+                {"percent": 25},
+                0.9,
+            ),
+        ],
+        "scale_vs_canvas_percent_comparison.mp4",
+        None,
+        id="scale_vs_canvas_percent",
+    ),
+    pytest.param(
+        [
+            (
+                "tiny_scale",
+                Anchor.TOP_CENTER,
+                0,
+                50,
+                SizeMode.SCALE,
+                {"scale": 0.1},
+                1.0,
+            ),
+            (
+                "huge_scale",
+                Anchor.BOTTOM_CENTER,
+                0,
+                -50,
+                SizeMode.SCALE,
+                {"scale": 4.0},
+                0.7,
+            ),
+        ],
+        "scale_extreme_factors.mp4",
+        None,
+        id="extreme",
+    ),
+    pytest.param(
+        [
+            (
+                "scale_50_bottom_right",
+                Anchor.BOTTOM_RIGHT,
+                -30,
+                -30,
+                SizeMode.SCALE,
+                {"scale": 0.5},
+                None,
+            )
+        ],
+        "scale_50percent_bottom_right.mp4",
+        None,
+        id="50_bottom_right",
+    ),
+    pytest.param(
+        [
+            (
+                "scale_tl_anchor",
+                Anchor.TOP_LEFT,
+                30,
+                30,
+                SizeMode.SCALE,
+                {"scale": 0.8},
+                0.7,
+            ),
+            (
+                "scale_tr_anchor",
+                Anchor.TOP_RIGHT,
+                -30,
+                30,
+                SizeMode.SCALE,
+                {"scale": 0.8},
+                0.7,
+            ),
+            (
+                "scale_bl_anchor",
+                Anchor.BOTTOM_LEFT,
+                30,
+                -30,
+                SizeMode.SCALE,
+                {"scale": 0.8},
+                0.7,
+            ),
+            (
+                "scale_br_anchor",
+                Anchor.BOTTOM_RIGHT,
+                -30,
+                -30,
+                SizeMode.SCALE,
+                {"scale": 0.8},
+                0.7,
+            ),
+        ],
+        "scale_with_anchors.mp4",
+        None,
+        id="anchors",
+    ),
+]
+
+
+# Alpha control formats: (format_key, display name, foreground test asset)
+ALPHA_FORMATS = [
+    ("webm_vp9", "WebM VP9", "test_assets/transparent_webm_vp9.webm"),
+    ("mov_prores", "MOV ProRes", "test_assets/transparent_mov_prores.mov"),
+    ("stacked_video", "Stacked Video", "test_assets/stacked_video_comparison.mp4"),
+    ("pro_bundle", "Pro Bundle", "test_assets/pro_bundle_multiple_formats.zip"),
+]
+
+# Bright magenta background makes transparency differences visible. These
+# tests check alpha handling, not resolution, so a 640x360 canvas (1/9 of the
+# pixels of 1080p to scale, overlay and encode) is plenty.
+ALPHA_TEST_BACKGROUND = Background.from_color("#FF00FF", 640, 360, 30.0)
+
+
+def _alpha_format_foreground(format_key: str, test_asset: str):
+    """Build the Foreground the mocked remove_background returns for a format."""
+    from videobgremover.media.foregrounds import Foreground
+
+    if format_key == "webm_vp9":
+        return _fg_webm()
+    if format_key == "mov_prores":
+        return Foreground.from_mov_prores(test_asset)
+    if format_key == "pro_bundle":
+        return Foreground.from_pro_bundle_zip(test_asset)
+    return Foreground.from_stacked_video(test_asset)
+
+
+@pytest.fixture(scope="module")
+def alpha_foregrounds():
+    """Foregrounds for every alpha control format, keyed by format_key.
+
+    Built once per module and shared by the per-format and showcase tests.
+    Loading is mostly waiting on ffprobe subprocesses, so the formats are
+    probed concurrently.
+    """
+    with ThreadPoolExecutor(max_workers=len(ALPHA_FORMATS)) as executor:
+        futures = {
+            format_key: executor.submit(_alpha_format_foreground, format_key, asset)
+            for format_key, _, asset in ALPHA_FORMATS
+        }
+        return {format_key: future.result() for format_key, future in futures.items()}
+
+
+def _build_scale_composition(foreground, background, layers) -> Composition:
+    """Build a composition from a SCALE_VARIANTS layer spec."""
+    comp = Composition(background)
+    for name, anchor, dx, dy, size_mode, size_kwargs, opacity in layers:
+        handle = comp.add(foreground, name=name).at(anchor, dx=dx, dy=dy)
+        handle.size(size_mode, **size_kwargs)
+        if opacity is not None:
+            handle.opacity(opacity)
+    return comp
 
 
 @pytest.mark.functional
 class TestVideoBGRemoverWorkflow:
     """Test complete VideoBGRemover workflows with all supported formats."""
 
+    @pytest.fixture(autouse=True)
+    def _encoder(self, test_encoder):
+        """Shared by every export in the class; see the test_encoder fixture."""
+        self.ENCODER = test_encoder
+
     @pytest.fixture
-    def output_dir(self):
+    def output_dir(self, output_root):
         """Create output directory for workflow test results."""
-        output_path = Path("test_outputs/workflow_tests")
+        output_path = output_root / "workflow_tests"
         output_path.mkdir(parents=True, exist_ok=True)
         return output_path
 
     @pytest.fixture
-    def mock_client(self):
-        """Create a mock API client that doesn't make real HTTP calls."""
-        return VideoBGRemoverClient("mock_api_key_for_workflow_tests")
+    def mocked_webm_fg(self, mock_client, green_screen_video):
+        """WebM foreground (with audio) returned through the mocked remove_background workflow."""
+        with patch(
+            "videobgremover.media._importer_internal.Importer.remove_background"
+        ) as mock_remove:
+            mock_remove.return_value = _fg_webm()
+            return green_screen_video.remove_background(
+                mock_client, RemoveBGOptions(prefer="webm_vp9")
+            )
 
     def test_model_enum_and_remove_bg_options(self):
         """Test Model enum and RemoveBGOptions with model parameter."""
@@ -186,11 +570,7 @@ class TestVideoBGRemoverWorkflow:
             with patch(
                 "videobgremover.media._importer_internal.Importer.remove_background"
             ) as mock_remove:
-                from videobgremover.media.foregrounds import Foreground
-
-                mock_remove.return_value = Foreground.from_webm_vp9(
-                    "test_assets/transparent_webm_vp9.webm"
-                )
+                mock_remove.return_value = _fg_webm()
 
                 # Execute workflow
                 foreground = video.remove_background(mock_client, options)
@@ -220,15 +600,12 @@ class TestVideoBGRemoverWorkflow:
 
                 # Export with real FFmpeg (verbose to see what's happening)
                 output_path = output_dir / "webm_vp9_image_background.mp4"
-                encoder = EncoderProfile.h264(
-                    crf=20, preset="fast"
-                )  # Use fast preset for quicker testing
+                encoder = self.ENCODER
                 print(f"🔧 Exporting to: {output_path}")
                 comp.to_file(str(output_path), encoder, verbose=True)
 
                 # Verify output
-                assert output_path.exists()
-                assert output_path.stat().st_size > 0
+                assert_valid_video(output_path)
                 print(f"✅ WebM VP9 + Image workflow completed: {output_path}")
 
     def test_webm_vp9_workflow_with_video_background(self, mock_client, output_dir):
@@ -238,11 +615,7 @@ class TestVideoBGRemoverWorkflow:
         with patch(
             "videobgremover.media._importer_internal.Importer.remove_background"
         ) as mock_remove:
-            from videobgremover.media.foregrounds import Foreground
-
-            mock_remove.return_value = Foreground.from_webm_vp9(
-                "test_assets/transparent_webm_vp9.webm"
-            )
+            mock_remove.return_value = _fg_webm()
 
             # Load video
             video = Video.open("test_assets/default_green_screen.mp4")
@@ -268,12 +641,11 @@ class TestVideoBGRemoverWorkflow:
 
             # Export with real FFmpeg
             output_path = output_dir / "webm_vp9_video_background.mp4"
-            encoder = EncoderProfile.h264(crf=18, preset="medium")
+            encoder = self.ENCODER
             comp.to_file(str(output_path), encoder)
 
             # Verify output
-            assert output_path.exists()
-            assert output_path.stat().st_size > 0
+            assert_valid_video(output_path)
             print(f"✅ WebM VP9 + Video workflow completed: {output_path}")
 
     def test_mov_prores_workflow_with_image_background(self, mock_client, output_dir):
@@ -309,12 +681,11 @@ class TestVideoBGRemoverWorkflow:
 
             # Export with real FFmpeg
             output_path = output_dir / "mov_prores_image_background.mp4"
-            encoder = EncoderProfile.h264(crf=20, preset="medium")
+            encoder = self.ENCODER
             comp.to_file(str(output_path), encoder)
 
             # Verify output
-            assert output_path.exists()
-            assert output_path.stat().st_size > 0
+            assert_valid_video(output_path)
             print(f"✅ MOV ProRes + Image workflow completed: {output_path}")
 
     def test_stacked_video_workflow_with_image_background(
@@ -353,12 +724,11 @@ class TestVideoBGRemoverWorkflow:
 
             # Export with real FFmpeg
             output_path = output_dir / "stacked_video_image_background.mp4"
-            encoder = EncoderProfile.h264(crf=20, preset="medium")
+            encoder = self.ENCODER
             comp.to_file(str(output_path), encoder)
 
             # Verify output
-            assert output_path.exists()
-            assert output_path.stat().st_size > 0
+            assert_valid_video(output_path)
             print(f"✅ Stacked Video + Image workflow completed: {output_path}")
 
     def test_pro_bundle_workflow_with_image_background(self, mock_client, output_dir):
@@ -396,12 +766,11 @@ class TestVideoBGRemoverWorkflow:
 
             # Export with real FFmpeg
             output_path = output_dir / "pro_bundle_image_background.mp4"
-            encoder = EncoderProfile.h264(crf=20, preset="medium")
+            encoder = self.ENCODER
             comp.to_file(str(output_path), encoder)
 
             # Verify output
-            assert output_path.exists()
-            assert output_path.stat().st_size > 0
+            assert_valid_video(output_path)
             print(f"✅ Pro Bundle + Image workflow completed: {output_path}")
 
     def test_pro_bundle_workflow_with_video_background(self, mock_client, output_dir):
@@ -439,12 +808,11 @@ class TestVideoBGRemoverWorkflow:
 
             # Export with real FFmpeg
             output_path = output_dir / "pro_bundle_video_background.mp4"
-            encoder = EncoderProfile.h264(crf=20, preset="medium")
+            encoder = self.ENCODER
             comp.to_file(str(output_path), encoder)
 
             # Verify output
-            assert output_path.exists()
-            assert output_path.stat().st_size > 0
+            assert_valid_video(output_path)
             print(f"✅ Pro Bundle + Video workflow completed: {output_path}")
 
     def test_timed_overlays_workflow(self, mock_client, output_dir):
@@ -454,12 +822,8 @@ class TestVideoBGRemoverWorkflow:
         with patch(
             "videobgremover.media._importer_internal.Importer.remove_background"
         ) as mock_remove:
-            from videobgremover.media.foregrounds import Foreground
-
             # Mock remove_background to return WebM foreground
-            mock_remove.return_value = Foreground.from_webm_vp9(
-                "test_assets/transparent_webm_vp9.webm"
-            )
+            mock_remove.return_value = _fg_webm()
 
             # Load video
             video = Video.open("test_assets/default_green_screen.mp4")
@@ -490,12 +854,11 @@ class TestVideoBGRemoverWorkflow:
 
             # Export with real FFmpeg
             output_path = output_dir / "timed_overlays_long_video.mp4"
-            encoder = EncoderProfile.h264(crf=20, preset="medium")
+            encoder = self.ENCODER
             comp.to_file(str(output_path), encoder)
 
             # Verify output
-            assert output_path.exists()
-            assert output_path.stat().st_size > 0
+            assert_valid_video(output_path)
             print(f"✅ Timed overlays workflow completed: {output_path}")
             print("    📍 Overlay 1: 0s @ TOP_LEFT (25%)")
             print("    📍 Overlay 2: 10s @ TOP_RIGHT (25%)")
@@ -544,7 +907,7 @@ class TestVideoBGRemoverWorkflow:
                     from videobgremover.media.foregrounds import Foreground
 
                     if expected_form == "webm_vp9":
-                        mock_remove.return_value = Foreground.from_webm_vp9(test_asset)
+                        mock_remove.return_value = _fg_webm()
                     elif expected_form == "mov_prores":
                         mock_remove.return_value = Foreground.from_mov_prores(
                             test_asset
@@ -589,22 +952,21 @@ class TestVideoBGRemoverWorkflow:
 
                     # Export
                     output_path = output_dir / f"comprehensive_{format_key}.mp4"
-                    encoder = EncoderProfile.h264(crf=23, preset="fast")
+                    encoder = self.ENCODER
                     comp.to_file(str(output_path), encoder)
 
                     # Verify
-                    assert output_path.exists()
-                    assert output_path.stat().st_size > 0
+                    file_size = assert_valid_video(output_path)
 
                     results[format_key] = {
                         "success": True,
                         "output_path": output_path,
-                        "file_size": output_path.stat().st_size,
+                        "file_size": file_size,
                         "format": expected_form,
                     }
 
                     print(
-                        f"    ✅ {format_name}: {expected_form} format, {output_path.stat().st_size} bytes"
+                        f"    ✅ {format_name}: {expected_form} format, {file_size} bytes"
                     )
 
             except Exception as e:
@@ -635,9 +997,7 @@ class TestVideoBGRemoverWorkflow:
             comp = Composition(bg)
 
             # Layer 1: WebM (main content)
-            mock_remove.return_value = Foreground.from_webm_vp9(
-                "test_assets/transparent_webm_vp9.webm"
-            )
+            mock_remove.return_value = _fg_webm()
             video1 = Video.open("test_assets/default_green_screen.mp4")
             fg1 = video1.remove_background(
                 mock_client, RemoveBGOptions(prefer="webm_vp9")
@@ -673,12 +1033,11 @@ class TestVideoBGRemoverWorkflow:
 
             # Export multi-layer composition
             output_path = output_dir / "multi_layer_composition.mp4"
-            encoder = EncoderProfile.h264(crf=20, preset="medium")
+            encoder = self.ENCODER
             comp.to_file(str(output_path), encoder)
 
             # Verify output
-            assert output_path.exists()
-            assert output_path.stat().st_size > 0
+            assert_valid_video(output_path)
             print(f"✅ Multi-layer composition completed: {output_path}")
 
     def test_workflow_error_handling(self, mock_client):
@@ -719,13 +1078,9 @@ class TestVideoBGRemoverWorkflow:
         with patch(
             "videobgremover.media._importer_internal.Importer.remove_background"
         ) as mock_remove:
-            from videobgremover.media.foregrounds import Foreground
-
             # Test 1: Default foreground audio (WebM with Opus)
             print("  Testing default foreground audio...")
-            mock_remove.return_value = Foreground.from_webm_vp9(
-                "test_assets/transparent_webm_vp9.webm"
-            )
+            mock_remove.return_value = _fg_webm()
 
             video = Video.open("test_assets/default_green_screen.mp4")
             foreground = video.remove_background(
@@ -746,7 +1101,7 @@ class TestVideoBGRemoverWorkflow:
 
             # Export and verify audio
             output_path = output_dir / "audio_test_foreground_default.mp4"
-            comp.to_file(str(output_path), EncoderProfile.h264(preset="fast"))
+            comp.to_file(str(output_path), self.ENCODER)
             assert output_path.exists()
 
             # Test 2: Video background with foreground (both have audio - should mix)
@@ -764,7 +1119,7 @@ class TestVideoBGRemoverWorkflow:
             print("    ✅ Video background + foreground audio mixing works")
 
             output_path2 = output_dir / "audio_test_background_video.mp4"
-            comp2.to_file(str(output_path2), EncoderProfile.h264(preset="fast"))
+            comp2.to_file(str(output_path2), self.ENCODER)
             assert output_path2.exists()
 
             # Test 2b: Video background with audio disabled (foreground only)
@@ -786,7 +1141,7 @@ class TestVideoBGRemoverWorkflow:
             print("    ✅ Foreground-only audio works")
 
             output_path2b = output_dir / "audio_test_foreground_only.mp4"
-            comp2b.to_file(str(output_path2b), EncoderProfile.h264(preset="fast"))
+            comp2b.to_file(str(output_path2b), self.ENCODER)
             assert output_path2b.exists()
 
             # Test 3: Multiple layers (should still use foreground audio)
@@ -805,7 +1160,7 @@ class TestVideoBGRemoverWorkflow:
             print("    ✅ Multiple layers with audio works")
 
             output_path3 = output_dir / "audio_test_multiple_layers.mp4"
-            comp3.to_file(str(output_path3), EncoderProfile.h264(preset="fast"))
+            comp3.to_file(str(output_path3), self.ENCODER)
             assert output_path3.exists()
 
             print("✅ Audio handling comprehensive test completed")
@@ -824,9 +1179,7 @@ class TestVideoBGRemoverWorkflow:
             comp = Composition(bg)
 
             # Layer 1: WebM with Opus audio
-            mock_remove.return_value = Foreground.from_webm_vp9(
-                "test_assets/transparent_webm_vp9.webm"
-            )
+            mock_remove.return_value = _fg_webm()
             fg1 = Video.open("test_assets/default_green_screen.mp4").remove_background(
                 mock_client, RemoveBGOptions(prefer="webm_vp9")
             )
@@ -852,7 +1205,7 @@ class TestVideoBGRemoverWorkflow:
             )
 
             output_path = output_dir / "multi_layer_default_audio.mp4"
-            comp.to_file(str(output_path), EncoderProfile.h264(preset="fast"))
+            comp.to_file(str(output_path), self.ENCODER)
             assert output_path.exists()
             print(f"      ✅ Multiple layers with default audio - {output_path}")
 
@@ -865,8 +1218,6 @@ class TestVideoBGRemoverWorkflow:
         with patch(
             "videobgremover.media._importer_internal.Importer.remove_background"
         ) as mock_remove:
-            from videobgremover.media.foregrounds import Foreground
-
             # Get actual durations of test assets dynamically
             bg_video_duration = get_video_duration(
                 "test_assets/long_background_video.mp4"
@@ -880,9 +1231,7 @@ class TestVideoBGRemoverWorkflow:
 
             # Test 1: Video Background Controls Duration (Rule 1)
             print("  Testing Rule 1: Video background controls duration...")
-            mock_remove.return_value = Foreground.from_webm_vp9(
-                "test_assets/transparent_webm_vp9.webm"
-            )
+            mock_remove.return_value = _fg_webm()
 
             video = Video.open("test_assets/default_green_screen.mp4")
             foreground = video.remove_background(
@@ -895,7 +1244,7 @@ class TestVideoBGRemoverWorkflow:
             comp1.add(foreground, name="fg_layer")
 
             # Export and measure actual duration
-            encoder = EncoderProfile.h264(preset="fast")
+            encoder = self.ENCODER
             output_path1 = output_dir / "duration_test_video_background_controls.mp4"
             actual_duration1 = export_and_measure_duration_to_output(
                 comp1, encoder, output_path1
@@ -1014,12 +1363,8 @@ class TestVideoBGRemoverWorkflow:
         with patch(
             "videobgremover.media._importer_internal.Importer.remove_background"
         ) as mock_remove:
-            from videobgremover.media.foregrounds import Foreground
-
             # Mock foreground
-            mock_remove.return_value = Foreground.from_webm_vp9(
-                "test_assets/transparent_webm_vp9.webm"
-            )
+            mock_remove.return_value = _fg_webm()
             video = Video.open("test_assets/default_green_screen.mp4")
             foreground = video.remove_background(
                 mock_client, RemoveBGOptions(prefer="webm_vp9")
@@ -1046,7 +1391,7 @@ class TestVideoBGRemoverWorkflow:
                 (Anchor.CENTER, "center", 0, 0, 30),  # Smaller center to avoid overlap
             ]
 
-            encoder = EncoderProfile.h264(preset="fast")
+            encoder = self.ENCODER
 
             # Test: Key anchors with IMAGE background (dramatic sizing)
             print(
@@ -1068,8 +1413,7 @@ class TestVideoBGRemoverWorkflow:
                 output_path = output_dir / f"anchor_test_dramatic_{name}.mp4"
                 comp.to_file(str(output_path), encoder)
 
-                assert output_path.exists()
-                assert output_path.stat().st_size > 0
+                assert_valid_video(output_path)
                 print(f"      ✅ {name.upper()} ({percent}% size) → {output_path}")
 
             # Test 3: Multi-layer with different anchors (showcase)
@@ -1098,8 +1442,7 @@ class TestVideoBGRemoverWorkflow:
             output_showcase = output_dir / "anchor_test_multi_layer_showcase.mp4"
             comp_showcase.to_file(str(output_showcase), encoder)
 
-            assert output_showcase.exists()
-            assert output_showcase.stat().st_size > 0
+            assert_valid_video(output_showcase)
             print(f"      ✅ Multi-layer showcase → {output_showcase}")
 
             # Test 4: Custom expressions test
@@ -1116,8 +1459,7 @@ class TestVideoBGRemoverWorkflow:
             output_custom = output_dir / "anchor_test_custom_expressions.mp4"
             comp_custom.to_file(str(output_custom), encoder)
 
-            assert output_custom.exists()
-            assert output_custom.stat().st_size > 0
+            assert_valid_video(output_custom)
             print(f"      ✅ Custom expressions (circular motion) → {output_custom}")
 
             print("✅ Anchor positioning comprehensive test completed")
@@ -1135,12 +1477,8 @@ class TestVideoBGRemoverWorkflow:
         with patch(
             "videobgremover.media._importer_internal.Importer.remove_background"
         ) as mock_remove:
-            from videobgremover.media.foregrounds import Foreground
-
             # Mock foreground
-            mock_remove.return_value = Foreground.from_webm_vp9(
-                "test_assets/transparent_webm_vp9.webm"
-            )
+            mock_remove.return_value = _fg_webm()
             video = Video.open("test_assets/default_green_screen.mp4")
             foreground = video.remove_background(
                 mock_client, RemoveBGOptions(prefer="webm_vp9")
@@ -1148,7 +1486,7 @@ class TestVideoBGRemoverWorkflow:
 
             # Use image background for clear visibility
             bg_image = Background.from_image("test_assets/background_image.png")
-            encoder = EncoderProfile.h264(preset="fast")
+            encoder = self.ENCODER
 
             # Test 1: CONTAIN mode
             print(
@@ -1342,19 +1680,23 @@ class TestVideoBGRemoverWorkflow:
             print("    - Multi-layer showcase")
             print("    - Total: 12 size mode validation videos created")
 
-    def test_scale_mode_comprehensive(self, mock_client, output_dir):
-        """Test SCALE mode with all scaling options - MOCK API + REAL FFMPEG."""
-        print("🔍 Testing comprehensive SCALE mode...")
+    @pytest.mark.parametrize("layers,output_name,expected_filter", SCALE_VARIANTS)
+    def test_scale_mode_comprehensive(
+        self, mock_client, layers, output_name, expected_filter
+    ):
+        """Test SCALE mode command generation for each scaling option - MOCK API.
+
+        Each variant is an independent, dry-run-only case so they can be
+        distributed across workers (``pytest -n auto`` with pytest-xdist
+        installed). The encodes run together in test_scale_mode_export.
+        """
+        print(f"🔍 Testing SCALE mode variant → {output_name}")
 
         with patch(
             "videobgremover.media._importer_internal.Importer.remove_background"
         ) as mock_remove:
-            from videobgremover.media.foregrounds import Foreground
-
             # Mock foreground
-            mock_remove.return_value = Foreground.from_webm_vp9(
-                "test_assets/transparent_webm_vp9.webm"
-            )
+            mock_remove.return_value = _fg_webm()
             video = Video.open("test_assets/default_green_screen.mp4")
             foreground = video.remove_background(
                 mock_client, RemoveBGOptions(prefer="webm_vp9")
@@ -1362,218 +1704,41 @@ class TestVideoBGRemoverWorkflow:
 
             # Use image background for clear visibility
             bg_image = Background.from_image("test_assets/background_image.png")
-            encoder = EncoderProfile.h264(preset="fast")
-
-            # Test 1: Uniform scaling with scale parameter
-            print("  Testing uniform scaling (scale=1.5 - 150% of original)...")
-            comp_uniform = Composition(bg_image)
-            comp_uniform.add(foreground, name="uniform_scale").at(Anchor.CENTER).size(
-                SizeMode.SCALE, scale=1.5
-            )
-
-            output_uniform = output_dir / "scale_uniform_150percent.mp4"
-            comp_uniform.to_file(str(output_uniform), encoder)
-            assert output_uniform.exists()
-            print(f"    ✅ Uniform scale (150%) → {output_uniform}")
-
-            # Test 2: Non-uniform scaling with separate width/height
-            print("  Testing non-uniform scaling (200% width, 80% height)...")
-            comp_nonuniform = Composition(bg_image)
-            comp_nonuniform.add(foreground, name="nonuniform_scale").at(
-                Anchor.CENTER
-            ).size(SizeMode.SCALE, width=2.0, height=0.8)
-
-            output_nonuniform = output_dir / "scale_nonuniform_200w_80h.mp4"
-            comp_nonuniform.to_file(str(output_nonuniform), encoder)
-            assert output_nonuniform.exists()
-            print(f"    ✅ Non-uniform scale (200%w × 80%h) → {output_nonuniform}")
-
-            # Test 3: Width-only scaling (maintains aspect ratio)
-            print("  Testing width-only scaling (120% width, aspect maintained)...")
-            comp_width_only = Composition(bg_image)
-            comp_width_only.add(foreground, name="width_scale").at(Anchor.CENTER).size(
-                SizeMode.SCALE, width=1.2
-            )
-
-            output_width_only = output_dir / "scale_width_only_120percent.mp4"
-            comp_width_only.to_file(str(output_width_only), encoder)
-            assert output_width_only.exists()
-            print(
-                f"    ✅ Width-only scale (120%w, aspect maintained) → {output_width_only}"
-            )
-
-            # Test 4: Height-only scaling (maintains aspect ratio)
-            print("  Testing height-only scaling (70% height, aspect maintained)...")
-            comp_height_only = Composition(bg_image)
-            comp_height_only.add(foreground, name="height_scale").at(
-                Anchor.CENTER
-            ).size(SizeMode.SCALE, height=0.7)
-
-            output_height_only = output_dir / "scale_height_only_70percent.mp4"
-            comp_height_only.to_file(str(output_height_only), encoder)
-            assert output_height_only.exists()
-            print(
-                f"    ✅ Height-only scale (70%h, aspect maintained) → {output_height_only}"
-            )
-
-            # Test 5: Small scale factor (50% - half size)
-            print("  Testing small scale factor (50% - half original size)...")
-            comp_small = Composition(bg_image)
-            comp_small.add(foreground, name="small_scale").at(Anchor.CENTER).size(
-                SizeMode.SCALE, scale=0.5
-            )
-
-            output_small = output_dir / "scale_small_50percent.mp4"
-            comp_small.to_file(str(output_small), encoder)
-            assert output_small.exists()
-            print(f"    ✅ Small scale (50%) → {output_small}")
-
-            # Test 6: Large scale factor (250% - 2.5x original size)
-            print("  Testing large scale factor (250% - 2.5x original size)...")
-            comp_large = Composition(bg_image)
-            comp_large.add(foreground, name="large_scale").at(Anchor.CENTER).size(
-                SizeMode.SCALE, scale=2.5
-            )
-
-            output_large = output_dir / "scale_large_250percent.mp4"
-            comp_large.to_file(str(output_large), encoder)
-            assert output_large.exists()
-            print(f"    ✅ Large scale (250%) → {output_large}")
-
-            # Test 7: Multi-layer with different scale factors
-            print("  Testing multi-layer with different scale factors...")
-            comp_multi = Composition(bg_image)
-
-            # Different scale factors in different positions
-            comp_multi.add(foreground, name="scale_tl").at(
-                Anchor.TOP_LEFT, dx=50, dy=50
-            ).size(SizeMode.SCALE, scale=0.3).opacity(0.8)
-            comp_multi.add(foreground, name="scale_tr").at(
-                Anchor.TOP_RIGHT, dx=-50, dy=50
-            ).size(SizeMode.SCALE, scale=0.6).opacity(0.8)
-            comp_multi.add(foreground, name="scale_bl").at(
-                Anchor.BOTTOM_LEFT, dx=50, dy=-50
-            ).size(SizeMode.SCALE, scale=1.0).opacity(0.8)  # Original size
-            comp_multi.add(foreground, name="scale_br").at(
-                Anchor.BOTTOM_RIGHT, dx=-50, dy=-50
-            ).size(SizeMode.SCALE, scale=1.5).opacity(0.8)
-            comp_multi.add(foreground, name="scale_center").at(Anchor.CENTER).size(
-                SizeMode.SCALE, width=0.8, height=1.2
-            ).opacity(0.6)  # Stretched
-
-            output_multi = output_dir / "scale_multi_layer_showcase.mp4"
-            comp_multi.to_file(str(output_multi), encoder)
-            assert output_multi.exists()
-            print(f"    ✅ Multi-layer scale showcase → {output_multi}")
-
-            # Test 8: SCALE vs CANVAS_PERCENT comparison
-            print("  Testing SCALE vs CANVAS_PERCENT comparison...")
-            comp_comparison = Composition(bg_image)
-
-            # Left side: SCALE mode (50% of original video size)
-            comp_comparison.add(foreground, name="scale_mode").at(
-                Anchor.CENTER_LEFT, dx=100
-            ).size(SizeMode.SCALE, scale=0.5).opacity(0.9)
-
-            # Right side: CANVAS_PERCENT mode (25% of canvas size)
-            comp_comparison.add(foreground, name="canvas_percent_mode").at(
-                Anchor.CENTER_RIGHT, dx=-100
-            ).size(SizeMode.CANVAS_PERCENT, percent=25).opacity(0.9)
-
-            output_comparison = output_dir / "scale_vs_canvas_percent_comparison.mp4"
-            comp_comparison.to_file(str(output_comparison), encoder)
-            assert output_comparison.exists()
-            print(f"    ✅ SCALE vs CANVAS_PERCENT comparison → {output_comparison}")
-
-            # Test 9: Extreme scaling (very small and very large)
-            print("  Testing extreme scaling factors...")
-            comp_extreme = Composition(bg_image)
-
-            # Very small (10% - tiny)
-            comp_extreme.add(foreground, name="tiny_scale").at(
-                Anchor.TOP_CENTER, dy=50
-            ).size(SizeMode.SCALE, scale=0.1).opacity(1.0)
-
-            # Very large (400% - huge, will likely be cropped)
-            comp_extreme.add(foreground, name="huge_scale").at(
-                Anchor.BOTTOM_CENTER, dy=-50
-            ).size(SizeMode.SCALE, scale=4.0).opacity(0.7)
-
-            output_extreme = output_dir / "scale_extreme_factors.mp4"
-            comp_extreme.to_file(str(output_extreme), encoder)
-            assert output_extreme.exists()
-            print(f"    ✅ Extreme scaling (10% and 400%) → {output_extreme}")
-
-            # Test 9b: 50% scale at bottom right (specific user request)
-            print("  Testing 50% scale positioned at bottom right...")
-            comp_50_bottom_right = Composition(bg_image)
-            comp_50_bottom_right.add(foreground, name="scale_50_bottom_right").at(
-                Anchor.BOTTOM_RIGHT, dx=-30, dy=-30
-            ).size(SizeMode.SCALE, scale=0.5)
-
-            output_50_bottom_right = output_dir / "scale_50percent_bottom_right.mp4"
-            comp_50_bottom_right.to_file(str(output_50_bottom_right), encoder)
-            assert output_50_bottom_right.exists()
-            print(f"    ✅ 50% scale at bottom right → {output_50_bottom_right}")
+            comp = _build_scale_composition(foreground, bg_image, layers)
 
-            # Test 10: SCALE with different anchors
-            print("  Testing SCALE with different anchor positions...")
-            comp_anchors = Composition(bg_image)
-
-            # Same scale factor (80%) but different anchors
-            comp_anchors.add(foreground, name="scale_tl_anchor").at(
-                Anchor.TOP_LEFT, dx=30, dy=30
-            ).size(SizeMode.SCALE, scale=0.8).opacity(0.7)
-            comp_anchors.add(foreground, name="scale_tr_anchor").at(
-                Anchor.TOP_RIGHT, dx=-30, dy=30
-            ).size(SizeMode.SCALE, scale=0.8).opacity(0.7)
-            comp_anchors.add(foreground, name="scale_bl_anchor").at(
-                Anchor.BOTTOM_LEFT, dx=30, dy=-30
-            ).size(SizeMode.SCALE, scale=0.8).opacity(0.7)
-            comp_anchors.add(foreground, name="scale_br_anchor").at(
-                Anchor.BOTTOM_RIGHT, dx=-30, dy=-30
-            ).size(SizeMode.SCALE, scale=0.8).opacity(0.7)
-
-            output_anchors = output_dir / "scale_with_anchors.mp4"
-            comp_anchors.to_file(str(output_anchors), encoder)
-            assert output_anchors.exists()
-            print(f"    ✅ SCALE with anchors (80% in all corners) → {output_anchors}")
-
-            # Verify FFmpeg commands use correct scale expressions
-            print("  Verifying FFmpeg scale expressions...")
+            cmd = comp.dry_run()
+            assert cmd.count("overlay=") == len(layers)
 
-            # Check uniform scaling
-            cmd_uniform = comp_uniform.dry_run()
-            assert "scale=iw*1.5:ih*1.5" in cmd_uniform, (
-                "Should use iw*1.5:ih*1.5 for uniform scaling"
-            )
+            # Verify FFmpeg command uses the correct scale expression
+            if expected_filter is not None:
+                assert expected_filter in cmd, (
+                    f"Should use {expected_filter} for this scaling variant"
+                )
+                print(f"    ✅ FFmpeg scale expression verified: {expected_filter}")
 
-            # Check non-uniform scaling
-            cmd_nonuniform = comp_nonuniform.dry_run()
-            assert "scale=iw*2.0:ih*0.8" in cmd_nonuniform, (
-                "Should use iw*2.0:ih*0.8 for non-uniform scaling"
-            )
+    def test_scale_mode_export(self, mock_client, output_dir):
+        """Export every SCALE mode variant in a single FFmpeg run - MOCK API + REAL FFMPEG."""
+        print("🔍 Exporting all SCALE mode variants...")
 
-            # Check width-only scaling
-            cmd_width = comp_width_only.dry_run()
-            assert "scale=iw*1.2:ih*1.2" in cmd_width, (
-                "Should use iw*1.2:ih*1.2 for width-only scaling (maintains aspect)"
+        with patch(
+            "videobgremover.media._importer_internal.Importer.remove_background"
+        ) as mock_remove:
+            mock_remove.return_value = _fg_webm()
+            video = Video.open("test_assets/default_green_screen.mp4")
+            foreground = video.remove_background(
+                mock_client, RemoveBGOptions(prefer="webm_vp9")
             )
 
-            print("    ✅ FFmpeg scale expressions verified")
+            bg_image = Background.from_image("test_assets/background_image.png")
+            encoder = self.ENCODER
 
-            print("✅ SCALE mode comprehensive test completed")
-            print("  📊 Summary:")
-            print("    - Uniform scaling: 50%, 150%, 250%")
-            print("    - Non-uniform scaling: 200%w × 80%h")
-            print("    - Aspect-maintained: width-only (120%), height-only (70%)")
-            print("    - Multi-layer showcase: 5 different scales")
-            print("    - SCALE vs CANVAS_PERCENT comparison")
-            print("    - Extreme scaling: 10% and 400%")
-            print("    - 50% scale at bottom right (with margin)")
-            print("    - SCALE with anchors: 80% in all corners")
-            print("    - FFmpeg expression verification")
-            print("    - Total: 11 SCALE mode validation videos created")
+            for variant in SCALE_VARIANTS:
+                layers, output_name, _ = variant.values
+                comp = _build_scale_composition(foreground, bg_image, layers)
+                output_path = output_dir / output_name
+                comp.to_file(str(output_path), encoder)
+                assert_valid_video(output_path)
+            print(f"    ✅ {len(SCALE_VARIANTS)} SCALE mode videos → {output_dir}")
 
     def test_comprehensive_timing_system(self, mock_client, output_dir):
         """Test the complete timing system with all combinations - MOCK API + REAL FFMPEG."""
@@ -1582,8 +1747,6 @@ class TestVideoBGRemoverWorkflow:
         with patch(
             "videobgremover.media._importer_internal.Importer.remove_background"
         ) as mock_remove:
-            from videobgremover.media.foregrounds import Foreground
-
             # Test 1: Background subclip
             print("  Testing background subclip...")
             bg_original = Background.from_video("test_assets/long_background_video.mp4")
@@ -1598,9 +1761,7 @@ class TestVideoBGRemoverWorkflow:
 
             # Test 2: Foreground subclip
             print("  Testing foreground subclip...")
-            mock_remove.return_value = Foreground.from_webm_vp9(
-                "test_assets/transparent_webm_vp9.webm"
-            )
+            mock_remove.return_value = _fg_webm()
 
             video = Video.open("test_assets/default_green_screen.mp4")
             fg_original = video.remove_background(
@@ -1624,18 +1785,19 @@ class TestVideoBGRemoverWorkflow:
 
             # Verify FFmpeg command includes trimming
             cmd = comp.dry_run()
-            assert "-ss 5" in cmd, "Background should be trimmed from 5s"
-            assert "-t 10" in cmd, "Background should have 10s duration (15-5)"
-            assert "-ss 2" in cmd, "Foreground should be trimmed from 2s"
-            assert "-t 4" in cmd, "Foreground should have 4s duration (6-2)"
+            # Background trimmed 5-15s (10s), foreground trimmed 2-6s (4s)
+            assert_all_present(
+                cmd,
+                ["-ss 5", "-t 10", "-ss 2", "-t 4"],
+                "Background and foreground should be trimmed",
+            )
 
             # Export and verify
             output_path = output_dir / "timing_comprehensive_source_trimming.mp4"
-            encoder = EncoderProfile.h264(preset="fast")
+            encoder = self.ENCODER
             comp.to_file(str(output_path), encoder)
 
-            assert output_path.exists()
-            assert output_path.stat().st_size > 0
+            assert_valid_video(output_path)
             print(f"    ✅ Source trimming test → {output_path}")
 
     def test_composition_timing_comprehensive(self, mock_client, output_dir):
@@ -1645,12 +1807,8 @@ class TestVideoBGRemoverWorkflow:
         with patch(
             "videobgremover.media._importer_internal.Importer.remove_background"
         ) as mock_remove:
-            from videobgremover.media.foregrounds import Foreground
-
             # Setup
-            mock_remove.return_value = Foreground.from_webm_vp9(
-                "test_assets/transparent_webm_vp9.webm"
-            )
+            mock_remove.return_value = _fg_webm()
             bg = Background.from_video("test_assets/long_background_video.mp4")
             comp = Composition(bg)
 
@@ -1690,11 +1848,10 @@ class TestVideoBGRemoverWorkflow:
 
             # Export complex timing composition
             output_path = output_dir / "timing_comprehensive_composition.mp4"
-            encoder = EncoderProfile.h264(preset="fast")
+            encoder = self.ENCODER
             comp.to_file(str(output_path), encoder)
 
-            assert output_path.exists()
-            assert output_path.stat().st_size > 0
+            assert_valid_video(output_path)
             print(f"    ✅ Composition timing test → {output_path}")
 
     def test_combined_source_and_composition_timing(self, mock_client, output_dir):
@@ -1704,16 +1861,12 @@ class TestVideoBGRemoverWorkflow:
         with patch(
             "videobgremover.media._importer_internal.Importer.remove_background"
         ) as mock_remove:
-            from videobgremover.media.foregrounds import Foreground
-
             # Complex scenario: trim sources, then compose with timing
             bg = Background.from_video("test_assets/long_background_video.mp4").subclip(
                 10, 30
             )  # 20s background
 
-            mock_remove.return_value = Foreground.from_webm_vp9(
-                "test_assets/transparent_webm_vp9.webm"
-            )
+            mock_remove.return_value = _fg_webm()
             video = Video.open("test_assets/default_green_screen.mp4")
 
             # Trim foreground sources
@@ -1735,120 +1888,161 @@ class TestVideoBGRemoverWorkflow:
 
             # Verify FFmpeg command
             cmd = comp.dry_run()
-            # Background trimming
-            assert "-ss 10" in cmd and "-t 20" in cmd, (
-                "Background should be trimmed 10-30s"
+            # Background trimmed 10-30s, fg1 trimmed 1-4s, fg2 trimmed 0-2s
+            assert_all_present(
+                cmd,
+                ["-ss 10", "-t 20", "-ss 1", "-t 3", "-ss 0", "-t 2"],
+                "Background and foregrounds should be trimmed",
             )
-            # Foreground trimming
-            assert "-ss 1" in cmd and "-t 3" in cmd, "fg1 should be trimmed 1-4s"
-            assert "-ss 0" in cmd and "-t 2" in cmd, "fg2 should be trimmed 0-2s"
             # Composition timing (input-level)
 
             # Export
             output_path = output_dir / "timing_combined_source_composition.mp4"
-            encoder = EncoderProfile.h264(preset="fast")
+            encoder = self.ENCODER
             comp.to_file(str(output_path), encoder)
 
-            assert output_path.exists()
-            assert output_path.stat().st_size > 0
+            assert_valid_video(output_path)
             print(f"    ✅ Combined timing test → {output_path}")
 
-    def test_timing_edge_cases(self, mock_client, output_dir):
-        """Test timing edge cases and error conditions - MOCK API + REAL FFMPEG."""
-        print("⚠️ Testing timing edge cases...")
+    def test_timing_edge_zero_start_with_duration(self, mocked_webm_fg):
+        """Test zero start time with duration (dry run only)."""
+        bg = Background.from_color("#FF0000", 1920, 1080, 30.0)
+        comp = Composition(bg)
+        comp.add(mocked_webm_fg).start(0).duration(5)
+
+        cmd = comp.dry_run()
+        # start(0) with duration(5) should work and have duration control
+        # Note: The timing system may use setpts in filter graph or input-level timing
+        assert "ffmpeg" in cmd, "Should generate valid FFmpeg command"
+        # Check that duration is controlled (either by -t flag or in the timing system)
+        has_duration_control = "-t " in cmd or "duration" in cmd or "setpts" in cmd
+        assert has_duration_control, "Should have some form of duration control"
+
+    def test_timing_edge_open_ended_subclip(self, mocked_webm_fg):
+        """Test foreground subclip with end=None, until end of video (dry run only)."""
+        bg = Background.from_color("#FF0000", 1920, 1080, 30.0)
+        comp = Composition(bg)
+        comp.add(mocked_webm_fg.subclip(2, None))  # From 2s to end
+
+        cmd = comp.dry_run()
+        assert "-ss 2" in cmd, "Should start from 2s"
+        assert "-t " not in cmd or cmd.count("-t") == 1, (
+            "Should not limit duration for open-ended subclip"
+        )
 
-        with patch(
-            "videobgremover.media._importer_internal.Importer.remove_background"
-        ) as mock_remove:
-            from videobgremover.media.foregrounds import Foreground
+    def test_timing_edge_background_open_ended_subclip(self, mocked_webm_fg):
+        """Test background subclip with end=None (dry run only)."""
+        bg_open = Background.from_video(
+            "test_assets/long_background_video.mp4"
+        ).subclip(5, None)
+        comp = Composition(bg_open)
+        comp.add(mocked_webm_fg)
 
-            mock_remove.return_value = Foreground.from_webm_vp9(
-                "test_assets/transparent_webm_vp9.webm"
-            )
-            video = Video.open("test_assets/default_green_screen.mp4")
-            fg = video.remove_background(
-                mock_client, RemoveBGOptions(prefer="webm_vp9")
-            )
+        cmd = comp.dry_run()
+        assert "-ss 5" in cmd, "Background should start from 5s"
 
-            # Test 1: Zero start time with duration (should work)
-            print("  Testing zero start time with duration...")
-            bg = Background.from_color("#FF0000", 1920, 1080, 30.0)
-            comp1 = Composition(bg)
-            comp1.add(fg).start(0).duration(5)
+    def test_timing_edge_retrimming(self, mocked_webm_fg):
+        """Test multiple subclips (re-trimming) keep the latest trim values."""
+        fg_double_trim = mocked_webm_fg.subclip(1, 10).subclip(
+            2, 5
+        )  # First 1-10s, then 2-5s of that = 3-6s of original
 
-            cmd1 = comp1.dry_run()
-            # start(0) with duration(5) should work and have duration control
-            # Note: The timing system may use setpts in filter graph or input-level timing
-            assert "ffmpeg" in cmd1, "Should generate valid FFmpeg command"
-            # Check that duration is controlled (either by -t flag or in the timing system)
-            has_duration_control = (
-                "-t " in cmd1 or "duration" in cmd1 or "setpts" in cmd1
-            )
-            assert has_duration_control, "Should have some form of duration control"
+        # Should use the final trim values
+        assert fg_double_trim.source_trim == (2, 5), "Should use latest subclip values"
 
-            # Test 2: Subclip with end=None (until end of video)
-            print("  Testing subclip with end=None...")
-            fg_open_end = fg.subclip(2, None)  # From 2s to end
-            comp2 = Composition(bg)
-            comp2.add(fg_open_end)
+    def test_timing_edge_cases(self, mocked_webm_fg, output_dir):
+        """Test overlapping layers with different timing - MOCK API + REAL FFMPEG.
 
-            cmd2 = comp2.dry_run()
-            assert "-ss 2" in cmd2, "Should start from 2s"
-            assert "-t " not in cmd2 or cmd2.count("-t") == 1, (
-                "Should not limit duration for open-ended subclip"
-            )
+        The remaining timing edge cases only inspect the generated command and
+        live in the dry-run-only test_timing_edge_* tests.
+        """
+        print("⚠️ Testing timing edge cases (overlapping layers)...")
+        fg = mocked_webm_fg
 
-            # Test 3: Background subclip with end=None
-            print("  Testing background subclip with end=None...")
-            bg_open = Background.from_video(
-                "test_assets/long_background_video.mp4"
-            ).subclip(5, None)
-            comp3 = Composition(bg_open)
-            comp3.add(fg)
+        bg = Background.from_color("#FF0000", 1920, 1080, 30.0)
+        comp = Composition(bg)
+        comp.add(fg, name="layer1").start(2).end(8).at(
+            Anchor.TOP_LEFT, dx=50, dy=50
+        ).size(SizeMode.CANVAS_PERCENT, percent=25)
+        comp.add(fg, name="layer2").start(5).end(10).at(
+            Anchor.TOP_RIGHT, dx=-50, dy=50
+        ).size(SizeMode.CANVAS_PERCENT, percent=25)
+        comp.add(fg, name="layer3").start(7).duration(3).at(
+            Anchor.BOTTOM_CENTER, dy=-50
+        ).size(SizeMode.CANVAS_PERCENT, percent=25)
+
+        # Export overlapping test
+        output_path = output_dir / "timing_edge_cases_overlapping.mp4"
+        encoder = self.ENCODER
+        comp.to_file(str(output_path), encoder)
+
+        assert output_path.exists()
+        print(f"    ✅ Edge cases test → {output_path}")
+
+    @pytest.mark.parametrize(
+        "format_key,test_asset,expected_form",
+        [
+            ("webm_vp9", "test_assets/transparent_webm_vp9.webm", "webm_vp9"),
+            (
+                "stacked_video",
+                "test_assets/stacked_video_comparison.mp4",
+                "stacked_video",
+            ),
+            (
+                "pro_bundle",
+                "test_assets/pro_bundle_multiple_formats.zip",
+                "pro_bundle",
+            ),
+        ],
+    )
+    def test_timing_per_format(
+        self, mock_client, output_dir, format_key, test_asset, expected_form
+    ):
+        """Test source + composition timing for a single foreground format - MOCK API + REAL FFMPEG."""
+        print(f"🎬 Testing timing with {format_key}...")
 
-            cmd3 = comp3.dry_run()
-            assert "-ss 5" in cmd3, "Background should start from 5s"
+        with patch(
+            "videobgremover.media._importer_internal.Importer.remove_background"
+        ) as mock_remove:
+            from videobgremover.media.foregrounds import Foreground
 
-            # Test 4: Multiple subclips (re-trimming)
-            print("  Testing multiple subclips (re-trimming)...")
-            fg_double_trim = fg.subclip(1, 10).subclip(
-                2, 5
-            )  # First 1-10s, then 2-5s of that = 3-6s of original
-            comp4 = Composition(bg)
-            comp4.add(fg_double_trim)
+            if expected_form == "webm_vp9":
+                mock_remove.return_value = _fg_webm()
+            elif expected_form == "pro_bundle":
+                mock_remove.return_value = Foreground.from_pro_bundle_zip(test_asset)
+            else:  # stacked_video
+                mock_remove.return_value = Foreground.from_stacked_video(test_asset)
 
-            # Should use the final trim values
-            assert fg_double_trim.source_trim == (2, 5), (
-                "Should use latest subclip values"
+            video = Video.open("test_assets/default_green_screen.mp4")
+            fg = video.remove_background(
+                mock_client, RemoveBGOptions(prefer=format_key)
             )
 
-            # Test 5: Overlapping layers with different timing
-            print("  Testing overlapping layers...")
-            comp5 = Composition(bg)
-            comp5.add(fg, name="layer1").start(2).end(8).at(
-                Anchor.TOP_LEFT, dx=50, dy=50
-            ).size(SizeMode.CANVAS_PERCENT, percent=25)
-            comp5.add(fg, name="layer2").start(5).end(10).at(
-                Anchor.TOP_RIGHT, dx=-50, dy=50
-            ).size(SizeMode.CANVAS_PERCENT, percent=25)
-            comp5.add(fg, name="layer3").start(7).duration(3).at(
-                Anchor.BOTTOM_CENTER, dy=-50
-            ).size(SizeMode.CANVAS_PERCENT, percent=25)
+            bg = Background.from_video("test_assets/long_background_video.mp4").subclip(
+                0, 10
+            )
+            comp = Composition(bg)
 
-            # cmd5 = comp5.dry_run()  # Not needed for this test
-            # Timing now handled by setpts in filter graph, not input-level itsoffset
-            # Just verify command generates successfully
+            # Apply both source and composition timing
+            fg_trimmed = fg.subclip(1, 4)  # 3s of source
+            comp.add(fg_trimmed, name=f"{format_key}_timed").start(2).duration(3).at(
+                Anchor.CENTER
+            ).opacity(0.8)
 
-            # Export overlapping test
-            output_path = output_dir / "timing_edge_cases_overlapping.mp4"
-            encoder = EncoderProfile.h264(preset="fast")
-            comp5.to_file(str(output_path), encoder)
+            output_path = output_dir / f"timing_format_{format_key}.mp4"
+            encoder = self.ENCODER
+            comp.to_file(str(output_path), encoder)
 
-            assert output_path.exists()
-            print(f"    ✅ Edge cases test → {output_path}")
+            assert_valid_video(output_path)
+            print(f"    ✅ {format_key} timing test → {output_path}")
 
+    @pytest.mark.slow
     def test_timing_with_different_formats(self, mock_client, output_dir):
-        """Test timing with different foreground formats - MOCK API + REAL FFMPEG."""
+        """Test timing with different foreground formats - MOCK API + REAL FFMPEG.
+
+        Combined multi-format export; per-format coverage lives in
+        test_timing_per_format. Deselect with ``-m "not slow"``.
+        """
         print("🎬 Testing timing with different formats...")
 
         with patch(
@@ -1882,7 +2076,7 @@ class TestVideoBGRemoverWorkflow:
                 print(f"  Testing timing with {format_key}...")
 
                 if expected_form == "webm_vp9":
-                    mock_remove.return_value = Foreground.from_webm_vp9(test_asset)
+                    mock_remove.return_value = _fg_webm()
                 elif expected_form == "pro_bundle":
                     mock_remove.return_value = Foreground.from_pro_bundle_zip(
                         test_asset
@@ -1907,75 +2101,62 @@ class TestVideoBGRemoverWorkflow:
 
             # Export multi-format timing test
             output_path = output_dir / "timing_multi_format.mp4"
-            encoder = EncoderProfile.h264(preset="fast")
+            encoder = self.ENCODER
             comp.to_file(str(output_path), encoder)
 
-            assert output_path.exists()
-            assert output_path.stat().st_size > 0
+            assert_valid_video(output_path)
             print(f"    ✅ Multi-format timing test → {output_path}")
 
-    def test_timing_performance_stress(self, mock_client, output_dir):
+    def test_timing_performance_stress(
+        self, mock_client, output_dir, green_screen_video, long_background_bg
+    ):
         """Test timing system with many layers (performance/stress test) - MOCK API + REAL FFMPEG."""
         print("🚀 Testing timing performance with many layers...")
 
         with patch(
             "videobgremover.media._importer_internal.Importer.remove_background"
         ) as mock_remove:
-            from videobgremover.media.foregrounds import Foreground
+            mock_remove.return_value = _fg_webm()
 
-            mock_remove.return_value = Foreground.from_webm_vp9(
-                "test_assets/transparent_webm_vp9.webm"
-            )
+            bg = long_background_bg.subclip(0, 30)
+            comp = Composition(bg)
 
-            bg = Background.from_video("test_assets/long_background_video.mp4").subclip(
-                0, 30
+            # Foregrounds are immutable, so one processed result feeds every layer
+            fg = green_screen_video.remove_background(
+                mock_client, RemoveBGOptions(prefer="webm_vp9")
             )
-            comp = Composition(bg)
 
             # Add many layers with different timing
-            num_layers = 8  # Reasonable number for testing
-            anchors = [
-                Anchor.TOP_LEFT,
-                Anchor.TOP_CENTER,
-                Anchor.TOP_RIGHT,
-                Anchor.CENTER_LEFT,
-                Anchor.CENTER_RIGHT,
-                Anchor.BOTTOM_LEFT,
-                Anchor.BOTTOM_CENTER,
-                Anchor.BOTTOM_RIGHT,
-            ]
+            num_layers = len(STRESS_ANCHORS)
+            duration = 4  # Each layer visible for 4 seconds
 
-            for i in range(num_layers):
-                video = Video.open("test_assets/default_green_screen.mp4")
-                fg = video.remove_background(
-                    mock_client, RemoveBGOptions(prefer="webm_vp9")
-                )
+            # Apply source trimming too
+            fg_trimmed = fg.subclip(0, duration)
 
+            for i in range(num_layers):
                 # Stagger timing and positions
                 start_time = i * 2  # Start every 2 seconds
-                duration = 4  # Each layer visible for 4 seconds
-
-                # Apply source trimming too
-                fg_trimmed = fg.subclip(0, duration)
 
                 comp.add(fg_trimmed, name=f"stress_layer_{i}").start(
                     start_time
-                ).duration(duration).at(anchors[i]).size(
+                ).duration(duration).at(STRESS_ANCHORS[i]).size(
                     SizeMode.CANVAS_PERCENT, percent=15
                 ).opacity(0.6)
 
             # Verify command generation doesn't break
             cmd = comp.dry_run()
             assert "ffmpeg" in cmd, "Should generate valid FFmpeg command"
+            assert (
+                cmd.count("-i test_assets/transparent_webm_vp9.webm") == num_layers
+            ), "Staggered layers should keep their own inputs"
             # Timing now handled by setpts in filter graph, not input-level itsoffset
 
             # Export stress test
             output_path = output_dir / "timing_stress_test.mp4"
-            encoder = EncoderProfile.h264(preset="fast")
+            encoder = self.ENCODER
             comp.to_file(str(output_path), encoder)
 
-            assert output_path.exists()
-            assert output_path.stat().st_size > 0
+            assert_valid_video(output_path)
             print(f"    ✅ Stress test ({num_layers} layers) → {output_path}")
 
     def test_timing_audio_interaction(self, mock_client, output_dir):
@@ -1985,17 +2166,13 @@ class TestVideoBGRemoverWorkflow:
         with patch(
             "videobgremover.media._importer_internal.Importer.remove_background"
         ) as mock_remove:
-            from videobgremover.media.foregrounds import Foreground
-
             # Test 1: Background audio with background trimming
             print("  Testing background audio with trimming...")
             bg_trimmed = Background.from_video(
                 "test_assets/red_background.mp4"
             ).subclip(2, 8)  # 6s background
 
-            mock_remove.return_value = Foreground.from_webm_vp9(
-                "test_assets/transparent_webm_vp9.webm"
-            )
+            mock_remove.return_value = _fg_webm()
             fg = Video.open("test_assets/default_green_screen.mp4").remove_background(
                 mock_client, RemoveBGOptions(prefer="webm_vp9")
             )
@@ -2004,7 +2181,7 @@ class TestVideoBGRemoverWorkflow:
             comp1.add(fg).start(1).duration(4)
 
             cmd1 = comp1.dry_run()
-            assert "-ss 2" in cmd1 and "-t 6" in cmd1, "Background should be trimmed"
+            assert_all_present(cmd1, ["-ss 2", "-t 6"], "Background should be trimmed")
             # Audio now uses filter graph for timing, not direct mapping
             assert "[audio_out]" in cmd1 or "1:a?" in cmd1, (
                 "Should use foreground audio (with timing if needed)"
@@ -2018,7 +2195,7 @@ class TestVideoBGRemoverWorkflow:
             comp2.add(fg_trimmed).start(2).duration(3)
 
             cmd2 = comp2.dry_run()
-            assert "-ss 1" in cmd2 and "-t 4" in cmd2, "Foreground should be trimmed"
+            assert_all_present(cmd2, ["-ss 1", "-t 4"], "Foreground should be trimmed")
             # Audio now uses filter graph for timing, not direct mapping
             assert "[audio_out]" in cmd2 or "1:a?" in cmd2, (
                 "Should use foreground audio (with timing if needed)"
@@ -2028,194 +2205,164 @@ class TestVideoBGRemoverWorkflow:
             output_path1 = output_dir / "timing_audio_background.mp4"
             output_path2 = output_dir / "timing_audio_foreground.mp4"
 
-            encoder = EncoderProfile.h264(preset="fast")
+            encoder = self.ENCODER
             comp1.to_file(str(output_path1), encoder)
             comp2.to_file(str(output_path2), encoder)
 
             assert output_path1.exists() and output_path2.exists()
             print(f"    ✅ Audio + timing tests → {output_path1}, {output_path2}")
 
-    def test_audio_volume_mixing(self, mock_client, output_dir):
-        """Test audio volume mixing with three overlays: muted, normal, and 50% volume - MOCK API + REAL FFMPEG."""
-        print("🎵 Testing audio volume mixing with three overlays...")
+    @pytest.fixture
+    def audio_volume_mixing_comp(self, mocked_webm_fg, long_background_bg):
+        """Three overlays with normal, muted and 10% volume audio over a 15s background."""
+        comp = Composition(long_background_bg.subclip(0, 15))
 
-        with patch(
-            "videobgremover.media._importer_internal.Importer.remove_background"
-        ) as mock_remove:
-            from videobgremover.media.foregrounds import Foreground
+        # One processed foreground (and one 3s trim) backs all three overlays
+        fg_trimmed = mocked_webm_fg.subclip(1, 4)  # 3s of content
 
-            # Setup background
-            bg = Background.from_video("test_assets/long_background_video.mp4").subclip(
-                0, 15
-            )
-            comp = Composition(bg)
+        # Overlay 1: Normal volume (100%)
+        comp.add(fg_trimmed, name="normal_audio").start(1).duration(3).at(
+            Anchor.TOP_LEFT, dx=50, dy=50
+        ).size(SizeMode.CANVAS_PERCENT, percent=30).audio(enabled=True, volume=1.0)
 
-            # Mock foreground with audio
-            mock_remove.return_value = Foreground.from_webm_vp9(
-                "test_assets/transparent_webm_vp9.webm"
-            )
+        # Overlay 2: Muted (0%)
+        comp.add(fg_trimmed, name="muted_audio").start(5).duration(3).at(
+            Anchor.TOP_RIGHT, dx=-50, dy=50
+        ).size(SizeMode.CANVAS_PERCENT, percent=30).audio(enabled=False)
 
-            # Create three overlays with different audio settings
-            print("  Adding overlay 1: Normal volume (100%)...")
-            video1 = Video.open("test_assets/default_green_screen.mp4")
-            fg1 = video1.remove_background(
-                mock_client, RemoveBGOptions(prefer="webm_vp9")
-            )
-            fg1_trimmed = fg1.subclip(1, 4)  # 3s of content
-            comp.add(fg1_trimmed, name="normal_audio").start(1).duration(3).at(
-                Anchor.TOP_LEFT, dx=50, dy=50
-            ).size(SizeMode.CANVAS_PERCENT, percent=30).audio(enabled=True, volume=1.0)
+        # Overlay 3: Very low volume (10%)
+        comp.add(fg_trimmed, name="low_volume_audio").start(9).duration(3).at(
+            Anchor.BOTTOM_CENTER, dy=-50
+        ).size(SizeMode.CANVAS_PERCENT, percent=30).audio(enabled=True, volume=0.1)
 
-            print("  Adding overlay 2: Muted (0%)...")
-            video2 = Video.open("test_assets/default_green_screen.mp4")
-            fg2 = video2.remove_background(
-                mock_client, RemoveBGOptions(prefer="webm_vp9")
-            )
-            fg2_trimmed = fg2.subclip(1, 4)  # 3s of content
-            comp.add(fg2_trimmed, name="muted_audio").start(5).duration(3).at(
-                Anchor.TOP_RIGHT, dx=-50, dy=50
-            ).size(SizeMode.CANVAS_PERCENT, percent=30).audio(enabled=False)
+        return comp
 
-            print("  Adding overlay 3: Very low volume (10%)...")
-            video3 = Video.open("test_assets/default_green_screen.mp4")
-            fg3 = video3.remove_background(
-                mock_client, RemoveBGOptions(prefer="webm_vp9")
-            )
-            fg3_trimmed = fg3.subclip(1, 4)  # 3s of content
-            comp.add(fg3_trimmed, name="low_volume_audio").start(9).duration(3).at(
-                Anchor.BOTTOM_CENTER, dy=-50
-            ).size(SizeMode.CANVAS_PERCENT, percent=30).audio(enabled=True, volume=0.1)
+    def test_audio_volume_mixing(self, audio_volume_mixing_comp):
+        """Test audio volume mixing with three overlays: muted, normal, and 10% volume - MOCK API."""
+        print("🎵 Testing audio volume mixing with three overlays...")
 
-            # Verify FFmpeg command includes proper audio mixing
-            cmd = comp.dry_run()
-            print("  Verifying audio mixing in FFmpeg command...")
+        # Verify FFmpeg command includes proper audio mixing
+        cmd = audio_volume_mixing_comp.dry_run()
+        print("  Verifying audio mixing in FFmpeg command...")
 
-            # Should have audio mixing with volume controls
-            assert "amix" in cmd, "Should use amix for multiple audio sources"
-            assert "volume=0.1" in cmd, (
-                "Should have 10% volume control for third overlay"
-            )
-            assert "adelay" in cmd, "Should have audio delays for timing"
+        # Should have audio mixing with volume controls and timing delays
+        assert_all_present(
+            cmd,
+            ["amix", "volume=0.1", "adelay"],
+            "Should mix audio with 10% volume on third overlay and timing delays",
+        )
 
-            # Export the test
-            output_path = output_dir / "audio_volume_mixing_test.mp4"
-            encoder = EncoderProfile.h264(preset="fast")
-            comp.to_file(str(output_path), encoder)
+    @pytest.mark.slow
+    def test_audio_volume_mixing_encode(self, audio_volume_mixing_comp, output_dir):
+        """Export the three-overlay audio volume mixing composition - MOCK API + REAL FFMPEG."""
+        output_path = output_dir / "audio_volume_mixing_test.mp4"
+        encoder = self.ENCODER
+        audio_volume_mixing_comp.to_file(str(output_path), encoder)
 
-            assert output_path.exists()
-            assert output_path.stat().st_size > 0
+        assert_valid_video(output_path)
 
-            print(f"    ✅ Audio volume mixing test → {output_path}")
-            print("    Expected behavior:")
-            print("      - 1-4s: Normal volume audio (overlay 1)")
-            print("      - 5-8s: No audio (overlay 2 muted)")
-            print("      - 9-12s: Very low volume audio - 10% (overlay 3)")
+        print(f"    ✅ Audio volume mixing test → {output_path}")
+        print("    Expected behavior:")
+        print("      - 1-4s: Normal volume audio (overlay 1)")
+        print("      - 5-8s: No audio (overlay 2 muted)")
+        print("      - 9-12s: Very low volume audio - 10% (overlay 3)")
 
-    def test_background_foreground_audio_combinations(self, mock_client, output_dir):
-        """Test different combinations of background and foreground audio - MOCK API + REAL FFMPEG."""
+    @pytest.fixture
+    def audio_combination_comps(self, mocked_webm_fg, audio_background_bg):
+        """Compositions for background + foreground audio combinations, keyed by output name."""
+        bg_with_audio = audio_background_bg.subclip(0, 10)
+        fg_trimmed = mocked_webm_fg.subclip(1, 4)  # 3s of foreground
+
+        # Test 1: Background audio + Foreground audio (both enabled)
+        comp1 = Composition(bg_with_audio)
+        comp1.add(fg_trimmed, name="fg_with_audio").start(2).duration(3).at(
+            Anchor.CENTER
+        ).size(SizeMode.CANVAS_PERCENT, percent=50).audio(enabled=True, volume=1.0)
+
+        # Test 2: Background audio only (foreground muted)
+        comp2 = Composition(bg_with_audio)
+        comp2.add(fg_trimmed, name="fg_muted").start(2).duration(3).at(
+            Anchor.CENTER
+        ).size(SizeMode.CANVAS_PERCENT, percent=50).audio(enabled=False)
+
+        # Test 3: Foreground audio only (background muted)
+        # Use SAME video background but with audio disabled
+        comp3 = Composition(bg_with_audio.audio(enabled=False))
+        comp3.add(fg_trimmed, name="fg_only_audio").start(2).duration(3).at(
+            Anchor.CENTER
+        ).size(SizeMode.CANVAS_PERCENT, percent=50).audio(enabled=True, volume=1.0)
+
+        return {
+            "audio_combo_background_and_foreground.mp4": comp1,
+            "audio_combo_background_only.mp4": comp2,
+            "audio_combo_foreground_only.mp4": comp3,
+        }
+
+    def test_background_foreground_audio_combinations(self, audio_combination_comps):
+        """Test different combinations of background and foreground audio - MOCK API."""
         print("🎵 Testing background + foreground audio combinations...")
 
-        with patch(
-            "videobgremover.media._importer_internal.Importer.remove_background"
-        ) as mock_remove:
-            from videobgremover.media.foregrounds import Foreground
-
-            # Mock foreground with audio
-            mock_remove.return_value = Foreground.from_webm_vp9(
-                "test_assets/transparent_webm_vp9.webm"
-            )
+        # Verify FFmpeg commands
+        print("  Verifying audio mixing in FFmpeg commands...")
+        cmd1, cmd2, cmd3 = (comp.dry_run() for comp in audio_combination_comps.values())
 
-            # Test 1: Background audio + Foreground audio (both enabled)
-            print("  Test 1: Background audio + Foreground audio (both)...")
-            bg_with_audio = Background.from_video(
-                "test_assets/audio_background.mp4"
-            ).subclip(0, 10)
-            comp1 = Composition(bg_with_audio)
+        # Test 1 should have both background and foreground audio
+        assert "amix" in cmd1, "Test 1 should mix background and foreground audio"
+        print("    ✅ Test 1: Both audio sources mixed")
 
-            video1 = Video.open("test_assets/default_green_screen.mp4")
-            fg1 = video1.remove_background(
-                mock_client, RemoveBGOptions(prefer="webm_vp9")
-            )
-            fg1_trimmed = fg1.subclip(1, 4)  # 3s of foreground
-
-            comp1.add(fg1_trimmed, name="fg_with_audio").start(2).duration(3).at(
-                Anchor.CENTER
-            ).size(SizeMode.CANVAS_PERCENT, percent=50).audio(enabled=True, volume=1.0)
-
-            # Export test 1
-            output_path1 = output_dir / "audio_combo_background_and_foreground.mp4"
-            encoder = EncoderProfile.h264(preset="fast")
-            comp1.to_file(str(output_path1), encoder)
-
-            assert output_path1.exists()
-            print(f"    ✅ Both audio sources → {output_path1}")
-
-            # Test 2: Background audio only (foreground muted)
-            print("  Test 2: Background audio only (foreground muted)...")
-            comp2 = Composition(bg_with_audio)
-            comp2.add(fg1_trimmed, name="fg_muted").start(2).duration(3).at(
-                Anchor.CENTER
-            ).size(SizeMode.CANVAS_PERCENT, percent=50).audio(enabled=False)
-
-            # Export test 2
-            output_path2 = output_dir / "audio_combo_background_only.mp4"
-            comp2.to_file(str(output_path2), encoder)
-
-            assert output_path2.exists()
-            print(f"    ✅ Background audio only → {output_path2}")
-
-            # Test 3: Foreground audio only (background muted)
-            print("  Test 3: Foreground audio only (background muted)...")
-            # Use SAME video background but with audio disabled
-            bg_no_audio = bg_with_audio.audio(enabled=False)
-            comp3 = Composition(bg_no_audio)
-            comp3.add(fg1_trimmed, name="fg_only_audio").start(2).duration(3).at(
-                Anchor.CENTER
-            ).size(SizeMode.CANVAS_PERCENT, percent=50).audio(enabled=True, volume=1.0)
-
-            # Export test 3
-            output_path3 = output_dir / "audio_combo_foreground_only.mp4"
-            comp3.to_file(str(output_path3), encoder)
-
-            assert output_path3.exists()
-            print(f"    ✅ Foreground audio only → {output_path3}")
-
-            # Verify FFmpeg commands
-            print("  Verifying audio mixing in FFmpeg commands...")
-
-            cmd1 = comp1.dry_run()
-            cmd2 = comp2.dry_run()
-            cmd3 = comp3.dry_run()
+        # Test 2 should have only background audio (no amix needed)
+        assert "0:a" in cmd2 or "-map [audio_out]" in cmd2, (
+            "Test 2 should have background audio"
+        )
+        print("    ✅ Test 2: Background audio only")
 
-            # Test 1 should have both background and foreground audio
-            assert "amix" in cmd1, "Test 1 should mix background and foreground audio"
-            print("    ✅ Test 1: Both audio sources mixed")
+        # Test 3 should have only foreground audio
+        assert "1:a" in cmd3 or "-map [audio_out]" in cmd3, (
+            "Test 3 should have foreground audio"
+        )
+        print("    ✅ Test 3: Foreground audio only")
 
-            # Test 2 should have only background audio (no amix needed)
-            assert "0:a" in cmd2 or "-map [audio_out]" in cmd2, (
-                "Test 2 should have background audio"
-            )
-            print("    ✅ Test 2: Background audio only")
+    @pytest.mark.slow
+    def test_background_foreground_audio_combinations_encode(
+        self, audio_combination_comps, output_dir
+    ):
+        """Export the background + foreground audio combinations - MOCK API + REAL FFMPEG."""
+        for output_name, comp in audio_combination_comps.items():
+            output_path = output_dir / output_name
+            comp.to_file(str(output_path), self.ENCODER)
 
-            # Test 3 should have only foreground audio
-            assert "1:a" in cmd3 or "-map [audio_out]" in cmd3, (
-                "Test 3 should have foreground audio"
-            )
-            print("    ✅ Test 3: Foreground audio only")
+            assert_valid_video(output_path)
+            print(f"    ✅ {output_name} → {output_path}")
 
-            print("    📊 Summary:")
-            print(f"      - Both audio: Background + Foreground mixed → {output_path1}")
-            print(f"      - Background only: Foreground muted → {output_path2}")
-            print(f"      - Foreground only: No background audio → {output_path3}")
-            print("    🎧 Listen to compare the different audio combinations!")
+        print("    🎧 Listen to compare the different audio combinations!")
 
-    def test_background_audio_with_volume_control(self, mock_client, output_dir):
-        """Test background audio with volume control using .audio() method - MOCK API + REAL FFMPEG.
+    @pytest.fixture
+    def background_audio_volume_comps(self, mocked_webm_fg, audio_background_bg):
+        """Compositions WITH (index 0) and WITHOUT (index 1) background audio."""
+        # Call .audio() with enabled=True to set volume
+        # This should preserve _video_info for has_audio() to work
+        bg_with_audio = audio_background_bg.audio(enabled=True, volume=1.0)
+        comp1 = Composition(bg_with_audio)
+        comp1.add(mocked_webm_fg, name="fg_with_audio").at(Anchor.CENTER).size(
+            SizeMode.CANVAS_PERCENT, percent=50
+        ).audio(enabled=True, volume=1.0)
+
+        # Explicitly disable background audio
+        bg_no_audio = audio_background_bg.audio(enabled=False)
+        comp2 = Composition(bg_no_audio)
+        comp2.add(mocked_webm_fg, name="fg_only_audio").at(Anchor.CENTER).size(
+            SizeMode.CANVAS_PERCENT, percent=50
+        ).audio(enabled=True, volume=1.0)
+
+        return comp1, comp2
+
+    def test_background_audio_with_volume_control(self, background_audio_volume_comps):
+        """Test background audio with volume control using .audio() method - MOCK API.
 
         This test specifically checks that calling .audio(enabled=True, volume=X) on a
         video background preserves the video metadata needed for audio mixing.
 
-        Creates two comparison videos:
+        Checks two compositions:
         1. WITH background audio (both background + foreground mixed)
         2. WITHOUT background audio (foreground only)
 
@@ -2223,282 +2370,190 @@ class TestVideoBGRemoverWorkflow:
         causing has_audio() to return False even when audio is enabled.
         """
         print("🎵 Testing background audio with volume control...")
+        comp1, comp2 = background_audio_volume_comps
 
-        with patch(
-            "videobgremover.media._importer_internal.Importer.remove_background"
-        ) as mock_remove:
-            from videobgremover.media.foregrounds import Foreground
+        # Test 1: WITH background audio (both mixed)
+        print("  Test 1: WITH background audio (both mixed)...")
+        bg_with_audio = comp1._background
 
-            # Mock foreground with audio
-            mock_remove.return_value = Foreground.from_webm_vp9(
-                "test_assets/transparent_webm_vp9.webm"
-            )
-
-            video = Video.open("test_assets/default_green_screen.mp4")
-            fg = video.remove_background(
-                mock_client, RemoveBGOptions(prefer="webm_vp9")
-            )
+        # Verify audio settings are applied
+        assert bg_with_audio.audio_enabled, "Audio should be enabled"
+        assert bg_with_audio.audio_volume == 1.0, "Volume should be 1.0"
 
-            encoder = EncoderProfile.h264(preset="fast")
+        # Debug: Check if has_audio() works
+        print(f"    bg_with_audio.has_audio() = {bg_with_audio.has_audio()}")
 
-            # Test 1: WITH background audio (both mixed)
-            print("  Test 1: WITH background audio (both mixed)...")
-            bg_with_audio = Background.from_video("test_assets/audio_background.mp4")
+        # Check FFmpeg command
+        cmd1 = comp1.dry_run()
+        print("    Checking for audio mixing in FFmpeg command...")
 
-            # Call .audio() with enabled=True to set volume
-            # This should preserve _video_info for has_audio() to work
-            bg_with_audio = bg_with_audio.audio(enabled=True, volume=1.0)
+        # Should mix background and foreground audio
+        has_audio_mixing = "amix" in cmd1
+        print(f"    Has audio mixing (amix): {has_audio_mixing}")
 
-            # Verify audio settings are applied
-            assert bg_with_audio.audio_enabled, "Audio should be enabled"
-            assert bg_with_audio.audio_volume == 1.0, "Volume should be 1.0"
+        # This assertion will fail if the bug exists
+        assert has_audio_mixing, (
+            "Should mix background and foreground audio. "
+            "BUG: .audio() method doesn't preserve _video_info, "
+            "causing has_audio() to return False even when audio is enabled."
+        )
 
-            # Debug: Check if has_audio() works
-            print(f"    bg_with_audio.has_audio() = {bg_with_audio.has_audio()}")
+        # Test 2: WITHOUT background audio (foreground only)
+        print("  Test 2: WITHOUT background audio (foreground only)...")
+        bg_no_audio = comp2._background
 
-            comp1 = Composition(bg_with_audio)
-            comp1.add(fg, name="fg_with_audio").at(Anchor.CENTER).size(
-                SizeMode.CANVAS_PERCENT, percent=50
-            ).audio(enabled=True, volume=1.0)
+        assert not bg_no_audio.audio_enabled, "Audio should be disabled"
+        print(f"    bg_no_audio.audio_enabled = {bg_no_audio.audio_enabled}")
 
-            # Check FFmpeg command
-            cmd1 = comp1.dry_run()
-            print("    Checking for audio mixing in FFmpeg command...")
+        # Check FFmpeg command
+        cmd2 = comp2.dry_run()
 
-            # Should mix background and foreground audio
-            has_audio_mixing = "amix" in cmd1
-            print(f"    Has audio mixing (amix): {has_audio_mixing}")
+        # Should NOT mix (only foreground audio)
+        has_audio_mixing2 = "amix" in cmd2
+        print(f"    Has audio mixing (amix): {has_audio_mixing2}")
+        assert not has_audio_mixing2, (
+            "Should NOT mix audio when background audio is disabled"
+        )
 
-            # This assertion will fail if the bug exists
-            assert has_audio_mixing, (
-                "Should mix background and foreground audio. "
-                "BUG: .audio() method doesn't preserve _video_info, "
-                "causing has_audio() to return False even when audio is enabled."
-            )
+        # Should use foreground audio only
+        assert "1:a?" in cmd2 or "-map [audio_out]" in cmd2, (
+            "Should use foreground audio"
+        )
 
-            # Export test 1
-            output_path1 = output_dir / "audio_with_background.mp4"
-            comp1.to_file(str(output_path1), encoder)
-            assert output_path1.exists()
-            print(f"    ✅ WITH background audio → {output_path1}")
+    @pytest.mark.slow
+    def test_background_audio_with_volume_control_encode(
+        self, background_audio_volume_comps, output_dir
+    ):
+        """Export the WITH / WITHOUT background audio comparison - MOCK API + REAL FFMPEG."""
+        comp1, comp2 = background_audio_volume_comps
+        encoder = self.ENCODER
+
+        output_path1 = output_dir / "audio_with_background.mp4"
+        comp1.to_file(str(output_path1), encoder)
+        assert output_path1.exists()
+        print(f"    ✅ WITH background audio → {output_path1}")
+
+        output_path2 = output_dir / "audio_without_background.mp4"
+        comp2.to_file(str(output_path2), encoder)
+        assert output_path2.exists()
+        print(f"    ✅ WITHOUT background audio → {output_path2}")
+
+        print("  🎧 Listen to both files to compare the difference!")
+
+    @pytest.mark.parametrize(
+        "format_key,format_name,test_asset",
+        ALPHA_FORMATS,
+        ids=[format_key for format_key, _, _ in ALPHA_FORMATS],
+    )
+    def test_alpha_control_single_format(
+        self,
+        mock_client,
+        output_dir,
+        green_screen_video,
+        alpha_foregrounds,
+        format_key,
+        format_name,
+        test_asset,
+    ):
+        """Test alpha control (.alpha(enabled=False)) for one format - MOCK API + REAL FFMPEG."""
+        print(f"🎭 Testing {format_name} alpha control...")
 
-            # Test 2: WITHOUT background audio (foreground only)
-            print("  Test 2: WITHOUT background audio (foreground only)...")
-            bg_no_audio = Background.from_video("test_assets/audio_background.mp4")
+        with patch(
+            "videobgremover.media._importer_internal.Importer.remove_background"
+        ) as mock_remove:
+            # Mock the appropriate foreground type
+            mock_remove.return_value = alpha_foregrounds[format_key]
 
-            # Explicitly disable background audio
-            bg_no_audio = bg_no_audio.audio(enabled=False)
+            # Create foreground
+            foreground = green_screen_video.remove_background(
+                mock_client, RemoveBGOptions(prefer=format_key)
+            )
 
-            assert not bg_no_audio.audio_enabled, "Audio should be disabled"
-            print(f"    bg_no_audio.audio_enabled = {bg_no_audio.audio_enabled}")
+        # Create side-by-side comparison only
+        print(
+            f"  Creating {format_name} alpha comparison (left=with alpha, right=without alpha)..."
+        )
+        comp_comparison = Composition(ALPHA_TEST_BACKGROUND)
+        comp_comparison.add(foreground, name=f"{format_key}_left_alpha").at(
+            Anchor.CENTER_LEFT, dx=100
+        ).size(SizeMode.CANVAS_PERCENT, percent=35).alpha(enabled=True)
+        comp_comparison.add(foreground, name=f"{format_key}_right_no_alpha").at(
+            Anchor.CENTER_RIGHT, dx=-100
+        ).size(SizeMode.CANVAS_PERCENT, percent=35).alpha(enabled=False)
 
-            comp2 = Composition(bg_no_audio)
-            comp2.add(fg, name="fg_only_audio").at(Anchor.CENTER).size(
-                SizeMode.CANVAS_PERCENT, percent=50
-            ).audio(enabled=True, volume=1.0)
+        output_comparison = output_dir / f"alpha_comparison_{format_key}.mp4"
+        comp_comparison.to_file(str(output_comparison), self.ENCODER)
 
-            # Check FFmpeg command
-            cmd2 = comp2.dry_run()
+        assert_valid_video(output_comparison)
+        print(f"    ✅ Alpha comparison → {output_comparison}")
 
-            # Should NOT mix (only foreground audio)
-            has_audio_mixing2 = "amix" in cmd2
-            print(f"    Has audio mixing (amix): {has_audio_mixing2}")
-            assert not has_audio_mixing2, (
-                "Should NOT mix audio when background audio is disabled"
+        # Verify FFmpeg command contains both alpha enabled and disabled filters
+        cmd_comparison = comp_comparison.dry_run()
+        if format_key in ["webm_vp9", "mov_prores"]:
+            assert "format=rgb24" in cmd_comparison, (
+                f"{format_name} should have format=rgb24 when alpha disabled"
             )
-
-            # Should use foreground audio only
-            assert "1:a?" in cmd2 or "-map [audio_out]" in cmd2, (
-                "Should use foreground audio"
+        elif format_key in ["stacked_video", "pro_bundle"]:
+            # These formats should have both alphamerge (for alpha enabled) and format=rgb24 (for alpha disabled)
+            assert "alphamerge" in cmd_comparison, (
+                f"{format_name} should have alphamerge for alpha enabled layer"
+            )
+            assert "format=rgb24" in cmd_comparison, (
+                f"{format_name} should have format=rgb24 for alpha disabled layer"
             )
 
-            # Export test 2
-            output_path2 = output_dir / "audio_without_background.mp4"
-            comp2.to_file(str(output_path2), encoder)
-            assert output_path2.exists()
-            print(f"    ✅ WITHOUT background audio → {output_path2}")
+        print("    ✅ FFmpeg command verification passed")
 
-            print("  📊 Summary:")
-            print(f"    Test 1 (WITH background): {output_path1}")
-            print("      - Background audio: ENABLED")
-            print("      - Foreground audio: ENABLED")
-            print("      - FFmpeg: Uses amix to mix both")
-            print(f"    Test 2 (WITHOUT background): {output_path2}")
-            print("      - Background audio: DISABLED")
-            print("      - Foreground audio: ENABLED")
-            print("      - FFmpeg: Uses foreground audio only")
-            print("  🎧 Listen to both files to compare the difference!")
-
-    def test_alpha_control_all_formats(self, mock_client, output_dir):
-        """Test alpha control (.alpha(enabled=False)) with all formats - MOCK API + REAL FFMPEG."""
-        print("🎭 Testing alpha control with all formats...")
+    def test_alpha_control_multi_format_showcase(
+        self, mock_client, output_dir, green_screen_video, alpha_foregrounds
+    ):
+        """Test all formats in one composition with mixed alpha settings - MOCK API + REAL FFMPEG."""
+        print("🎭 Creating multi-format alpha showcase...")
 
         with patch(
             "videobgremover.media._importer_internal.Importer.remove_background"
         ) as mock_remove:
-            from videobgremover.media.foregrounds import Foreground
-
-            # Use a bright colored background to make transparency differences visible
-            bg = Background.from_color("#FF00FF", 1920, 1080, 30.0)  # Bright magenta
-            encoder = EncoderProfile.h264(preset="fast")
-
-            formats_to_test = [
-                ("webm_vp9", "WebM VP9", "test_assets/transparent_webm_vp9.webm"),
-                ("mov_prores", "MOV ProRes", "test_assets/transparent_mov_prores.mov"),
-                (
-                    "stacked_video",
-                    "Stacked Video",
-                    "test_assets/stacked_video_comparison.mp4",
-                ),
-                (
-                    "pro_bundle",
-                    "Pro Bundle",
-                    "test_assets/pro_bundle_multiple_formats.zip",
-                ),
+            showcase_comp = Composition(ALPHA_TEST_BACKGROUND)
+
+            # Add all formats with different alpha settings
+            positions = [
+                (Anchor.TOP_LEFT, 50, 50),
+                (Anchor.TOP_RIGHT, -50, 50),
+                (Anchor.BOTTOM_LEFT, 50, -50),
+                (Anchor.BOTTOM_RIGHT, -50, -50),
             ]
 
-            for format_key, format_name, test_asset in formats_to_test:
-                print(f"  Testing {format_name} alpha control...")
-
-                try:
-                    # Mock the appropriate foreground type
-                    if format_key == "webm_vp9":
-                        mock_remove.return_value = Foreground.from_webm_vp9(test_asset)
-                    elif format_key == "mov_prores":
-                        mock_remove.return_value = Foreground.from_mov_prores(
-                            test_asset
-                        )
-                    elif format_key == "pro_bundle":
-                        mock_remove.return_value = Foreground.from_pro_bundle_zip(
-                            test_asset
-                        )
-                    else:  # stacked_video
-                        mock_remove.return_value = Foreground.from_stacked_video(
-                            test_asset
-                        )
-
-                    # Create foreground
-                    video = Video.open("test_assets/default_green_screen.mp4")
-                    foreground = video.remove_background(
-                        mock_client, RemoveBGOptions(prefer=format_key)
-                    )
-
-                    # Create side-by-side comparison only
-                    print(
-                        f"    Creating {format_name} alpha comparison (left=with alpha, right=without alpha)..."
-                    )
-                    comp_comparison = Composition(bg)
-                    comp_comparison.add(foreground, name=f"{format_key}_left_alpha").at(
-                        Anchor.CENTER_LEFT, dx=100
-                    ).size(SizeMode.CANVAS_PERCENT, percent=35).alpha(enabled=True)
-                    comp_comparison.add(
-                        foreground, name=f"{format_key}_right_no_alpha"
-                    ).at(Anchor.CENTER_RIGHT, dx=-100).size(
-                        SizeMode.CANVAS_PERCENT, percent=35
-                    ).alpha(enabled=False)
-
-                    output_comparison = (
-                        output_dir / f"alpha_comparison_{format_key}.mp4"
-                    )
-                    comp_comparison.to_file(str(output_comparison), encoder)
-
-                    assert output_comparison.exists()
-                    assert output_comparison.stat().st_size > 0
-                    print(f"      ✅ Alpha comparison → {output_comparison}")
-
-                    # Verify FFmpeg commands contain expected filters
-                    cmd_comparison = comp_comparison.dry_run()
-
-                    # Verify FFmpeg command contains both alpha enabled and disabled filters
-                    if format_key in ["webm_vp9", "mov_prores"]:
-                        assert "format=rgb24" in cmd_comparison, (
-                            f"{format_name} should have format=rgb24 when alpha disabled"
-                        )
-                    elif format_key in ["stacked_video", "pro_bundle"]:
-                        # These formats should have both alphamerge (for alpha enabled) and format=rgb24 (for alpha disabled)
-                        assert "alphamerge" in cmd_comparison, (
-                            f"{format_name} should have alphamerge for alpha enabled layer"
-                        )
-                        assert "format=rgb24" in cmd_comparison, (
-                            f"{format_name} should have format=rgb24 for alpha disabled layer"
-                        )
-
-                    print("      ✅ FFmpeg command verification passed")
+            for i, (format_key, _, _) in enumerate(ALPHA_FORMATS):
+                mock_remove.return_value = alpha_foregrounds[format_key]
 
-                except Exception as e:
-                    print(f"    ❌ {format_name} alpha control test failed: {e}")
-                    # Don't fail the entire test, just log the error
-                    continue
-
-            # Test 4: Multi-format showcase with mixed alpha settings
-            print("  Creating multi-format alpha showcase...")
-            try:
-                showcase_comp = Composition(bg)
-
-                # Add all formats with different alpha settings
-                positions = [
-                    (Anchor.TOP_LEFT, 50, 50),
-                    (Anchor.TOP_RIGHT, -50, 50),
-                    (Anchor.BOTTOM_LEFT, 50, -50),
-                    (Anchor.BOTTOM_RIGHT, -50, -50),
-                ]
-
-                for i, (format_key, format_name, test_asset) in enumerate(
-                    formats_to_test[:4]
-                ):  # Limit to 4 for positioning
-                    if format_key == "webm_vp9":
-                        mock_remove.return_value = Foreground.from_webm_vp9(test_asset)
-                    elif format_key == "mov_prores":
-                        mock_remove.return_value = Foreground.from_mov_prores(
-                            test_asset
-                        )
-                    elif format_key == "pro_bundle":
-                        mock_remove.return_value = Foreground.from_pro_bundle_zip(
-                            test_asset
-                        )
-                    else:  # stacked_video
-                        mock_remove.return_value = Foreground.from_stacked_video(
-                            test_asset
-                        )
-
-                    video = Video.open("test_assets/default_green_screen.mp4")
-                    fg = video.remove_background(
-                        mock_client, RemoveBGOptions(prefer=format_key)
-                    )
-
-                    anchor, dx, dy = positions[i]
-                    alpha_enabled = i % 2 == 0  # Alternate alpha on/off
-
-                    showcase_comp.add(fg, name=f"showcase_{format_key}").at(
-                        anchor, dx=dx, dy=dy
-                    ).size(SizeMode.CANVAS_PERCENT, percent=20).alpha(
-                        enabled=alpha_enabled
-                    ).opacity(0.9)
-
-                output_showcase = (
-                    output_dir / "alpha_comparison_multi_format_showcase.mp4"
+                fg = green_screen_video.remove_background(
+                    mock_client, RemoveBGOptions(prefer=format_key)
                 )
-                showcase_comp.to_file(str(output_showcase), encoder)
 
-                assert output_showcase.exists()
-                assert output_showcase.stat().st_size > 0
-                print(f"    ✅ Multi-format showcase → {output_showcase}")
+                anchor, dx, dy = positions[i]
+                alpha_enabled = i % 2 == 0  # Alternate alpha on/off
 
-            except Exception as e:
-                print(f"    ⚠️ Multi-format showcase failed: {e}")
-
-            print("✅ Alpha control comprehensive test completed")
-            print("  📊 Summary:")
-            print(
-                "    - Tested all 4 formats: WebM VP9, MOV ProRes, Stacked Video, Pro Bundle"
-            )
-            print("    - Each format tested with alpha enabled and disabled")
-            print("    - Side-by-side comparisons created for visual verification")
-            print("    - FFmpeg command verification for correct filter usage")
-            print("    - Multi-format showcase with mixed alpha settings")
-            print("  🎭 Compare the outputs to see transparency differences!")
-
-    def test_video_on_video_composition_performance(self, mock_client, output_dir):
+                showcase_comp.add(fg, name=f"showcase_{format_key}").at(
+                    anchor, dx=dx, dy=dy
+                ).size(SizeMode.CANVAS_PERCENT, percent=20).alpha(
+                    enabled=alpha_enabled
+                ).opacity(0.9)
+
+        output_showcase = output_dir / "alpha_comparison_multi_format_showcase.mp4"
+        showcase_comp.to_file(str(output_showcase), self.ENCODER)
+
+        assert_valid_video(output_showcase)
+        print(f"  ✅ Multi-format showcase → {output_showcase}")
+        print("  🎭 Compare the outputs to see transparency differences!")
+
+    def test_video_on_video_composition_performance(
+        self,
+        mock_client,
+        output_dir,
+        green_screen_video,
+        ai_actor_fg,
+        gdrive_background_bg,
+    ):
         """Test video-on-video composition performance - should be FAST!
 
         Uses real production assets:
@@ -2517,23 +2572,18 @@ class TestVideoBGRemoverWorkflow:
         with patch(
             "videobgremover.media._importer_internal.Importer.remove_background"
         ) as mock_remove:
-            from videobgremover.media.foregrounds import Foreground
-
             # Use real ai-actor video as foreground (simulating VBR output)
             # In production, this would be the result of background removal
-            mock_remove.return_value = Foreground.from_video_and_mask(
-                video_path="test_assets/ai-actor.mp4",
-                mask_path="test_assets/ai-actor.mp4",  # Using same video as dummy mask
-            )
+            # (same video used as dummy mask, see the ai_actor_fg fixture)
+            mock_remove.return_value = ai_actor_fg
 
-            video = Video.open("test_assets/default_green_screen.mp4")
-            foreground = video.remove_background(
+            foreground = green_screen_video.remove_background(
                 mock_client, RemoveBGOptions(prefer="pro_bundle")
             )
 
             # Create VIDEO background (NOT image!)
             print("  📹 Creating VIDEO background (fast path)...")
-            bg_video = Background.from_video("test_assets/background-video-gdrive.mp4")
+            bg_video = gdrive_background_bg
 
             # Apply composition settings similar to UGC ad template
             comp = Composition(bg_video)
@@ -2553,20 +2603,24 @@ class TestVideoBGRemoverWorkflow:
 
             # Time the export
             output_path = output_dir / "video_on_video_fast.mp4"
-            encoder = EncoderProfile.h264(crf=20, preset="fast")
+            encoder = self.ENCODER
 
-            print("  ⏱️  Starting timed export...")
-            start_time = time.time()
-            comp.to_file(str(output_path), encoder)
-            end_time = time.time()
+            if os.getenv("BENCHMARK_ONLY"):
+                # Decode + filter graph only, no encode and no file on disk
+                print("  ⏱️  Starting timed benchmark run (BENCHMARK_ONLY)...")
+                duration = time_null_render(comp)
+            else:
+                print("  ⏱️  Starting timed export...")
+                start_time = time.perf_counter()
+                comp.to_file(str(output_path), encoder)
+                end_time = time.perf_counter()
 
-            duration = end_time - start_time
+                duration = end_time - start_time
 
-            # Verify output
-            assert output_path.exists()
-            assert output_path.stat().st_size > 0
+                # Verify output
+                assert_valid_video(output_path)
 
-            print(f"  ✅ Video-on-video composition completed: {output_path}")
+                print(f"  ✅ Video-on-video composition completed: {output_path}")
             print(f"  ⏱️  TOTAL TIME: {duration:.2f} seconds")
             print("  📊 Performance comparison:")
             print("     - Video-on-image: ~3-5 seconds (needs -loop, slower)")
@@ -2575,12 +2629,15 @@ class TestVideoBGRemoverWorkflow:
             )
             print(f"  🚀 Video-on-video is ~{3.0 / duration:.1f}x faster!")
 
-    def test_image_background_url_performance(self, mock_client, output_dir):
+    def test_image_background_url_performance(
+        self, mock_client, output_dir, cached_image_downloads
+    ):
         """Test image background from URL performance - FIXED VERSION.
 
         This test demonstrates the fix for network URL performance:
         - Tests TWO different image URLs
         - Downloads to local temp file first (fix applied!)
+        - Downloads are cached across runs and revalidated (see URL_CACHE_DIR)
         - Expected: FAST (2-4 seconds) with local download
         """
         import time
@@ -2620,147 +2677,109 @@ class TestVideoBGRemoverWorkflow:
                 mock_client, RemoveBGOptions(prefer="pro_bundle")
             )
 
-            # Test URL 1
-            print("\n  === Testing URL 1 ===")
-            print("  📹 Creating IMAGE background from URL 1...")
-            print("  ✅ FIXED: Image will be downloaded to local temp file first")
-
-            start_probe1 = time.time()
-            bg_image1 = Background.from_image(test_image_url1, fps=24.0)
-            probe_time1 = time.time() - start_probe1
-            print(f"  ⏱️  Download + probing took: {probe_time1:.2f}s")
-            print(
-                f"  📏 Image dimensions: {bg_image1.width}x{bg_image1.height} @ {bg_image1.fps}fps"
-            )
-
-            # Create composition
-            comp1 = Composition(bg_image1)
-            comp1.add(foreground, name="ai_actor").at(
-                Anchor.BOTTOM_RIGHT, dx=-30, dy=-30
-            ).size(SizeMode.SCALE, scale=0.5).audio(enabled=True, volume=1.0)
-
-            # Get FFmpeg command to verify it uses LOCAL FILE (not network URL)
-            cmd1 = comp1.dry_run()
-            print("  🎬 FFmpeg command preview:")
-            print(f"     {cmd1[:200]}...")
-
-            # Verify it's using -loop with LOCAL FILE (the fix!)
-            assert "-loop" in cmd1, "Should use -loop for image background"
-            assert test_image_url1 not in cmd1, (
-                "Should NOT use URL directly (fix applied!)"
-            )
-            assert "downloaded_image_" in cmd1, "Should use local downloaded file"
-            print("  ✅ Confirmed: Using -loop 1 with LOCAL FILE (FAST PATH)")
-
-            # Time the export
-            output_path1 = output_dir / "image_url_background_1_FIXED.mp4"
-            encoder = EncoderProfile.h264(crf=20, preset="fast")
-
-            print("  ⏱️  Starting timed export...")
-            print("  ✅ Expected: FAST (~2-4 seconds) with local file")
-            start_time1 = time.time()
-
-            comp1.to_file(str(output_path1), encoder)
-            end_time1 = time.time()
-
-            duration1 = end_time1 - start_time1
-
-            # Verify output
-            assert output_path1.exists()
-            assert output_path1.stat().st_size > 0
-
-            print(f"  ✅ Image URL 1 background composition completed: {output_path1}")
-            print(f"  ⏱️  TOTAL TIME: {duration1:.2f} seconds")
-            print("  📊 Performance analysis:")
-            print(f"     - Download + probe time: {probe_time1:.2f}s")
-            print(f"     - Composition time: {duration1:.2f}s")
-            print(f"     - TOTAL time: {probe_time1 + duration1:.2f}s")
-
-            if duration1 < 10:
-                print(
-                    f"  ✅ SUCCESS: Image URL 1 composition is FAST ({duration1:.2f}s)"
-                )
-                print("     Fix confirmed: 10-20x faster than before!")
-            else:
+            # Downloads are network-bound and independent: fetch + probe both
+            # images concurrently
+            def timed_from_image(url):
+                start = time.perf_counter()
+                bg = Background.from_image(url, fps=24.0)
+                return bg, time.perf_counter() - start
+
+            print("  📥 Downloading + probing both image URLs concurrently...")
+            print("  ✅ FIXED: Images are downloaded to local temp files first")
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                future1 = executor.submit(timed_from_image, test_image_url1)
+                future2 = executor.submit(timed_from_image, test_image_url2)
+                bg_image1, probe_time1 = future1.result()
+                bg_image2, probe_time2 = future2.result()
+
+            cases = [
+                (1, test_image_url1, bg_image1, probe_time1),
+                (2, test_image_url2, bg_image2, probe_time2),
+            ]
+            comps = {}
+            for n, url, bg_image, probe_time in cases:
+                print(f"\n  === Testing URL {n} ===")
+                print(f"  ⏱️  Download + probing took: {probe_time:.2f}s")
                 print(
-                    f"  ⚠️  Still slow ({duration1:.2f}s) - may need further investigation"
+                    f"  📏 Image dimensions: {bg_image.width}x{bg_image.height} @ {bg_image.fps}fps"
                 )
 
-            # Test URL 2
-            print("\n  === Testing URL 2 ===")
-            print("  📹 Creating IMAGE background from URL 2...")
-            print("  ✅ FIXED: Image will be downloaded to local temp file first")
+                # Create composition
+                comp = Composition(bg_image)
+                comp.add(foreground, name="ai_actor").at(
+                    Anchor.BOTTOM_RIGHT, dx=-30, dy=-30
+                ).size(SizeMode.SCALE, scale=0.5).audio(enabled=True, volume=1.0)
 
-            start_probe2 = time.time()
-            bg_image2 = Background.from_image(test_image_url2, fps=24.0)
-            probe_time2 = time.time() - start_probe2
-            print(f"  ⏱️  Download + probing took: {probe_time2:.2f}s")
-            print(
-                f"  📏 Image dimensions: {bg_image2.width}x{bg_image2.height} @ {bg_image2.fps}fps"
-            )
+                # Get FFmpeg command to verify it uses LOCAL FILE (not network URL)
+                cmd = comp.dry_run()
+                print("  🎬 FFmpeg command preview:")
+                print(f"     {cmd[:200]}...")
 
-            # Create composition
-            comp2 = Composition(bg_image2)
-            comp2.add(foreground, name="ai_actor").at(
-                Anchor.BOTTOM_RIGHT, dx=-30, dy=-30
-            ).size(SizeMode.SCALE, scale=0.5).audio(enabled=True, volume=1.0)
+                # Verify it's using -loop with LOCAL FILE (the fix!)
+                assert "-loop" in cmd, "Should use -loop for image background"
+                assert url not in cmd, "Should NOT use URL directly (fix applied!)"
+                assert "downloaded_image_" in cmd, "Should use local downloaded file"
+                print("  ✅ Confirmed: Using -loop 1 with LOCAL FILE (FAST PATH)")
 
-            # Get FFmpeg command to verify it uses LOCAL FILE (not network URL)
-            cmd2 = comp2.dry_run()
-            print("  🎬 FFmpeg command preview:")
-            print(f"     {cmd2[:200]}...")
+                comps[n] = comp
 
-            # Verify it's using -loop with LOCAL FILE (the fix!)
-            assert "-loop" in cmd2, "Should use -loop for image background"
-            assert test_image_url2 not in cmd2, (
-                "Should NOT use URL directly (fix applied!)"
-            )
-            assert "downloaded_image_" in cmd2, "Should use local downloaded file"
-            print("  ✅ Confirmed: Using -loop 1 with LOCAL FILE (FAST PATH)")
+            # The two encodes are independent FFmpeg processes on different
+            # inputs, so run them side by side; each export is timed on its own
+            encoder = self.ENCODER
 
-            # Time the export
-            output_path2 = output_dir / "image_url_background_2_FIXED.mp4"
+            def timed_export(n):
+                output_path = output_dir / f"image_url_background_{n}_FIXED.mp4"
+                start = time.perf_counter()
+                comps[n].to_file(str(output_path), encoder)
+                return output_path, time.perf_counter() - start
 
-            print("  ⏱️  Starting timed export...")
+            print("\n  ⏱️  Starting timed exports (both URLs concurrently)...")
             print("  ✅ Expected: FAST (~2-4 seconds) with local file")
-            start_time2 = time.time()
+            start_all = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=len(cases)) as executor:
+                exports = dict(zip(comps, executor.map(timed_export, comps)))
+            wall_time = time.perf_counter() - start_all
 
-            comp2.to_file(str(output_path2), encoder)
-            end_time2 = time.time()
-
-            duration2 = end_time2 - start_time2
-
-            # Verify output
-            assert output_path2.exists()
-            assert output_path2.stat().st_size > 0
+            for n, _, _, probe_time in cases:
+                output_path, duration = exports[n]
 
-            print(f"  ✅ Image URL 2 background composition completed: {output_path2}")
-            print(f"  ⏱️  TOTAL TIME: {duration2:.2f} seconds")
-            print("  📊 Performance analysis:")
-            print(f"     - Download + probe time: {probe_time2:.2f}s")
-            print(f"     - Composition time: {duration2:.2f}s")
-            print(f"     - TOTAL time: {probe_time2 + duration2:.2f}s")
+                # Verify output
+                assert_valid_video(output_path)
 
-            if duration2 < 10:
-                print(
-                    f"  ✅ SUCCESS: Image URL 2 composition is FAST ({duration2:.2f}s)"
-                )
-                print("     Fix confirmed: 10-20x faster than before!")
-            else:
                 print(
-                    f"  ⚠️  Still slow ({duration2:.2f}s) - may need further investigation"
+                    f"\n  ✅ Image URL {n} background composition completed: {output_path}"
                 )
+                print(f"  ⏱️  TOTAL TIME: {duration:.2f} seconds")
+                print("  📊 Performance analysis:")
+                print(f"     - Download + probe time: {probe_time:.2f}s")
+                print(f"     - Composition time: {duration:.2f}s")
+                print(f"     - TOTAL time: {probe_time + duration:.2f}s")
+
+                if duration < 10:
+                    print(
+                        f"  ✅ SUCCESS: Image URL {n} composition is FAST ({duration:.2f}s)"
+                    )
+                    print("     Fix confirmed: 10-20x faster than before!")
+                else:
+                    print(
+                        f"  ⚠️  Still slow ({duration:.2f}s) - may need further investigation"
+                    )
 
             # Summary
             print("\n  🎯 BOTH URLs TEST SUMMARY:")
-            print(f"     URL 1: {duration1:.2f}s → {output_path1}")
-            print(f"     URL 2: {duration2:.2f}s → {output_path2}")
-            print(f"     TOTAL: {duration1 + duration2:.2f}s")
+            for n, (output_path, duration) in exports.items():
+                print(f"     URL {n}: {duration:.2f}s → {output_path}")
+            print(f"     WALL TIME (concurrent): {wall_time:.2f}s")
 
 
 class TestMatteFeatureFunctional:
     """Functional tests for the matte feature."""
 
+    @pytest.fixture(autouse=True)
+    def _encoder(self, test_encoder):
+        """Shared by every export in the class; see the test_encoder fixture."""
+        self.ENCODER = test_encoder
+
     def test_compose_with_matte_true(self):
         """Test composition with matte=True and export."""
         print("🎨 Testing matte feature with matte=True (soft alpha)...")
@@ -2782,7 +2801,7 @@ class TestMatteFeatureFunctional:
         comp.add(fg).at(Anchor.CENTER).size(SizeMode.CONTAIN)
 
         # Export
-        encoder = EncoderProfile.h264(crf=23, preset="fast")
+        encoder = self.ENCODER
         comp.to_file(output_path, encoder)
 
         # Verify
@@ -2813,7 +2832,7 @@ class TestMatteFeatureFunctional:
         comp.add(fg).at(Anchor.CENTER).size(SizeMode.CONTAIN)
 
         # Export
-        encoder = EncoderProfile.h264(crf=23, preset="fast")
+        encoder = self.ENCODER
         comp.to_file(output_path, encoder)
 
         # Verify
@@ -2858,7 +2877,7 @@ class TestMatteFeatureFunctional:
         )
 
         # Export
-        encoder = EncoderProfile.h264(crf=20, preset="medium")
+        encoder = self.ENCODER
         comp.to_file(output_path, encoder)
 
         # Verify
@@ -2890,7 +2909,7 @@ class TestMatteFeatureFunctional:
         comp.add(fg).at(Anchor.CENTER).size(SizeMode.CANVAS_PERCENT, percent=60)
 
         # Export
-        encoder = EncoderProfile.h264(crf=22, preset="fast")
+        encoder = self.ENCODER
         comp.to_file(output_path, encoder)
 
         # Verify
@@ -14,87 +14,113 @@ URL Configuration:
 - Skips tests gracefully if URL not configured
 """
 
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from unittest.mock import patch, Mock
 import pytest
-import subprocess
-import json
-import requests
 from videobgremover import (
-    VideoBGRemoverClient,
     Video,
     Background,
     Composition,
-    EncoderProfile,
     RemoveBGOptions,
     Anchor,
     SizeMode,
 )
+from .conftest import assert_all_present, assert_valid_video
 
 
-@pytest.fixture
-def test_video_url():
-    """Test video URL fixture with validation."""
-    from .conftest import get_test_video_sources
+@lru_cache(maxsize=None)
+def _fg_webm():
+    """Transparent WebM foreground, probed once per module.
 
-    sources = get_test_video_sources()
-    url = sources["url"]
+    Foreground is frozen, so the same instance can back every mocked
+    ``remove_background`` call.
+    """
+    from videobgremover.media.foregrounds import Foreground
 
-    if not url:
-        pytest.skip("Set TEST_VIDEO_URL environment variable to run URL-based tests")
+    return Foreground.from_webm_vp9("test_assets/transparent_webm_vp9.webm")
 
-    # Validate URL is accessible (HEAD request only - no download)
-    try:
-        response = requests.head(url, timeout=10, allow_redirects=True)
-        if response.status_code not in (200, 204):
-            pytest.skip(f"Test video URL not accessible: {response.status_code}")
-    except Exception as e:
-        pytest.skip(f"Test video URL validation failed: {e}")
 
-    return url
+@lru_cache(maxsize=None)
+def _format_foreground(format_key: str, test_asset: str):
+    """Foreground the mocked remove_background returns for a format.
 
+    Cached like _fg_webm, so each asset is loaded (and probed) once per
+    process no matter how many tests use it.
+    """
+    from videobgremover.media.foregrounds import Foreground
+
+    if format_key == "webm_vp9":
+        return _fg_webm()
+    if format_key == "mov_prores":
+        return Foreground.from_mov_prores(test_asset)
+    if format_key == "pro_bundle":
+        return Foreground.from_pro_bundle_zip(test_asset)
+    return Foreground.from_stacked_video(test_asset)
+
+
+@pytest.fixture(scope="module", autouse=True)
+def stub_background_probes():
+    """Report every image/video background in this module as 1080p30.
+
+    Applied once for the whole module instead of per-test patches. The tests
+    check workflow wiring, not the backgrounds' real dimensions.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(
+            "videobgremover.media.backgrounds._probe_video_dimensions",
+            lambda *args, **kwargs: (1920, 1080, 30.0),
+        )
+        mp.setattr(
+            "videobgremover.media.backgrounds._probe_image_dimensions",
+            lambda *args, **kwargs: (1920, 1080),
+        )
+        yield
 
-@pytest.fixture
-def mock_client():
-    """Create a mock API client that doesn't make real HTTP calls."""
-    return VideoBGRemoverClient("mock_api_key_for_url_tests")
+
+@pytest.fixture(scope="module")
+def importer(tmp_path_factory):
+    """Importer shared by the URL tests in this module.
+
+    MediaContext checks the FFmpeg binaries and creates a temp dir on init,
+    so build it once. The tests only call stateless importer methods.
+    """
+    from videobgremover.media._importer_internal import Importer
+    from videobgremover.media.context import MediaContext
+
+    ctx = MediaContext(tmp_root=str(tmp_path_factory.mktemp("media_ctx")))
+    return Importer(ctx)
 
 
 @pytest.fixture
-def output_dir():
+def output_dir(output_root):
     """Create output directory for URL test results."""
-    output_path = Path("test_outputs/url_tests")
+    output_path = output_root / "url_tests"
     output_path.mkdir(parents=True, exist_ok=True)
     return output_path
 
 
-def get_video_duration(file_path: str) -> float:
-    """Get actual video duration using ffprobe."""
-    try:
-        cmd = [
-            "ffprobe",
-            "-v",
-            "quiet",
-            "-print_format",
-            "json",
-            "-show_entries",
-            "format=duration",
-            file_path,
-        ]
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
-        if result.returncode == 0:
-            data = json.loads(result.stdout)
-            duration = data.get("format", {}).get("duration")
-            return float(duration) if duration else 0.0
-        return 0.0
-    except Exception:
-        return 0.0
+# Output formats exercised against a URL source, one test case each
+URL_FORMATS = [
+    ("webm_vp9", "WebM VP9", "test_assets/transparent_webm_vp9.webm"),
+    ("mov_prores", "MOV ProRes", "test_assets/transparent_mov_prores.mov"),
+    ("stacked_video", "Stacked Video", "test_assets/stacked_video_comparison.mp4"),
+    ("pro_bundle", "Pro Bundle", "test_assets/pro_bundle_multiple_formats.zip"),
+]
+
+URL_FORMAT_BACKGROUND = Background.from_color("#00FF00", 1920, 1080, 30.0)
 
 
 @pytest.mark.functional
 class TestURLBasedWorkflows:
     """Test URL-based video processing workflows."""
 
+    @pytest.fixture(autouse=True)
+    def _encoder(self, test_encoder):
+        """Shared by every export in the class; see the test_encoder fixture."""
+        self.ENCODER = test_encoder
+
     def test_video_open_url_no_download(self, test_video_url):
         """Test that Video.open() with URL doesn't download the video."""
         print(f"🌐 Testing Video.open() with URL: {test_video_url}")
@@ -108,16 +134,10 @@ class TestURLBasedWorkflows:
 
         print("✅ Video.open() with URL completed instantly (no download)")
 
-    def test_url_accessibility_validation(self, test_video_url):
+    def test_url_accessibility_validation(self, importer, test_video_url):
         """Test URL accessibility validation logic."""
         print("🔍 Testing URL accessibility validation...")
 
-        from videobgremover.media._importer_internal import Importer
-        from videobgremover.media.context import MediaContext
-
-        ctx = MediaContext()
-        importer = Importer(ctx)
-
         # Test with valid URL
         is_accessible = importer._public_url_ok(test_video_url)
         assert is_accessible, f"Test URL should be accessible: {test_video_url}"
@@ -129,16 +149,12 @@ class TestURLBasedWorkflows:
 
         print("✅ URL accessibility validation working correctly")
 
-    def test_url_vs_file_job_creation_paths(self, mock_client, test_video_url):
+    def test_url_vs_file_job_creation_paths(
+        self, importer, mock_client, test_video_url
+    ):
         """Test that URL and file videos use different job creation paths."""
         print("🔄 Testing URL vs file job creation paths...")
 
-        from videobgremover.media._importer_internal import Importer
-        from videobgremover.media.context import MediaContext
-
-        ctx = MediaContext()
-        importer = Importer(ctx)
-
         # Mock the client methods
         with (
             patch.object(mock_client, "create_job_url") as mock_create_url,
@@ -174,21 +190,16 @@ class TestURLBasedWorkflows:
 
         print("✅ URL and file videos use correct job creation paths")
 
-    def test_url_webm_workflow_with_image_background(
-        self, mock_client, test_video_url, output_dir
-    ):
-        """Test URL-based WebM workflow with image background - MOCK API + REAL FFMPEG."""
+    @pytest.fixture
+    def url_webm_image_comp(self, mock_client, test_video_url):
+        """URL source processed to WebM, composited over an image background."""
         print(f"🎬 Testing URL-based WebM workflow: {test_video_url}")
 
         with patch(
             "videobgremover.media._importer_internal.Importer.remove_background"
         ) as mock_remove:
-            from videobgremover.media.foregrounds import Foreground
-
             # Mock API to return WebM foreground
-            mock_remove.return_value = Foreground.from_webm_vp9(
-                "test_assets/transparent_webm_vp9.webm"
-            )
+            mock_remove.return_value = _fg_webm()
 
             # Load video from URL (no download occurs)
             video = Video.open(test_video_url)
@@ -200,43 +211,57 @@ class TestURLBasedWorkflows:
             # Execute workflow (API would download and process the URL)
             foreground = video.remove_background(mock_client, options)
 
-            # Verify we got the right format
-            assert foreground.format == "webm_vp9"
-            assert "transparent_webm_vp9.webm" in foreground.primary_path
-
-            # Create composition with image background
-            with patch(
-                "videobgremover.media.backgrounds._probe_image_dimensions"
-            ) as mock_probe:
-                mock_probe.return_value = (1920, 1080)
-                bg = Background.from_image("test_assets/background_image.png")
-                comp = Composition(bg)
-                comp.add(foreground, name="url_webm_layer").at(Anchor.CENTER).size(
-                    SizeMode.CONTAIN
-                )
-
-                # Export with real FFmpeg
-                output_path = output_dir / "url_webm_image_background.mp4"
-                encoder = EncoderProfile.h264(crf=20, preset="fast")
-                comp.to_file(str(output_path), encoder)
-
-                # Verify output
-                assert output_path.exists()
-                assert output_path.stat().st_size > 0
-                print(f"✅ URL-based WebM workflow completed: {output_path}")
-
-    def test_url_stacked_video_workflow(self, mock_client, test_video_url, output_dir):
-        """Test URL-based stacked video workflow - MOCK API + REAL FFMPEG."""
+        # Verify we got the right format
+        assert foreground.format == "webm_vp9"
+        assert "transparent_webm_vp9.webm" in foreground.primary_path
+
+        # Create composition with image background
+        bg = Background.from_image("test_assets/background_image.png")
+
+        comp = Composition(bg)
+        comp.add(foreground, name="url_webm_layer").at(Anchor.CENTER).size(
+            SizeMode.CONTAIN
+        )
+        return comp
+
+    def test_url_webm_workflow_with_image_background(self, url_webm_image_comp):
+        """Test URL-based WebM workflow with image background - MOCK API."""
+        cmd = url_webm_image_comp.dry_run()
+
+        assert_all_present(
+            cmd,
+            [
+                "-loop 1",
+                "background_image.png",
+                "transparent_webm_vp9.webm",
+                "overlay=",
+            ],
+            "Should loop the image and overlay the WebM foreground",
+        )
+
+    @pytest.mark.slow
+    def test_url_webm_workflow_with_image_background_encode(
+        self, url_webm_image_comp, output_dir
+    ):
+        """Export the URL-based WebM workflow - MOCK API + REAL FFMPEG."""
+        output_path = output_dir / "url_webm_image_background.mp4"
+        url_webm_image_comp.to_file(str(output_path), self.ENCODER)
+
+        # Verify output
+        assert_valid_video(output_path)
+        print(f"✅ URL-based WebM workflow completed: {output_path}")
+
+    @pytest.fixture
+    def url_stacked_comp(self, mock_client, test_video_url):
+        """URL source processed to stacked video, over a color background."""
         print(f"📹 Testing URL-based stacked video workflow: {test_video_url}")
 
         with patch(
             "videobgremover.media._importer_internal.Importer.remove_background"
         ) as mock_remove:
-            from videobgremover.media.foregrounds import Foreground
-
             # Mock API to return stacked video foreground
-            mock_remove.return_value = Foreground.from_stacked_video(
-                "test_assets/stacked_video_comparison.mp4"
+            mock_remove.return_value = _format_foreground(
+                "stacked_video", "test_assets/stacked_video_comparison.mp4"
             )
 
             # Load video from URL
@@ -246,39 +271,55 @@ class TestURLBasedWorkflows:
             # Execute workflow
             foreground = video.remove_background(mock_client, options)
 
-            # Verify format
-            assert foreground.format == "stacked_video"
-            assert foreground.primary_path is not None
+        # Verify format
+        assert foreground.format == "stacked_video"
+        assert foreground.primary_path is not None
 
-            # Create composition with color background
-            bg = Background.from_color("#FF0000", 1920, 1080, 30.0)
-            comp = Composition(bg)
-            comp.add(foreground, name="url_stacked_layer").at(Anchor.CENTER).size(
-                SizeMode.COVER
-            )
+        # Create composition with color background
+        bg = Background.from_color("#FF0000", 1920, 1080, 30.0)
+        comp = Composition(bg)
+        comp.add(foreground, name="url_stacked_layer").at(Anchor.CENTER).size(
+            SizeMode.COVER
+        )
+        return comp
+
+    def test_url_stacked_video_workflow(self, url_stacked_comp):
+        """Test URL-based stacked video workflow - MOCK API."""
+        cmd = url_stacked_comp.dry_run()
+
+        assert_all_present(
+            cmd,
+            [
+                "stacked_video_comparison.mp4",
+                "crop=iw:ih/2:0:0",
+                "crop=iw:ih/2:0:ih/2",
+                "alphamerge",
+                "overlay=",
+            ],
+            "Should split the stacked video into RGB and mask halves",
+        )
 
-            # Export
-            output_path = output_dir / "url_stacked_video.mp4"
-            encoder = EncoderProfile.h264(crf=20, preset="medium")
-            comp.to_file(str(output_path), encoder)
+    @pytest.mark.slow
+    def test_url_stacked_video_workflow_encode(self, url_stacked_comp, output_dir):
+        """Export the URL-based stacked video workflow - MOCK API + REAL FFMPEG."""
+        output_path = output_dir / "url_stacked_video.mp4"
+        url_stacked_comp.to_file(str(output_path), self.ENCODER)
 
-            # Verify output
-            assert output_path.exists()
-            assert output_path.stat().st_size > 0
-            print(f"✅ URL-based stacked video workflow completed: {output_path}")
+        # Verify output
+        assert_valid_video(output_path)
+        print(f"✅ URL-based stacked video workflow completed: {output_path}")
 
-    def test_url_pro_bundle_workflow(self, mock_client, test_video_url, output_dir):
-        """Test URL-based pro bundle workflow - MOCK API + REAL FFMPEG."""
+    @pytest.fixture
+    def url_pro_bundle_comp(self, mock_client, test_video_url):
+        """URL source processed to a pro bundle, over a video background."""
         print(f"🎬 Testing URL-based pro bundle workflow: {test_video_url}")
 
         with patch(
             "videobgremover.media._importer_internal.Importer.remove_background"
         ) as mock_remove:
-            from videobgremover.media.foregrounds import Foreground
-
             # Mock API to return pro bundle
-            mock_remove.return_value = Foreground.from_pro_bundle_zip(
-                "test_assets/pro_bundle_multiple_formats.zip"
+            mock_remove.return_value = _format_foreground(
+                "pro_bundle", "test_assets/pro_bundle_multiple_formats.zip"
             )
 
             # Load video from URL
@@ -288,144 +329,117 @@ class TestURLBasedWorkflows:
             # Execute workflow
             foreground = video.remove_background(mock_client, options)
 
-            # Verify format
-            assert foreground.format == "pro_bundle"
-            assert foreground.primary_path is not None
-            assert foreground.mask_path is not None
-
-            # Create composition with video background
-            with patch(
-                "videobgremover.media.backgrounds._probe_video_dimensions"
-            ) as mock_probe:
-                mock_probe.return_value = (1920, 1080, 30.0)
-                bg = Background.from_video("test_assets/background_video.mp4")
-                comp = Composition(bg)
-                comp.add(foreground, name="url_bundle_layer").at(Anchor.CENTER).size(
-                    SizeMode.CONTAIN
-                )
-
-                # Export
-                output_path = output_dir / "url_pro_bundle.mp4"
-                encoder = EncoderProfile.h264(crf=20, preset="medium")
-                comp.to_file(str(output_path), encoder)
-
-                # Verify output
-                assert output_path.exists()
-                assert output_path.stat().st_size > 0
-                print(f"✅ URL-based pro bundle workflow completed: {output_path}")
-
-    def test_url_multi_format_comprehensive(
-        self, mock_client, test_video_url, output_dir
+        # Verify format
+        assert foreground.format == "pro_bundle"
+        assert foreground.primary_path is not None
+        assert foreground.mask_path is not None
+
+        # Create composition with video background
+        bg = Background.from_video("test_assets/background_video.mp4")
+
+        comp = Composition(bg)
+        comp.add(foreground, name="url_bundle_layer").at(Anchor.CENTER).size(
+            SizeMode.CONTAIN
+        )
+        return comp
+
+    def test_url_pro_bundle_workflow(self, url_pro_bundle_comp):
+        """Test URL-based pro bundle workflow - MOCK API."""
+        cmd = url_pro_bundle_comp.dry_run()
+
+        assert_all_present(
+            cmd,
+            [
+                "background_video.mp4",
+                "color.mp4",
+                "alpha.mp4",
+                "alphamerge",
+                "overlay=",
+            ],
+            "Should merge the bundle's color and alpha videos over the background",
+        )
+
+    @pytest.mark.slow
+    def test_url_pro_bundle_workflow_encode(self, url_pro_bundle_comp, output_dir):
+        """Export the URL-based pro bundle workflow - MOCK API + REAL FFMPEG."""
+        output_path = output_dir / "url_pro_bundle.mp4"
+        url_pro_bundle_comp.to_file(str(output_path), self.ENCODER)
+
+        # Verify output
+        assert_valid_video(output_path)
+        print(f"✅ URL-based pro bundle workflow completed: {output_path}")
+
+    def _url_format_comp(self, mock_client, video_url, format_key, test_asset):
+        """Process the URL video to one format and overlay it on a green canvas."""
+        with patch(
+            "videobgremover.media._importer_internal.Importer.remove_background"
+        ) as mock_remove:
+            # Mock appropriate foreground type
+            mock_remove.return_value = _format_foreground(format_key, test_asset)
+
+            # Load video from URL
+            video = Video.open(video_url)
+            assert video.kind == "url"
+
+            options = RemoveBGOptions(prefer=format_key)
+            foreground = video.remove_background(mock_client, options)
+
+        # Verify format
+        assert foreground.format == format_key
+
+        # Every format composites onto the same color source, so a combined
+        # export generates the background only once
+        comp = Composition(URL_FORMAT_BACKGROUND)
+        comp.add(foreground, name=f"url_{format_key}_layer").at(Anchor.CENTER).size(
+            SizeMode.CONTAIN
+        )
+        return comp
+
+    @pytest.mark.parametrize(
+        "format_key,format_name,test_asset",
+        URL_FORMATS,
+        ids=[format_key for format_key, _, _ in URL_FORMATS],
+    )
+    def test_url_single_format(
+        self, mock_client, test_video_url, format_key, format_name, test_asset
     ):
-        """Test all formats with URL source - MOCK API + REAL FFMPEG."""
-        print(f"🎬 Testing all formats with URL source: {test_video_url}")
-
-        formats_to_test = [
-            (
-                "webm_vp9",
-                "WebM VP9",
-                "test_assets/transparent_webm_vp9.webm",
-                "webm_vp9",
-            ),
-            (
-                "mov_prores",
-                "MOV ProRes",
-                "test_assets/transparent_mov_prores.mov",
-                "mov_prores",
-            ),
-            (
-                "stacked_video",
-                "Stacked Video",
-                "test_assets/stacked_video_comparison.mp4",
-                "stacked_video",
-            ),
-            (
-                "pro_bundle",
-                "Pro Bundle",
-                "test_assets/pro_bundle_multiple_formats.zip",
-                "pro_bundle",
-            ),
-        ]
+        """Test one output format with URL source - MOCK API."""
+        if not Path(test_asset).exists():
+            pytest.skip(f"{format_name} test asset not available: {test_asset}")
 
-        results = {}
-
-        for format_key, format_name, test_asset, expected_form in formats_to_test:
-            print(f"  Testing {format_name} with URL source...")
-
-            try:
-                with patch(
-                    "videobgremover.media._importer_internal.Importer.remove_background"
-                ) as mock_remove:
-                    from videobgremover.media.foregrounds import Foreground
-
-                    # Mock appropriate foreground type
-                    if expected_form == "webm_vp9":
-                        mock_remove.return_value = Foreground.from_webm_vp9(test_asset)
-                    elif expected_form == "mov_prores":
-                        mock_remove.return_value = Foreground.from_mov_prores(
-                            test_asset
-                        )
-                    elif expected_form == "pro_bundle":
-                        mock_remove.return_value = Foreground.from_pro_bundle_zip(
-                            test_asset
-                        )
-                    else:  # stacked_video
-                        mock_remove.return_value = Foreground.from_stacked_video(
-                            test_asset
-                        )
-
-                    # Load video from URL
-                    video = Video.open(test_video_url)
-                    assert video.kind == "url"
-
-                    options = RemoveBGOptions(prefer=format_key)
-                    foreground = video.remove_background(mock_client, options)
-
-                    # Verify format
-                    assert foreground.format == expected_form
-
-                    # Create composition
-                    bg = Background.from_color("#00FF00", 1920, 1080, 30.0)
-                    comp = Composition(bg)
-                    comp.add(foreground, name=f"url_{format_key}_layer").at(
-                        Anchor.CENTER
-                    ).size(SizeMode.CONTAIN)
-
-                    # Export
-                    output_path = output_dir / f"url_comprehensive_{format_key}.mp4"
-                    encoder = EncoderProfile.h264(crf=23, preset="fast")
-                    comp.to_file(str(output_path), encoder)
-
-                    # Verify
-                    assert output_path.exists()
-                    assert output_path.stat().st_size > 0
-
-                    results[format_key] = {
-                        "success": True,
-                        "output_path": output_path,
-                        "file_size": output_path.stat().st_size,
-                        "format": expected_form,
-                    }
-
-                    print(
-                        f"    ✅ {format_name}: {expected_form} format, {output_path.stat().st_size} bytes"
-                    )
-
-            except Exception as e:
-                results[format_key] = {"success": False, "error": str(e)}
-                print(f"    ❌ {format_name} failed: {e}")
-
-        # Verify at least 2 formats worked
-        successful_formats = [k for k, v in results.items() if v["success"]]
-        assert len(successful_formats) >= 2, (
-            f"At least 2 formats should work with URL source, got: {successful_formats}"
+        print(f"🎬 Testing {format_name} with URL source: {test_video_url}")
+        comp = self._url_format_comp(
+            mock_client, test_video_url, format_key, test_asset
         )
 
-        print(
-            f"✅ URL-based comprehensive test completed: {len(successful_formats)}/4 formats successful"
+        cmd = comp.dry_run()
+        assert_all_present(
+            cmd,
+            ["color=c=#00FF00", "overlay=", "-map [out]"],
+            f"{format_name} should be overlaid on the color background",
         )
 
-    def test_url_error_handling(self, mock_client):
+    @pytest.mark.slow
+    def test_url_all_formats_encode(self, mock_client, test_video_url, output_dir):
+        """Export every available format with URL source - MOCK API + REAL FFMPEG."""
+        exported = 0
+        for format_key, format_name, test_asset in URL_FORMATS:
+            if not Path(test_asset).exists():
+                print(f"  ⚠️ {format_name} test asset not available: {test_asset}")
+                continue
+            comp = self._url_format_comp(
+                mock_client, test_video_url, format_key, test_asset
+            )
+            output_path = output_dir / f"url_comprehensive_{format_key}.mp4"
+            comp.to_file(str(output_path), self.ENCODER)
+
+            size = assert_valid_video(output_path)
+            print(f"✅ {output_path}: {size} bytes")
+            exported += 1
+
+        assert exported, "No format test assets available"
+
+    def test_url_error_handling(self, importer, mock_client):
         """Test error handling with invalid URLs."""
         print("🎬 Testing URL error handling...")
 
@@ -443,32 +457,26 @@ class TestURLBasedWorkflows:
             # Video.open should still work (no validation at this stage)
             _ = Video.open(invalid_url)  # Video creation should work
 
-            # But URL validation should fail
-            from videobgremover.media._importer_internal import Importer
-            from videobgremover.media.context import MediaContext
+        # But URL validation should fail. The checks are network-bound (DNS
+        # lookups, connection attempts), so run them concurrently.
+        with ThreadPoolExecutor(max_workers=len(invalid_urls)) as executor:
+            results = list(executor.map(importer._public_url_ok, invalid_urls))
 
-            ctx = MediaContext()
-            importer = Importer(ctx)
-
-            is_accessible = importer._public_url_ok(invalid_url)
+        for invalid_url, is_accessible in zip(invalid_urls, results):
             assert not is_accessible, (
                 f"Invalid URL should not be accessible: {invalid_url}"
             )
 
         print("✅ URL error handling test completed")
 
-    def test_url_large_file_size_limit(self, mock_client):
+    def test_url_large_file_size_limit(self, importer, mock_client):
         """Test URL file size limit validation."""
         print("🔍 Testing URL file size limit validation...")
 
-        from videobgremover.media._importer_internal import Importer
-        from videobgremover.media.context import MediaContext
-
-        ctx = MediaContext()
-        importer = Importer(ctx)
+        from videobgremover.media._http import http_session
 
         # Mock a response with large content length (over 1GB limit)
-        with patch("requests.head") as mock_head:
+        with patch.object(http_session(), "head") as mock_head:
             mock_response = Mock()
             mock_response.status_code = 200
             mock_response.headers = {"Content-Length": "2000000000"}  # 2GB
@@ -480,7 +488,7 @@ class TestURLBasedWorkflows:
             assert not is_accessible, "URLs over 1GB should be rejected"
 
         # Mock a response with acceptable size
-        with patch("requests.head") as mock_head:
+        with patch.object(http_session(), "head") as mock_head:
             mock_response = Mock()
             mock_response.status_code = 200
             mock_response.headers = {"Content-Length": "500000000"}  # 500MB
@@ -498,33 +506,25 @@ class TestURLBasedWorkflows:
         print(f"🎨 Testing URL video as background: {test_video_url}")
 
         # Create a mock foreground
-        from videobgremover.media.foregrounds import Foreground
+        fg = _fg_webm()
 
-        fg = Foreground.from_webm_vp9("test_assets/transparent_webm_vp9.webm")
+        # Use URL video as background (probe is stubbed, see stub_background_probes)
+        bg = Background.from_video(test_video_url)
+        assert bg.kind == "video"
+        assert bg.source == test_video_url
 
-        # Use URL video as background (this will probe the URL)
-        with patch(
-            "videobgremover.media.backgrounds._probe_video_dimensions"
-        ) as mock_probe:
-            mock_probe.return_value = (1920, 1080, 30.0)
-
-            # This should work - Background.from_video can handle URLs
-            bg = Background.from_video(test_video_url)
-            assert bg.kind == "video"
-            assert bg.source == test_video_url
-
-            # Create composition
-            comp = Composition(bg)
-            comp.add(fg, name="overlay").at(Anchor.CENTER).size(
-                SizeMode.CONTAIN
-            ).opacity(0.8)
-
-            # Generate FFmpeg command (dry run)
-            cmd = comp.dry_run()
-            assert test_video_url in cmd, "URL should be in FFmpeg command"
-            assert "overlay=" in cmd, "Should have overlay filter"
-
-            print("✅ URL video background composition working correctly")
+        # Create composition
+        comp = Composition(bg)
+        comp.add(fg, name="overlay").at(Anchor.CENTER).size(SizeMode.CONTAIN).opacity(
+            0.8
+        )
+
+        # Generate FFmpeg command (dry run)
+        cmd = comp.dry_run()
+        assert test_video_url in cmd, "URL should be in FFmpeg command"
+        assert "overlay=" in cmd, "Should have overlay filter"
+
+        print("✅ URL video background composition working correctly")
 
 
 if __name__ == "__main__":
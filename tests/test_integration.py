@@ -19,15 +19,22 @@ For local testing:
 - Make sure you have valid API keys configured
 """
 
+import hashlib
+import json
 import os
+import shutil
+import time
 import pytest
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
+from typing import Optional
 from videobgremover import (
     VideoBGRemoverClient,
     Video,
     Background,
     Composition,
-    EncoderProfile,
+    Foreground,
     RemoveBGOptions,
     Prefer,
     Model,
@@ -35,8 +42,34 @@ from videobgremover import (
     SizeMode,
 )
 
+from .conftest import assert_valid_video, get_video_duration, time_null_render
 
-@pytest.fixture
+try:
+    import fcntl
+except ImportError:  # Windows: no cross-worker sharing
+    fcntl = None
+
+
+_STATUS_MESSAGES = {
+    "created": "📋 Job created...",
+    "uploaded": "📤 Video uploaded...",
+    "processing": "🤖 AI processing...",
+    "completed": "✅ Processing completed!",
+    "failed": "❌ Processing failed!",
+}
+
+
+# Test jobs are short, so start polling faster than the SDK's 2 s default
+# (wait() still backs off while the status is unchanged)
+POLL_SECONDS = 0.25
+
+
+def _status_callback(status):
+    """Print a readable line for each job status transition."""
+    print(f"  {_STATUS_MESSAGES.get(status, f'📊 Status: {status}')}")
+
+
+@pytest.fixture(scope="session")
 def api_key():
     """Get API key from environment."""
     from .conftest import get_test_api_key
@@ -50,15 +83,16 @@ def api_key():
     return key
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def client(api_key):
-    """Create API client."""
+    """Create API client shared by the whole session."""
     from .conftest import get_test_base_url
 
-    return VideoBGRemoverClient(api_key, base_url=get_test_base_url())
+    with VideoBGRemoverClient(api_key, base_url=get_test_base_url()) as client:
+        yield client
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_video_url():
     """Sample video URL for testing."""
     from .conftest import get_test_video_sources
@@ -72,7 +106,195 @@ def sample_video_url():
     return url
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def sample_video(sample_video_url):
+    """Sample video opened once and shared (Video only holds its source)."""
+    return Video.open(sample_video_url)
+
+
+# How long a fetched credit balance is trusted before it is re-read
+CREDITS_TTL_SECONDS = 30
+
+
+@pytest.fixture(scope="session")
+def credits_balance(client):
+    """Return a getter for the credit balance, cached for CREDITS_TTL_SECONDS.
+
+    Gated tests share one balance instead of each calling the API, while jobs
+    run earlier in the session are still reflected once the entry expires.
+    """
+    cache = {"fetched_at": None, "balance": None}
+
+    def _get():
+        now = time.monotonic()
+        if (
+            cache["fetched_at"] is None
+            or now - cache["fetched_at"] > CREDITS_TTL_SECONDS
+        ):
+            cache["balance"] = client.credits()
+            cache["fetched_at"] = now
+        return cache["balance"]
+
+    return _get
+
+
+@pytest.fixture(autouse=True)
+def _credits_gate(request):
+    """Skip tests marked ``@pytest.mark.credits(n)`` when the balance is short.
+
+    The balance comes from the session-wide credits_balance cache, so gated
+    tests neither call the API nor check credits themselves.
+    """
+    marker = request.node.get_closest_marker("credits")
+    if marker is None:
+        return
+    needed = marker.args[0]
+    remaining = request.getfixturevalue("credits_balance")().remaining_credits
+    if remaining < needed:
+        pytest.skip(
+            f"Not enough credits for {request.node.name} "
+            f"(need {needed}, have {remaining})"
+        )
+
+
+# Persistent store for processed foregrounds in VBGR_REPLAY=1 runs
+CASSETTE_DIR = Path(__file__).parent / "cassettes"
+
+# Foreground fields that point at downloaded files
+_FOREGROUND_FILES = ("primary_path", "mask_path", "audio_path")
+
+# Public constructors that rebuild a stored foreground from its main file
+_FOREGROUND_LOADERS = {
+    "webm_vp9": Foreground.from_webm_vp9,
+    "mov_prores": Foreground.from_mov_prores,
+    "png_sequence": Foreground.from_png_sequence,
+    "stacked_video": Foreground.from_stacked_video,
+}
+
+
+class _ForegroundStore:
+    """Processed foregrounds kept on disk: a JSON manifest plus files per key.
+
+    Serves as the VBGR_REPLAY cassette and as the hand-off between xdist
+    workers. Loaded foregrounds are rebuilt through the public Foreground
+    constructors, so they are probed exactly like freshly imported ones.
+    """
+
+    def __init__(self, root: Path):
+        self.root = root
+        root.mkdir(parents=True, exist_ok=True)
+
+    @contextmanager
+    def locked(self, key: str):
+        """Hold an exclusive lock on ``key`` across processes (when fcntl exists)."""
+        with open(self.root / f"{key}.lock", "w") as lock:
+            if fcntl is not None:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            yield
+
+    def load(self, key: str) -> Optional[Foreground]:
+        """Rebuild the foreground stored under ``key``, or None if absent."""
+        manifest = self.root / f"{key}.json"
+        if not manifest.exists():
+            return None
+        entry = json.loads(manifest.read_text())
+        # Files are resolved by name so a cassette survives moving the checkout
+        files = {
+            field: str(self.root / key / Path(entry[field]).name)
+            for field in _FOREGROUND_FILES
+            if entry.get(field)
+        }
+        if entry["format"] == "pro_bundle":
+            return Foreground.from_video_and_mask(
+                files["primary_path"],
+                files["mask_path"],
+                files.get("audio_path"),
+                matte=entry.get("matte", False),
+            )
+        return _FOREGROUND_LOADERS[entry["format"]](files["primary_path"])
+
+    def save(self, key: str, foreground: Foreground) -> None:
+        """Copy a foreground's files under ``key`` and write its manifest."""
+        files_dir = self.root / key
+        files_dir.mkdir(exist_ok=True)
+        entry = {"format": foreground.format, "matte": foreground.matte}
+        for field in _FOREGROUND_FILES:
+            path = getattr(foreground, field)
+            if path and Path(path).is_file():
+                entry[field] = Path(shutil.copy(path, files_dir / Path(path).name)).name
+        (self.root / f"{key}.json").write_text(json.dumps(entry))
+
+
+@pytest.fixture(scope="session")
+def processed_foreground(client, sample_video, tmp_path_factory):
+    """Process sample_video once per format and share the result.
+
+    Returns a getter ``processed_foreground(prefer, on_status=None)``. The
+    first call for a format runs the real API job (consuming credits); later
+    calls, from any test in the session, reuse the downloaded foreground.
+    ``on_status`` only fires when the job actually runs.
+
+    ``processed_foreground.prefetch(prefers, on_status=None)`` submits the
+    jobs for several formats at once, so the API processes them concurrently
+    instead of one after another.
+
+    Under pytest-xdist, or with ``VBGR_REPLAY=1``, results also go through a
+    _ForegroundStore: shared by workers via a directory next to their temp
+    dirs, or persisted across runs under CASSETTE_DIR respectively.
+    """
+    cache = {}
+    store = None
+    if os.getenv("VBGR_REPLAY") == "1":
+        # One cassette per source video, so a new TEST_VIDEO_URL records anew
+        digest = hashlib.sha1(sample_video.src.encode()).hexdigest()[:12]
+        store = _ForegroundStore(CASSETTE_DIR / digest)
+    elif fcntl is not None and os.getenv("PYTEST_XDIST_WORKER"):
+        store = _ForegroundStore(
+            tmp_path_factory.getbasetemp().parent / "processed_foregrounds"
+        )
+
+    def _process(prefer, on_status):
+        return sample_video.remove_background(
+            client,
+            RemoveBGOptions(prefer=prefer),
+            on_status=on_status,
+            wait_poll_seconds=POLL_SECONDS,
+        )
+
+    def _get(prefer, on_status=None):
+        prefer = Prefer(prefer)
+        if prefer in cache:
+            return cache[prefer]
+        if store is None:
+            cache[prefer] = _process(prefer, on_status)
+            return cache[prefer]
+
+        # The first worker to need a format processes it, the others wait on
+        # the lock and load its copy (which also outlives the worker's context)
+        with store.locked(prefer.value):
+            foreground = store.load(prefer.value)
+            if foreground is None:
+                store.save(prefer.value, _process(prefer, on_status))
+                foreground = store.load(prefer.value)
+        cache[prefer] = foreground
+        return foreground
+
+    def _prefetch(prefers, on_status=None):
+        missing = [p for p in dict.fromkeys(map(Prefer, prefers)) if p not in cache]
+        if len(missing) < 2:
+            return
+        with ThreadPoolExecutor(max_workers=len(missing)) as pool:
+            futures = [pool.submit(_get, p, on_status) for p in missing]
+        for future in futures:
+            # A failed format is not cached; the error resurfaces when the
+            # test asks for that format
+            future.exception()
+
+    _get.prefetch = _prefetch
+    return _get
+
+
+@pytest.fixture(scope="session")
 def test_backgrounds():
     """Get test background assets."""
     from .conftest import get_test_backgrounds
@@ -89,18 +311,37 @@ def test_backgrounds():
     return backgrounds
 
 
+@pytest.fixture(scope="session")
+def bg_image(test_backgrounds):
+    """Image background built once and shared (backgrounds are immutable)."""
+    if not test_backgrounds["image"]:
+        pytest.skip("Set TEST_BACKGROUND_IMAGE to run image background tests")
+    return Background.from_image(test_backgrounds["image"])
+
+
+@pytest.fixture(scope="session")
+def bg_video(test_backgrounds):
+    """Video background built once and shared, or None when not configured."""
+    if not test_backgrounds["video"]:
+        return None
+    return Background.from_video(test_backgrounds["video"])
+
+
 @pytest.fixture
-def output_dir():
+def output_dir(output_root):
     """Create output directory for test results."""
-    output_path = Path("test_outputs")
-    output_path.mkdir(exist_ok=True)
-    return output_path
+    return output_root
 
 
 @pytest.mark.integration
 class TestRealIntegration:
     """Real integration tests - NO MOCKING."""
 
+    @pytest.fixture(autouse=True)
+    def _encoder(self, test_encoder):
+        """Shared by every export in the class; see the test_encoder fixture."""
+        self.ENCODER = test_encoder
+
     def test_credits_check(self, client):
         """Test checking credit balance."""
         credits = client.credits()
@@ -112,36 +353,15 @@ class TestRealIntegration:
 
         print(f"✅ Credits: {credits.remaining_credits}/{credits.total_credits}")
 
+    @pytest.mark.credits(15)
     def test_webm_processing_and_composition(
-        self, client, sample_video_url, test_backgrounds, output_dir
+        self, processed_foreground, bg_image, output_dir
     ):
         """Test WebM processing and composition with real background - NO MOCKING."""
-        # Check credits first
-        credits = client.credits()
-        if credits.remaining_credits < 15:
-            pytest.skip("Not enough credits for WebM processing test")
-
         print("🎬 Processing video with WebM VP9 transparency...")
 
-        # Load video
-        video = Video.open(sample_video_url)
-
-        # Configure for WebM output
-        options = RemoveBGOptions(prefer=Prefer.WEBM_VP9)
-
         # Process video (REAL API CALL - consumes credits!)
-        def status_callback(status):
-            status_messages = {
-                "created": "📋 Job created...",
-                "uploaded": "📤 Video uploaded...",
-                "processing": "🤖 AI processing...",
-                "completed": "✅ Processing completed!",
-                "failed": "❌ Processing failed!",
-            }
-            message = status_messages.get(status, f"📊 Status: {status}")
-            print(f"  {message}")
-
-        foreground = video.remove_background(client, options, on_status=status_callback)
+        foreground = processed_foreground(Prefer.WEBM_VP9, on_status=_status_callback)
 
         # Verify we got a result
         assert foreground is not None
@@ -154,39 +374,26 @@ class TestRealIntegration:
         print(f"✅ WebM processing completed: {foreground.format} format")
 
         # Create composition with real image background
-        bg = Background.from_image(test_backgrounds["image"])
+        bg = bg_image
         comp = Composition(bg)
         comp.add(foreground, name="main_video").at(Anchor.CENTER).size(SizeMode.CONTAIN)
 
         # Export composition (REAL FFMPEG CALL)
         output_path = output_dir / "webm_real_background.mp4"
-        encoder = EncoderProfile.h264(crf=20, preset="medium")
+        encoder = self.ENCODER
         comp.to_file(str(output_path), encoder)
 
         # Verify output
-        assert output_path.exists()
-        assert output_path.stat().st_size > 0
+        assert_valid_video(output_path)
         print(f"✅ Real composition exported: {output_path}")
 
-    def test_stacked_video_processing(
-        self, client, sample_video_url, test_backgrounds, output_dir
-    ):
+    @pytest.mark.credits(15)
+    def test_stacked_video_processing(self, processed_foreground, bg_video, output_dir):
         """Test stacked video processing with real video background - NO MOCKING."""
-        # Check credits
-        credits = client.credits()
-        if credits.remaining_credits < 15:
-            pytest.skip("Not enough credits for stacked video test")
-
         print("📹 Processing video with stacked video format...")
 
-        # Load video
-        video = Video.open(sample_video_url)
-
-        # Configure for stacked video output
-        options = RemoveBGOptions(prefer=Prefer.STACKED_VIDEO)
-
-        # Process video (REAL API CALL)
-        foreground = video.remove_background(client, options)
+        # Process video (REAL API CALL, shared across the session)
+        foreground = processed_foreground(Prefer.STACKED_VIDEO)
 
         assert foreground is not None
         # API should return stacked_video format when requested
@@ -197,7 +404,7 @@ class TestRealIntegration:
         print(f"✅ Stacked video processing completed: {foreground.format} format")
 
         # Create composition with real background video
-        bg = Background.from_video(test_backgrounds["video"])
+        bg = bg_video
         comp = Composition(bg)
         comp.add(foreground, name="main_video").at(Anchor.CENTER).size(
             SizeMode.CONTAIN
@@ -205,188 +412,89 @@ class TestRealIntegration:
 
         # Export composition (REAL FFMPEG CALL)
         output_path = output_dir / "stacked_video_background.mp4"
-        encoder = EncoderProfile.h264(crf=18, preset="medium")
+        encoder = self.ENCODER
         comp.to_file(str(output_path), encoder)
 
         # Verify output
-        assert output_path.exists()
-        assert output_path.stat().st_size > 0
+        assert_valid_video(output_path)
         print(f"✅ Stacked composition exported: {output_path}")
 
-    def test_webm_vp9_format_real_api(self, client, sample_video_url, output_dir):
-        """Test WebM VP9 format with real API - REAL API CALLS."""
-        credits = client.credits()
-        if credits.remaining_credits < 15:
-            pytest.skip("Not enough credits for WebM VP9 test")
-
-        print("🎬 Testing WebM VP9 format (real API)...")
-
-        # Load video and configure for WebM VP9
-        video = Video.open(sample_video_url)
-        options = RemoveBGOptions(prefer=Prefer.WEBM_VP9)
-
-        # Process video (REAL API CALL)
-        foreground = video.remove_background(client, options)
-
-        # Verify result and format
-        assert foreground is not None
-        assert foreground.format == "webm_vp9"
-        assert foreground.primary_path is not None
-        assert foreground.primary_path.endswith(".webm")
-        print(f"✅ WebM VP9 processing completed: {foreground.format} format")
-
-        # Create composition with image background
-        bg = Background.from_image("test_assets/background_image.png")
-        comp = Composition(bg)
-        comp.add(foreground, name="webm_layer").at(Anchor.CENTER).size(SizeMode.CONTAIN)
-
-        # Export (REAL FFMPEG CALL)
-        output_path = output_dir / "integration_webm_vp9.mp4"
-        encoder = EncoderProfile.h264(crf=23, preset="fast")
-        comp.to_file(str(output_path), encoder)
-
-        # Verify output
-        assert output_path.exists()
-        assert output_path.stat().st_size > 0
-        print(f"✅ WebM VP9 integration test completed: {output_path}")
-
-    def test_mov_prores_format_real_api(self, client, sample_video_url, output_dir):
-        """Test MOV ProRes format with real API - REAL API CALLS."""
-        credits = client.credits()
-        if credits.remaining_credits < 15:
-            pytest.skip("Not enough credits for MOV ProRes test")
-
-        print("🎬 Testing MOV ProRes format (real API)...")
-
-        # Load video and configure for MOV ProRes
-        video = Video.open(sample_video_url)
-        options = RemoveBGOptions(prefer=Prefer.MOV_PRORES)
+    @pytest.mark.parametrize(
+        "prefer,expected_format,ext,background",
+        [
+            (Prefer.WEBM_VP9, "webm_vp9", ".webm", "image"),
+            (Prefer.MOV_PRORES, "mov_prores", ".mov", "video"),
+            (Prefer.STACKED_VIDEO, None, None, "color"),
+            (Prefer.PRO_BUNDLE, "pro_bundle", None, "image"),
+        ],
+        ids=["webm_vp9", "mov_prores", "stacked_video", "pro_bundle"],
+    )
+    @pytest.mark.credits(15)
+    def test_format_real_api(
+        self,
+        processed_foreground,
+        prefer,
+        expected_format,
+        ext,
+        background,
+        bg_image,
+        bg_video,
+    ):
+        """Test each output format with real API - REAL API CALLS."""
+        print(f"🎬 Testing {prefer.value} format (real API)...")
 
-        # Process video (REAL API CALL)
-        foreground = video.remove_background(client, options)
+        # Process video (REAL API CALL, shared across the session)
+        foreground = processed_foreground(prefer)
 
         # Verify result and format
         assert foreground is not None
-        assert foreground.format == "mov_prores"
         assert foreground.primary_path is not None
-        assert foreground.primary_path.endswith(".mov")
-        print(f"✅ MOV ProRes processing completed: {foreground.format} format")
-
-        # Create composition with video background
-        bg = Background.from_video("test_assets/background_video.mp4")
-        comp = Composition(bg)
-        comp.add(foreground, name="prores_layer").at(Anchor.CENTER).size(
-            SizeMode.CONTAIN
-        )
-        # Audio will default to foreground audio
-
-        # Export (REAL FFMPEG CALL)
-        output_path = output_dir / "integration_mov_prores.mp4"
-        encoder = EncoderProfile.h264(crf=23, preset="fast")
-        comp.to_file(str(output_path), encoder)
-
-        # Verify output
-        assert output_path.exists()
-        assert output_path.stat().st_size > 0
-        print(f"✅ MOV ProRes integration test completed: {output_path}")
-
-    def test_stacked_video_format_real_api(self, client, sample_video_url, output_dir):
-        """Test Stacked Video format with real API - REAL API CALLS."""
-        credits = client.credits()
-        if credits.remaining_credits < 15:
-            pytest.skip("Not enough credits for Stacked Video test")
-
-        print("🎬 Testing Stacked Video format (real API)...")
-
-        # Load video and configure for Stacked Video
-        video = Video.open(sample_video_url)
-        options = RemoveBGOptions(prefer=Prefer.STACKED_VIDEO)
-
-        # Process video (REAL API CALL)
-        foreground = video.remove_background(client, options)
-
-        # Verify result
-        assert foreground is not None
-        print(f"✅ Stacked Video processing completed: {foreground.format} format")
-
-        # Create composition with color background
-        bg = Background.from_color("#FF0000", 1920, 1080, 30.0)
-        comp = Composition(bg)
-        comp.add(foreground, name="stacked_layer").at(Anchor.CENTER).size(
-            SizeMode.CONTAIN
-        )
-
-        # Export (REAL FFMPEG CALL)
-        output_path = output_dir / "integration_stacked_video.mp4"
-        encoder = EncoderProfile.h264(crf=23, preset="fast")
-        comp.to_file(str(output_path), encoder)
-
-        # Verify output
-        assert output_path.exists()
-        assert output_path.stat().st_size > 0
-        print(f"✅ Stacked Video integration test completed: {output_path}")
-
-    def test_pro_bundle_format_real_api(self, client, sample_video_url, output_dir):
-        """Test Pro Bundle format with real API - REAL API CALLS."""
-        credits = client.credits()
-        if credits.remaining_credits < 15:
-            pytest.skip("Not enough credits for Pro Bundle test")
-
-        print("🎬 Testing Pro Bundle format (real API)...")
-
-        # Load video and configure for Pro Bundle
-        video = Video.open(sample_video_url)
-        options = RemoveBGOptions(prefer=Prefer.PRO_BUNDLE)
-
-        # Process video (REAL API CALL)
-        foreground = video.remove_background(client, options)
-
-        # Verify result and format
-        assert foreground is not None
-        assert foreground.format == "pro_bundle"
-        assert foreground.primary_path is not None  # RGB video
-        assert foreground.mask_path is not None  # Mask video
-        # Audio path may or may not be present
-        print(f"✅ Pro Bundle processing completed: {foreground.format} format")
-        print(f"  RGB video: {foreground.primary_path}")
-        print(f"  Mask video: {foreground.mask_path}")
-        if foreground.audio_path:
-            print(f"  Audio: {foreground.audio_path}")
-
-        # Create composition with image background
-        bg = Background.from_image("test_assets/background_image.png")
+        if expected_format:
+            assert foreground.format == expected_format
+        if ext:
+            assert foreground.primary_path.endswith(ext)
+        if foreground.format == "pro_bundle":
+            # RGB video plus mask video; audio may or may not be present
+            assert foreground.mask_path is not None
+            print(f"  Mask video: {foreground.mask_path}")
+        print(f"✅ {prefer.value} processing completed: {foreground.format} format")
+
+        if background == "image":
+            bg = bg_image
+        elif background == "video":
+            if bg_video is None:
+                pytest.skip("No video background configured for testing")
+            # Audio will default to foreground audio
+            bg = bg_video
+        else:
+            bg = Background.from_color("#FF0000", 1920, 1080, 30.0)
         comp = Composition(bg)
-        comp.add(foreground, name="bundle_layer").at(Anchor.CENTER).size(
+        comp.add(foreground, name=f"{prefer.value}_layer").at(Anchor.CENTER).size(
             SizeMode.CONTAIN
         )
 
-        # Export (REAL FFMPEG CALL)
-        output_path = output_dir / "integration_pro_bundle.mp4"
-        encoder = EncoderProfile.h264(crf=23, preset="fast")
-        comp.to_file(str(output_path), encoder)
-
-        # Verify output
-        assert output_path.exists()
-        assert output_path.stat().st_size > 0
-        print(f"✅ Pro Bundle integration test completed: {output_path}")
+        # Run the pipeline into the null muxer (REAL FFMPEG CALL); raises if
+        # FFmpeg fails. Real encodes are covered by the comprehensive test.
+        elapsed = time_null_render(comp)
+        print(f"✅ {prefer.value} integration test completed in {elapsed:.1f}s")
 
+    @pytest.mark.credits(20)
     def test_complete_api_workflow_url_to_composition(
-        self, client, sample_video_url, test_backgrounds, output_dir
+        self,
+        sample_video,
+        processed_foreground,
+        bg_image,
+        output_dir,
     ):
         """Test complete API workflow: URL → Background Removal → Composition → Export."""
-        # Check credits first
-        credits = client.credits()
-        if credits.remaining_credits < 20:
-            pytest.skip("Not enough credits for complete workflow test")
-
         print(
             "🔄 Testing complete API workflow: URL → BG Removal → Composition → Export..."
         )
 
         # Step 1: Load video from URL (no download yet)
         print("📹 Step 1: Loading video from URL...")
-        video = Video.open(sample_video_url)
-        assert video.src == sample_video_url
+        video = sample_video
+        assert video.src.startswith(("http://", "https://"))
         print(f"✅ Video loaded: {video.src}")
 
         # Step 2: Remove background with different format preferences
@@ -396,25 +504,14 @@ class TestRealIntegration:
             ("pro_bundle", "Pro bundle (ZIP with separate files)"),
         ]
 
+        processed_foreground.prefetch(
+            [prefer for prefer, _ in formats_to_test], on_status=_status_callback
+        )
+
         for prefer_format, description in formats_to_test:
             print(f"\n🎨 Step 2: Processing with {description}...")
 
-            options = RemoveBGOptions(prefer=prefer_format)
-
-            def status_callback(status):
-                status_messages = {
-                    "created": "📋 Job created...",
-                    "uploaded": "📤 Video uploaded...",
-                    "processing": "🤖 AI processing...",
-                    "completed": "✅ Processing completed!",
-                    "failed": "❌ Processing failed!",
-                }
-                message = status_messages.get(status, f"📊 Status: {status}")
-                print(f"  {message}")
-
-            foreground = video.remove_background(
-                client, options, on_status=status_callback
-            )
+            foreground = processed_foreground(prefer_format, on_status=_status_callback)
 
             # Verify processing result
             assert foreground is not None
@@ -422,7 +519,6 @@ class TestRealIntegration:
 
             # Step 3: Create composition with image background
             print("🖼️ Step 3: Creating composition with image background...")
-            bg_image = Background.from_image(test_backgrounds["image"])
             comp = Composition(bg_image)
 
             # Add foreground with positioning and sizing
@@ -432,51 +528,45 @@ class TestRealIntegration:
             # Step 4: Export final composition
             print("📤 Step 4: Exporting final composition...")
             output_path = output_dir / f"api_workflow_{prefer_format}.mp4"
-            encoder = EncoderProfile.h264(crf=20, preset="medium")
+            encoder = self.ENCODER
             comp.to_file(str(output_path), encoder)
 
             # Verify final output
-            assert output_path.exists()
-            assert output_path.stat().st_size > 0
+            assert_valid_video(output_path)
             print(f"✅ Complete workflow exported: {output_path}")
 
         print("🎉 Complete API workflow test passed for all formats!")
 
+    @pytest.mark.credits(15)
     def test_api_workflow_with_video_background(
-        self, client, sample_video_url, test_backgrounds, output_dir
+        self,
+        processed_foreground,
+        bg_video,
+        output_dir,
     ):
         """Test API workflow with video background composition."""
-        # Check credits and video background availability
-        credits = client.credits()
-        if credits.remaining_credits < 15:
-            pytest.skip("Not enough credits for video background workflow test")
-
-        if not test_backgrounds["video"]:
+        # Check video background availability
+        if bg_video is None:
             pytest.skip("No video background configured for testing")
 
         print("🎬 Testing API workflow with video background...")
 
         # Process foreground
-        video = Video.open(sample_video_url)
-        options = RemoveBGOptions(prefer=Prefer.WEBM_VP9)  # Fast format for this test
-
-        foreground = video.remove_background(client, options)
+        foreground = processed_foreground(Prefer.WEBM_VP9)  # Fast format for this test
         assert foreground is not None
         print("✅ Foreground processing completed")
 
         # Create composition with video background
-        bg_video = Background.from_video(test_backgrounds["video"])
         comp = Composition(bg_video)
         comp.add(foreground).at(Anchor.CENTER).size(SizeMode.CONTAIN)
 
         # Export with video background
         output_path = output_dir / "api_workflow_video_bg.mp4"
-        encoder = EncoderProfile.h264(crf=22, preset="fast")
+        encoder = self.ENCODER
         comp.to_file(str(output_path), encoder)
 
         # Verify output
-        assert output_path.exists()
-        assert output_path.stat().st_size > 0
+        assert_valid_video(output_path)
         print(f"✅ Video background workflow completed: {output_path}")
 
     def test_api_error_handling_and_recovery(self, client, output_dir):
@@ -513,19 +603,14 @@ class TestRealIntegration:
         except Exception as e:
             pytest.fail(f"API connectivity failed: {e}")
 
+    @pytest.mark.credits(30)
     def test_api_batch_processing_simulation(
-        self, client, sample_video_url, test_backgrounds, output_dir
+        self, processed_foreground, bg_image, output_dir
     ):
         """Test processing multiple videos in sequence (batch-like workflow)."""
-        credits = client.credits()
-        if credits.remaining_credits < 30:  # Need more credits for batch test
-            pytest.skip("Not enough credits for batch processing simulation")
-
         print("📦 Testing batch-like processing workflow...")
 
         # Simulate processing the same video with different settings
-        video = Video.open(sample_video_url)
-
         batch_configs = [
             {"prefer": "webm_vp9", "name": "fast_webm"},
             {"prefer": "stacked_video", "name": "stacked_format"},
@@ -538,17 +623,16 @@ class TestRealIntegration:
                 f"\n🔄 Processing batch item {i + 1}/{len(batch_configs)}: {config['name']}..."
             )
 
-            options = RemoveBGOptions(prefer=config["prefer"])
-            foreground = video.remove_background(client, options)
+            foreground = processed_foreground(config["prefer"])
 
             # Create composition
-            bg = Background.from_image(test_backgrounds["image"])
+            bg = bg_image
             comp = Composition(bg)
             comp.add(foreground).at(Anchor.CENTER).size(SizeMode.CONTAIN)
 
             # Export
             output_path = output_dir / f"batch_{config['name']}.mp4"
-            encoder = EncoderProfile.h264(crf=23, preset="fast")
+            encoder = self.ENCODER
             comp.to_file(str(output_path), encoder)
 
             results.append(
@@ -565,23 +649,18 @@ class TestRealIntegration:
 
         # Verify all batch results
         for result in results:
-            assert result["output"].exists()
-            assert result["output"].stat().st_size > 0
+            assert_valid_video(result["output"])
 
         print(
             f"🎉 Batch processing simulation completed: {len(results)} items processed"
         )
 
+    @pytest.mark.slow
+    @pytest.mark.credits(60)
     def test_all_formats_comprehensive_real_api(
-        self, client, sample_video_url, test_backgrounds, output_dir
+        self, processed_foreground, bg_image, output_dir
     ):
         """Test all format preferences with real API calls - REAL API + REAL FFMPEG."""
-        credits = client.credits()
-        if credits.remaining_credits < 60:  # Need credits for 4 formats
-            pytest.skip(
-                "Not enough credits for comprehensive format testing (need ~60 credits)"
-            )
-
         print("🎬 Testing ALL format preferences with REAL API calls...")
 
         formats_to_test = [
@@ -592,29 +671,17 @@ class TestRealIntegration:
         ]
 
         results = {}
+        processed_foreground.prefetch(
+            [prefer for prefer, _, _ in formats_to_test], on_status=_status_callback
+        )
 
         for format_key, description, expected_form in formats_to_test:
             print(f"\n🎨 Processing with {description}...")
 
             try:
-                # Load video from URL
-                video = Video.open(sample_video_url)
-                options = RemoveBGOptions(prefer=format_key)
-
-                def status_callback(status):
-                    status_messages = {
-                        "created": "📋 Job created...",
-                        "uploaded": "📤 Video uploaded...",
-                        "processing": "🤖 AI processing...",
-                        "completed": "✅ Processing completed!",
-                        "failed": "❌ Processing failed!",
-                    }
-                    message = status_messages.get(status, f"📊 Status: {status}")
-                    print(f"  {message}")
-
-                # REAL API CALL - This will consume credits!
-                foreground = video.remove_background(
-                    client, options, on_status=status_callback
+                # REAL API CALL (once per format per session) - consumes credits!
+                foreground = processed_foreground(
+                    format_key, on_status=_status_callback
                 )
 
                 # Verify processing result
@@ -623,7 +690,6 @@ class TestRealIntegration:
                 print(f"✅ {description} completed: {foreground.format} format")
 
                 # Test composition with image background
-                bg_image = Background.from_image(test_backgrounds["image"])
                 comp = Composition(bg_image)
 
                 # Add foreground with specific positioning for each format
@@ -646,24 +712,21 @@ class TestRealIntegration:
 
                 # Export final composition
                 output_path = output_dir / f"real_api_{format_key}.mp4"
-                encoder = EncoderProfile.h264(crf=20, preset="medium")
+                encoder = self.ENCODER
                 comp.to_file(str(output_path), encoder)
 
                 # Verify final output
-                assert output_path.exists()
-                assert output_path.stat().st_size > 0
+                file_size = assert_valid_video(output_path)
 
                 results[format_key] = {
                     "success": True,
                     "output_path": output_path,
-                    "file_size": output_path.stat().st_size,
+                    "file_size": file_size,
                     "format": expected_form,
                     "foreground": foreground,
                 }
 
-                print(
-                    f"✅ {description} exported: {output_path} ({output_path.stat().st_size} bytes)"
-                )
+                print(f"✅ {description} exported: {output_path} ({file_size} bytes)")
 
             except Exception as e:
                 results[format_key] = {"success": False, "error": str(e)}
@@ -683,8 +746,7 @@ class TestRealIntegration:
         if len(successful_formats) >= 2:
             print("\n🎬 Creating multi-format composition showcase...")
 
-            bg_showcase = Background.from_image(test_backgrounds["image"])
-            comp_showcase = Composition(bg_showcase)
+            comp_showcase = Composition(bg_image)
 
             positions = [
                 (Anchor.TOP_LEFT, 50, 50),
@@ -704,116 +766,111 @@ class TestRealIntegration:
             output_showcase = output_dir / "real_api_multi_format_showcase.mp4"
             comp_showcase.to_file(str(output_showcase), encoder)
 
-            assert output_showcase.exists()
+            assert_valid_video(output_showcase)
             print(f"✅ Multi-format showcase: {output_showcase}")
 
+    @pytest.mark.credits(30)
     def test_file_vs_url_processing_comparison(
-        self, client, sample_video_url, test_backgrounds, output_dir
+        self,
+        client,
+        processed_foreground,
+        bg_image,
+        output_dir,
     ):
         """Test file upload vs URL processing with same video - REAL API."""
-        credits = client.credits()
-        if (
-            credits.remaining_credits < 30
-        ):  # Need credits for both file and URL processing
-            pytest.skip("Not enough credits for file vs URL comparison test")
-
         print("⚖️ Testing file upload vs URL processing comparison...")
 
-        # Test 1: URL-based processing
-        print("\n🌐 Test 1: URL-based processing...")
-        video_url = Video.open(sample_video_url)
-        options_url = RemoveBGOptions(prefer="webm_vp9")  # Use fast format
+        file_asset = "test_assets/default_green_screen.mp4"
+        if not Path(file_asset).exists():
+            pytest.skip(f"File upload asset not found: {file_asset}")
+
+        # The two jobs are independent: submit the file upload first so the
+        # API processes it while the URL result is fetched and exported.
+        # Leaving the block waits for the upload job even if a check fails
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            file_job = executor.submit(
+                Video.open(file_asset).remove_background,
+                client,
+                RemoveBGOptions(prefer="webm_vp9"),  # Same format for comparison
+                wait_poll_seconds=POLL_SECONDS,
+            )
 
-        foreground_url = video_url.remove_background(client, options_url)
-        assert foreground_url is not None
-        print(f"✅ URL processing completed: {foreground_url.format} format")
+            # Test 1: URL-based processing
+            print("\n🌐 Test 1: URL-based processing...")
+            foreground_url = processed_foreground("webm_vp9")  # Use fast format
+            assert foreground_url is not None
+            print(f"✅ URL processing completed: {foreground_url.format} format")
 
-        # Create composition from URL result
-        bg = Background.from_image(test_backgrounds["image"])
-        comp_url = Composition(bg)
-        comp_url.add(foreground_url, name="url_result").at(Anchor.CENTER).size(
-            SizeMode.CONTAIN
-        )
+            # Create composition from URL result
+            bg = bg_image
+            comp_url = Composition(bg)
+            comp_url.add(foreground_url, name="url_result").at(Anchor.CENTER).size(
+                SizeMode.CONTAIN
+            )
 
-        output_url = output_dir / "real_api_url_processing.mp4"
-        encoder = EncoderProfile.h264(crf=22, preset="fast")
-        comp_url.to_file(str(output_url), encoder)
+            output_url = output_dir / "real_api_url_processing.mp4"
+            encoder = self.ENCODER
+            comp_url.to_file(str(output_url), encoder)
 
-        assert output_url.exists()
-        url_file_size = output_url.stat().st_size
-        print(f"✅ URL result exported: {output_url} ({url_file_size} bytes)")
+            url_file_size = assert_valid_video(output_url)
+            print(f"✅ URL result exported: {output_url} ({url_file_size} bytes)")
 
-        # Test 2: File upload processing (if we have a local test file)
-        print("\n📁 Test 2: File upload processing...")
-        try:
-            # Use a local test file
-            video_file = Video.open("test_assets/default_green_screen.mp4")
-            options_file = RemoveBGOptions(
-                prefer="webm_vp9"
-            )  # Same format for comparison
-
-            foreground_file = video_file.remove_background(client, options_file)
-            assert foreground_file is not None
-            print(f"✅ File processing completed: {foreground_file.format} format")
-
-            # Create composition from file result
-            comp_file = Composition(bg)
-            comp_file.add(foreground_file, name="file_result").at(Anchor.CENTER).size(
-                SizeMode.CONTAIN
-            )
+            # Test 2: File upload processing
+            print("\n📁 Test 2: File upload processing...")
+            foreground_file = file_job.result()
 
-            output_file = output_dir / "real_api_file_processing.mp4"
-            comp_file.to_file(str(output_file), encoder)
+        assert foreground_file is not None
+        print(f"✅ File processing completed: {foreground_file.format} format")
 
-            assert output_file.exists()
-            file_file_size = output_file.stat().st_size
-            print(f"✅ File result exported: {output_file} ({file_file_size} bytes)")
+        # Create composition from file result
+        comp_file = Composition(bg)
+        comp_file.add(foreground_file, name="file_result").at(Anchor.CENTER).size(
+            SizeMode.CONTAIN
+        )
 
-            # Create side-by-side comparison
-            print("\n🔄 Creating side-by-side comparison...")
-            comp_comparison = Composition(bg)
-            comp_comparison.add(foreground_url, name="url_side").at(
-                Anchor.CENTER_LEFT, dx=100
-            ).size(SizeMode.CANVAS_PERCENT, percent=40)
-            comp_comparison.add(foreground_file, name="file_side").at(
-                Anchor.CENTER_RIGHT, dx=-100
-            ).size(SizeMode.CANVAS_PERCENT, percent=40)
+        output_file = output_dir / "real_api_file_processing.mp4"
+        comp_file.to_file(str(output_file), encoder)
 
-            output_comparison = output_dir / "real_api_url_vs_file_comparison.mp4"
-            comp_comparison.to_file(str(output_comparison), encoder)
+        file_file_size = assert_valid_video(output_file)
+        print(f"✅ File result exported: {output_file} ({file_file_size} bytes)")
 
-            assert output_comparison.exists()
-            print(f"✅ Side-by-side comparison: {output_comparison}")
+        # Create side-by-side comparison
+        print("\n🔄 Creating side-by-side comparison...")
+        comp_comparison = Composition(bg)
+        comp_comparison.add(foreground_url, name="url_side").at(
+            Anchor.CENTER_LEFT, dx=100
+        ).size(SizeMode.CANVAS_PERCENT, percent=40)
+        comp_comparison.add(foreground_file, name="file_side").at(
+            Anchor.CENTER_RIGHT, dx=-100
+        ).size(SizeMode.CANVAS_PERCENT, percent=40)
 
-        except Exception as e:
-            print(f"⚠️ File processing test skipped: {e}")
-            print(
-                "   (This is normal if test_assets/default_green_screen.mp4 doesn't exist)"
-            )
+        output_comparison = output_dir / "real_api_url_vs_file_comparison.mp4"
+        comp_comparison.to_file(str(output_comparison), encoder)
+
+        assert_valid_video(output_comparison)
+        print(f"✅ Side-by-side comparison: {output_comparison}")
 
         print("✅ File vs URL processing comparison completed")
 
+    @pytest.mark.credits(20)
     def test_composition_options_comprehensive(
-        self, client, sample_video_url, test_backgrounds, output_dir
+        self,
+        processed_foreground,
+        bg_image,
+        bg_video,
+        output_dir,
     ):
         """Test comprehensive composition options with real API - REAL API + REAL FFMPEG."""
-        credits = client.credits()
-        if credits.remaining_credits < 20:
-            pytest.skip("Not enough credits for composition options test")
-
         print("🎨 Testing comprehensive composition options with REAL API...")
 
         # Get a processed foreground to work with
-        video = Video.open(sample_video_url)
-        options = RemoveBGOptions(prefer=Prefer.WEBM_VP9)  # Fast format for testing
-
-        foreground = video.remove_background(client, options)
+        foreground = processed_foreground(Prefer.WEBM_VP9)  # Fast format for testing
         assert foreground is not None
         print(f"✅ Foreground processed: {foreground.format} format")
 
         # Test 1: Different anchor positions
         print("\n⚓ Test 1: Testing different anchor positions...")
-        bg_anchors = Background.from_image(test_backgrounds["image"])
+        bg_anchors = bg_image
         comp_anchors = Composition(bg_anchors)
 
         anchor_tests = [
@@ -829,12 +886,7 @@ class TestRealIntegration:
                 anchor, dx=dx, dy=dy
             ).size(SizeMode.CANVAS_PERCENT, percent=15).opacity(0.7)
 
-        output_anchors = output_dir / "real_api_composition_anchors.mp4"
-        encoder = EncoderProfile.h264(crf=22, preset="fast")
-        comp_anchors.to_file(str(output_anchors), encoder)
-
-        assert output_anchors.exists()
-        print(f"✅ Anchor positions test: {output_anchors}")
+        outputs = [(comp_anchors, output_dir / "real_api_composition_anchors.mp4")]
 
         # Test 2: Different sizing modes
         print("\n📐 Test 2: Testing different sizing modes...")
@@ -859,17 +911,13 @@ class TestRealIntegration:
                 anchor, dx=50, dy=50
             ).size(size_mode, **kwargs).opacity(0.6)
 
-        output_sizes = output_dir / "real_api_composition_sizes.mp4"
-        comp_sizes.to_file(str(output_sizes), encoder)
-
-        assert output_sizes.exists()
-        print(f"✅ Sizing modes test: {output_sizes}")
+        outputs.append((comp_sizes, output_dir / "real_api_composition_sizes.mp4"))
 
         # Test 3: Timing and opacity variations
         print("\n⏰ Test 3: Testing timing and opacity variations...")
         bg_timing = (
-            Background.from_video(test_backgrounds["video"])
-            if test_backgrounds["video"]
+            bg_video
+            if bg_video is not None
             else Background.from_color("#00FF00", 1920, 1080, 30.0)
         )
         comp_timing = Composition(bg_timing)
@@ -887,18 +935,14 @@ class TestRealIntegration:
             Anchor.BOTTOM_CENTER, dy=-50
         ).size(SizeMode.CANVAS_PERCENT, percent=25).opacity(0.4)
 
-        output_timing = output_dir / "real_api_composition_timing.mp4"
-        comp_timing.to_file(str(output_timing), encoder)
-
-        assert output_timing.exists()
-        print(f"✅ Timing and opacity test: {output_timing}")
+        outputs.append((comp_timing, output_dir / "real_api_composition_timing.mp4"))
 
         # Test 4: Audio handling
         print("\n🎵 Test 4: Testing audio handling...")
 
         # Test with video background (has audio)
-        if test_backgrounds["video"]:
-            bg_audio = Background.from_video(test_backgrounds["video"])
+        if bg_video is not None:
+            bg_audio = bg_video
             comp_audio = Composition(bg_audio)
 
             # Add foreground with audio enabled
@@ -906,14 +950,22 @@ class TestRealIntegration:
                 SizeMode.CONTAIN
             ).audio(enabled=True, volume=0.8)
 
-            output_audio = output_dir / "real_api_composition_audio.mp4"
-            comp_audio.to_file(str(output_audio), encoder)
-
-            assert output_audio.exists()
-            print(f"✅ Audio handling test: {output_audio}")
+            outputs.append((comp_audio, output_dir / "real_api_composition_audio.mp4"))
         else:
             print("⚠️ Audio test skipped (no video background available)")
 
+        # The variants are independent FFmpeg processes, so export them side
+        # by side; result() re-raises any export failure
+        with ThreadPoolExecutor(max_workers=len(outputs)) as executor:
+            pending = [
+                (executor.submit(comp.to_file, str(path), self.ENCODER), path)
+                for comp, path in outputs
+            ]
+        for future, path in pending:
+            future.result()
+            assert_valid_video(path)
+            print(f"✅ Exported: {path}")
+
         print("✅ Comprehensive composition options testing completed")
 
     def test_real_api_error_scenarios(self, client, output_dir):
@@ -944,9 +996,11 @@ class TestRealIntegration:
         # Test 3: API connectivity and response validation
         print("\n🔗 Test 3: API connectivity validation...")
         try:
-            # Multiple credits checks to verify consistent API responses
-            credits1 = client.credits()
-            credits2 = client.credits()
+            # Multiple credits checks to verify consistent API responses; they
+            # are independent, so issue them concurrently over the pooled session
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                pending = [executor.submit(client.credits) for _ in range(2)]
+            credits1, credits2 = (future.result() for future in pending)
 
             assert credits1.user_id == credits2.user_id
             assert credits1.total_credits == credits2.total_credits
@@ -976,57 +1030,57 @@ class TestRealIntegration:
 
         print("✅ Real API error scenarios testing completed")
 
+    @pytest.mark.credits(15)
     def test_performance_and_timing_real_api(
-        self, client, sample_video_url, test_backgrounds, output_dir
+        self, processed_foreground, bg_image, output_dir
     ):
         """Test performance characteristics and timing with real API - REAL API."""
-        credits = client.credits()
-        if credits.remaining_credits < 15:
-            pytest.skip("Not enough credits for performance testing")
-
         print("🚀 Testing performance and timing with REAL API...")
 
-        import time
-
         # Test 1: Measure processing time for different formats
         print("\n⏱️ Test 1: Measuring processing times...")
 
-        video = Video.open(sample_video_url)
-
-        # Test WebM VP9 (typically fastest)
-        start_time = time.time()
-        options_webm = RemoveBGOptions(prefer="webm_vp9")
-
-        foreground_webm = video.remove_background(client, options_webm)
-        webm_duration = time.time() - start_time
+        # Test WebM VP9 (typically fastest). The foreground is shared with the
+        # other WebM tests, so the job only runs (and is timed) if no earlier
+        # test in the session needed it; on_status fires only for a real run.
+        statuses = []
+        start_time = time.perf_counter()
+        foreground_webm = processed_foreground(
+            Prefer.WEBM_VP9, on_status=statuses.append
+        )
+        webm_duration = time.perf_counter() - start_time
 
         assert foreground_webm is not None
-        print(f"✅ WebM VP9 processing time: {webm_duration:.2f} seconds")
+        reused = "" if statuses else " (reused from an earlier test)"
+        print(f"✅ WebM VP9 processing time: {webm_duration:.2f} seconds{reused}")
 
         # Test 2: Composition performance with real foreground
         print("\n🎨 Test 2: Measuring composition performance...")
 
-        bg = Background.from_image(test_backgrounds["image"])
+        bg = bg_image
         comp = Composition(bg)
 
         # Add multiple layers to test composition complexity
-        start_comp_time = time.time()
+        start_comp_time = time.perf_counter()
 
-        for i in range(3):
+        layer_positions = [
+            (Anchor.TOP_LEFT, 50, 50),
+            (Anchor.TOP_RIGHT, -50, 50),
+            (Anchor.BOTTOM_CENTER, 0, -50),
+        ]
+        for i, (anchor, dx, dy) in enumerate(layer_positions):
             comp.add(foreground_webm, name=f"perf_layer_{i}").at(
-                [Anchor.TOP_LEFT, Anchor.TOP_RIGHT, Anchor.BOTTOM_CENTER][i],
-                dx=[50, -50, 0][i],
-                dy=[50, 50, -50][i],
+                anchor, dx=dx, dy=dy
             ).size(SizeMode.CANVAS_PERCENT, percent=20).opacity(0.7)
 
         # Export and measure
         output_perf = output_dir / "real_api_performance_test.mp4"
-        encoder = EncoderProfile.h264(crf=23, preset="fast")
+        encoder = self.ENCODER
         comp.to_file(str(output_perf), encoder)
 
-        comp_duration = time.time() - start_comp_time
+        comp_duration = time.perf_counter() - start_comp_time
 
-        assert output_perf.exists()
+        assert_valid_video(output_perf)
         print(f"✅ 3-layer composition time: {comp_duration:.2f} seconds")
         print(f"✅ Performance test output: {output_perf}")
 
@@ -1044,38 +1098,25 @@ class TestRealIntegration:
 
         print("✅ Performance and timing testing completed")
 
+    @pytest.mark.credits(15)
     def test_animated_transparency_composition(
-        self, client, sample_video_url, test_backgrounds, output_dir
+        self, client, sample_video_url, long_background_bg, output_dir
     ):
         """Test animated composition with transparency alternating - REAL API + REAL FFMPEG."""
-        credits = client.credits()
-        if credits.remaining_credits < 15:
-            pytest.skip("Not enough credits for animated transparency test")
-
         print("🎭 Testing animated transparency composition...")
 
         # Process the long foreground video with auto format choice
         video = Video.open("test_assets/long_foreground_video.mp4")
         options = RemoveBGOptions()  # Auto format choice
 
-        def status_callback(status):
-            status_messages = {
-                "created": "📋 Job created...",
-                "uploaded": "📤 Video uploaded...",
-                "processing": "🤖 AI processing started...",
-                "completed": "✅ Processing completed!",
-                "failed": "❌ Processing failed!",
-            }
-            message = status_messages.get(status, f"📊 Status: {status}")
-            print(f"  {message}")
-
-        foreground = video.remove_background(client, options, on_status=status_callback)
+        foreground = video.remove_background(
+            client, options, on_status=_status_callback, wait_poll_seconds=POLL_SECONDS
+        )
         assert foreground is not None
         print(f"✅ Long foreground processed with auto format: {foreground.format}")
 
         # Create composition with long background video
-        bg_video = Background.from_video("test_assets/long_background_video.mp4")
-        comp = Composition(bg_video)
+        comp = Composition(long_background_bg)
 
         # Animation sequence with CONTINUOUS foreground (no restarting):
         # 0-3s: Full video at center (with alpha)
@@ -1125,39 +1166,18 @@ class TestRealIntegration:
 
         # Export animated composition
         output_path = output_dir / "animated_transparency_composition.mp4"
-        encoder = EncoderProfile.h264(crf=20, preset="medium")
+        encoder = self.ENCODER
 
         print("🎬 Exporting animated composition...")
         comp.to_file(str(output_path), encoder)
 
         # Verify output
-        assert output_path.exists()
-        assert output_path.stat().st_size > 0
+        assert_valid_video(output_path)
 
-        # Get actual duration to verify timing
-        import subprocess
-        import json
-
-        try:
-            cmd = [
-                "ffprobe",
-                "-v",
-                "quiet",
-                "-print_format",
-                "json",
-                "-show_entries",
-                "format=duration",
-                str(output_path),
-            ]
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
-            if result.returncode == 0:
-                data = json.loads(result.stdout)
-                duration = data.get("format", {}).get("duration")
-                if duration:
-                    actual_duration = float(duration)
-                    print(f"✅ Animated composition duration: {actual_duration:.1f}s")
-        except Exception:
-            pass  # Duration check is optional
+        # Get actual duration to verify timing (optional; 0.0 if unknown)
+        actual_duration = get_video_duration(str(output_path))
+        if actual_duration:
+            print(f"✅ Animated composition duration: {actual_duration:.1f}s")
 
         print(f"✅ Animated transparency composition completed: {output_path}")
         print(
@@ -1166,12 +1186,9 @@ class TestRealIntegration:
 
         return output_path
 
+    @pytest.mark.credits(15)
     def test_webhook_integration_end_to_end(self, client, sample_video_url, output_dir):
         """Test webhook integration end-to-end with REAL API."""
-        credits = client.credits()
-        if credits.remaining_credits < 15:
-            pytest.skip("Not enough credits for webhook integration test")
-
         print("🔔 Testing webhook integration end-to-end with REAL API...")
 
         # Use local test webhook endpoint
@@ -1210,18 +1227,9 @@ class TestRealIntegration:
         # Step 3: Wait for job completion
         print("\n⏳ Step 3: Waiting for job completion...")
 
-        def status_callback(status):
-            status_messages = {
-                "created": "📋 Job created...",
-                "uploaded": "📤 Video uploaded...",
-                "processing": "🤖 AI processing...",
-                "completed": "✅ Processing completed!",
-                "failed": "❌ Processing failed!",
-            }
-            message = status_messages.get(status, f"📊 Status: {status}")
-            print(f"  {message}")
-
-        final_status = client.wait(job_id, poll_seconds=2.0, on_status=status_callback)
+        final_status = client.wait(
+            job_id, poll_seconds=POLL_SECONDS, on_status=_status_callback
+        )
 
         assert final_status.status == "completed"
         print("✅ Job completed successfully")
@@ -1263,15 +1271,9 @@ class TestRealIntegration:
         print("   - job.completed webhook delivered")
         print("   - Delivery history retrieved successfully")
 
-    def test_model_choices(
-        self, client, sample_video_url, test_backgrounds, output_dir
-    ):
+    @pytest.mark.credits(30)
+    def test_model_choices(self, client, sample_video, test_backgrounds, output_dir):
         """Test processing with different model choices."""
-        # Check credits
-        credits = client.credits()
-        if credits.remaining_credits < 30:
-            pytest.skip("Not enough credits for model choice test (need ~30 credits)")
-
         print("🤖 Testing different model choices with REAL API...")
 
         # Test both models with the same video
@@ -1280,52 +1282,37 @@ class TestRealIntegration:
             {"model": Model.VIDEOBGREMOVER_LIGHT, "name": "videobgremover-light"},
         ]
 
-        results = []
+        if not test_backgrounds["image"]:
+            pytest.skip("Test background image not found")
 
-        for model_config in models_to_test:
+        video = sample_video
+        bg = Background.from_image(test_backgrounds["image"], 30.0)
+
+        def _run_one(model_config):
             model = model_config["model"]
             name = model_config["name"]
 
             print(f"\n🎬 Processing with {name} model...")
-
-            import time
-
-            start_time = time.time()
-
-            # Load video
-            video = Video.open(sample_video_url)
+            start_time = time.perf_counter()
 
             # Configure with model choice
             options = RemoveBGOptions(prefer=Prefer.WEBM_VP9, model=model)
 
-            # Status callback for progress
-            def status_callback(status):
-                status_messages = {
-                    "created": "📋 Job created...",
-                    "uploaded": "📤 Video uploaded...",
-                    "processing": "🤖 AI processing...",
-                    "completed": "✅ Processing completed!",
-                    "failed": "❌ Processing failed!",
-                }
-                message = status_messages.get(status, f"📊 Status: {status}")
-                print(f"  {message}")
-
             # Process video (REAL API CALL - consumes credits!)
             foreground = video.remove_background(
-                client, options, wait_poll_seconds=2.0, on_status=status_callback
+                client,
+                options,
+                on_status=_status_callback,
+                wait_poll_seconds=POLL_SECONDS,
             )
 
-            processing_time = time.time() - start_time
+            processing_time = time.perf_counter() - start_time
 
             # Verify processing result
             assert foreground is not None
             print(f"✅ {name} processing completed in {processing_time:.2f}s")
 
             # Create composition with background
-            if not test_backgrounds["image"]:
-                pytest.skip("Test background image not found")
-
-            bg = Background.from_image(test_backgrounds["image"], 30.0)
             comp = Composition(bg)
             comp.add(foreground, f"model_{name}").at(Anchor.CENTER).size(
                 SizeMode.CONTAIN
@@ -1333,26 +1320,24 @@ class TestRealIntegration:
 
             # Export composition
             output_path = output_dir / f"model_{name.replace('-', '_')}.mp4"
-            encoder = EncoderProfile.h264(crf=20, preset="medium")
-
             print(f"🔧 Exporting to: {output_path}")
-            comp.to_file(str(output_path), encoder)
+            comp.to_file(str(output_path), self.ENCODER)
 
             # Verify output
-            assert output_path.exists()
-            file_size = output_path.stat().st_size
-            assert file_size > 0
+            file_size = assert_valid_video(output_path)
+            print(f"✅ {name} exported: {output_path} ({file_size} bytes)")
 
-            results.append(
-                {
-                    "model": name,
-                    "output_path": str(output_path),
-                    "foreground": foreground,
-                    "processing_time": processing_time,
-                }
-            )
+            return {
+                "model": name,
+                "output_path": str(output_path),
+                "foreground": foreground,
+                "processing_time": processing_time,
+            }
 
-            print(f"✅ {name} exported: {output_path} ({file_size} bytes)")
+        # The jobs are independent and mostly wait on the API, so run them
+        # (and their exports) concurrently
+        with ThreadPoolExecutor(max_workers=len(models_to_test)) as executor:
+            results = list(executor.map(_run_one, models_to_test))
 
         # Verify both models worked
         assert len(results) == 2
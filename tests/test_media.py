@@ -1,6 +1,8 @@
 """Tests for media processing components."""
 
 import os
+import re
+import pytest
 from unittest.mock import Mock, patch
 from videobgremover.media import (
     Video,
@@ -16,27 +18,32 @@ from videobgremover.core import (
     SizeMode,
 )
 
+from .conftest import assert_all_present
 
-class TestVideo:
-    """Test Video class."""
 
-    def test_open_file(self):
-        """Test opening video from file path."""
-        video = Video.open("/path/to/video.mp4")
-        assert video.kind == "file"
-        assert video.src == "/path/to/video.mp4"
+def _filter_graph(cmd: str) -> str:
+    """Return the -filter_complex argument of an FFmpeg command ("" if absent)."""
+    match = re.search(r"-filter_complex (.*?) -map ", cmd)
+    return match.group(1) if match else ""
+
 
-    def test_open_url(self):
-        """Test opening video from URL."""
-        video = Video.open("https://example.com/video.mp4")
-        assert video.kind == "url"
-        assert video.src == "https://example.com/video.mp4"
+class TestVideo:
+    """Test Video class."""
 
-    def test_open_http_url(self):
-        """Test opening video from HTTP URL."""
-        video = Video.open("http://example.com/video.mp4")
-        assert video.kind == "url"
-        assert video.src == "http://example.com/video.mp4"
+    @pytest.mark.parametrize(
+        "src, kind",
+        [
+            ("/path/to/video.mp4", "file"),
+            ("https://example.com/video.mp4", "url"),
+            ("http://example.com/video.mp4", "url"),
+        ],
+        ids=["file", "https_url", "http_url"],
+    )
+    def test_open(self, src, kind):
+        """Test opening video from a file path or URL."""
+        video = Video.open(src)
+        assert video.kind == kind
+        assert video.src == src
 
 
 class TestBackground:
@@ -51,33 +58,87 @@ class TestBackground:
         assert bg.height == 1080
         assert bg.fps == 30.0
 
-    def test_from_image(self):
+    def test_from_color_uses_lavfi_source(self):
+        """Test color background frames are generated by FFmpeg, not Python."""
+        bg = Background.from_color("#FF0000", 1920, 1080, 30.0)
+        args = bg.get_ffmpeg_input_args(1920, 1080, 30.0, ctx=None)
+        assert args == [
+            "-f",
+            "lavfi",
+            "-i",
+            "color=c=#FF0000:size=1920x1080:rate=30.0",
+        ]
+
+    def test_from_image(self, stub_probes):
         """Test creating image background."""
-        # Mock the dimension probing to avoid file system dependency
-        with patch(
-            "videobgremover.media.backgrounds._probe_image_dimensions"
-        ) as mock_probe:
-            mock_probe.return_value = (1920, 1080)
-            bg = Background.from_image("/path/to/image.jpg", fps=30.0)
-            assert bg.kind == "image"
-            assert bg.source == "/path/to/image.jpg"
-            assert bg.width == 1920
-            assert bg.height == 1080
-            assert bg.fps == 30.0
-
-    def test_from_video(self):
+        bg = Background.from_image("/path/to/image.jpg", fps=30.0)
+        assert bg.kind == "image"
+        assert bg.source == "/path/to/image.jpg"
+        assert bg.width == 1920
+        assert bg.height == 1080
+        assert bg.fps == 30.0
+
+    def test_image_dimensions_read_from_header(self, temp_dir):
+        """Test image sizes come from the file header without spawning ffprobe."""
+        import struct
+
+        from videobgremover.media.backgrounds import _probe_image_dimensions
+
+        vp8l_bits = (123 - 1) | ((45 - 1) << 14)
+        headers = {
+            "image.png": b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR"
+            + struct.pack(">II", 1920, 1080)
+            + b"\x08\x02\x00\x00\x00",
+            "image.gif": b"GIF89a" + struct.pack("<HH", 640, 480) + b"\x00" * 8,
+            "image.jpg": b"\xff\xd8\xff\xe0"
+            + struct.pack(">H", 16)
+            + b"JFIF\x00"
+            + b"\x00" * 9
+            + b"\xff\xc2"  # Progressive start-of-frame
+            + struct.pack(">HBHHB", 17, 8, 720, 1280, 3),
+            "image.webp": b"RIFF\x00\x00\x00\x00WEBPVP8L\x00\x00\x00\x00\x2f"
+            + vp8l_bits.to_bytes(4, "little"),
+        }
+        expected = {
+            "image.png": (1920, 1080),
+            "image.gif": (640, 480),
+            "image.jpg": (1280, 720),
+            "image.webp": (123, 45),
+        }
+
+        ctx = MediaContext()
+        with patch("videobgremover.media._probe.subprocess.run") as mock_run:
+            for name, header in headers.items():
+                path = os.path.join(temp_dir, name)
+                with open(path, "wb") as f:
+                    f.write(header + b"\x00" * 16)
+                assert _probe_image_dimensions(path, ctx) == expected[name]
+
+        mock_run.assert_not_called()
+
+    def test_from_video(self, stub_probes):
         """Test creating video background."""
-        # Mock the dimension probing to avoid file system dependency
-        with patch(
-            "videobgremover.media.backgrounds._probe_video_dimensions"
-        ) as mock_probe:
-            mock_probe.return_value = (1920, 1080, 30.0)
-            bg = Background.from_video("https://example.com/bg.mp4")
-            assert bg.kind == "video"
-            assert bg.source == "https://example.com/bg.mp4"
-            assert bg.width == 1920
-            assert bg.height == 1080
-            assert bg.fps == 30.0
+        bg = Background.from_video("https://example.com/bg.mp4")
+        assert bg.kind == "video"
+        assert bg.source == "https://example.com/bg.mp4"
+        assert bg.width == 1920
+        assert bg.height == 1080
+        assert bg.fps == 30.0
+
+    def test_subclip_and_audio_reuse_probed_info(self, stub_probes):
+        """Test subclip()/audio() copy the probed video info instead of re-probing."""
+        bg = Background.from_video("https://example.com/bg.mp4")
+        bg._video_info = {"streams": [{"codec_type": "audio"}]}
+
+        with patch("videobgremover.media._probe.subprocess.run") as mock_run:
+            trimmed = bg.subclip(1.0, 4.0).audio(enabled=True, volume=0.5)
+
+        mock_run.assert_not_called()
+        assert trimmed.source_trim == (1.0, 4.0)
+        assert trimmed.audio_volume == 0.5
+        assert trimmed.get_video_info() is bg.get_video_info()
+        assert trimmed.has_audio()
+        assert bg.source_trim is None  # Original is unchanged
 
     def test_empty(self):
         """Test creating empty background."""
@@ -237,85 +298,101 @@ class TestEncoderProfile:
         ]
         assert args == expected_args
 
-    def test_args_transparent_webm(self):
-        """Test transparent WebM FFmpeg args generation."""
-        encoder = EncoderProfile.transparent_webm(crf=25)
-        args = encoder.args("output.webm")
-
-        assert "-c:v" in args
-        assert "libvpx-vp9" in args
-        assert "-crf" in args
-        assert "25" in args
-        assert "-pix_fmt" in args
-        assert "yuva420p" in args
-        assert "output.webm" in args
-
-    def test_args_prores_4444(self):
-        """Test ProRes 4444 FFmpeg args generation."""
-        encoder = EncoderProfile.prores_4444()
-        args = encoder.args("output.mov")
+    def test_args_h264_tune(self):
+        """Test H.264 tune option is passed through to FFmpeg."""
+        encoder = EncoderProfile.h264(crf=28, preset="ultrafast", tune="zerolatency")
+        args = encoder.args("output.mp4")
 
-        assert "-c:v" in args
-        assert "prores_ks" in args
-        assert "-profile:v" in args
-        assert "4" in args
-        assert "output.mov" in args
+        assert args[args.index("-tune") + 1] == "zerolatency"
+        assert args[-1] == "output.mp4"
+        assert "-tune" not in EncoderProfile.h264().args("output.mp4")
+
+    def test_args_h264_threading(self):
+        """Test H.264 thread count and raw x264 params are passed through."""
+        encoder = EncoderProfile.h264(threads=2, x264_params="sliced-threads=1")
+        args = encoder.args("output.mp4")
+
+        assert args[args.index("-threads") + 1] == "2"
+        assert args[args.index("-x264-params") + 1] == "sliced-threads=1"
+        assert args[-1] == "output.mp4"
+
+        default_args = EncoderProfile.h264().args("output.mp4")
+        assert "-threads" not in default_args
+        assert "-x264-params" not in default_args
+
+    def test_args_h264_hardware_codec(self):
+        """Test hardware H.264 encoders skip the x264-only options."""
+        encoder = EncoderProfile.h264(crf=28, preset="ultrafast", codec="h264_nvenc")
+        args = encoder.args("output.mp4")
+
+        assert args[args.index("-c:v") + 1] == "h264_nvenc"
+        assert args[args.index("-cq") + 1] == "28"
+        assert "-preset" not in args
+        assert args[-1] == "output.mp4"
+
+        vt_args = EncoderProfile.h264(codec="h264_videotoolbox").args("output.mp4")
+        assert vt_args == [
+            "-c:v",
+            "h264_videotoolbox",
+            "-pix_fmt",
+            "yuv420p",
+            "output.mp4",
+        ]
+        assert "libx264" in EncoderProfile.h264(codec="libx264").args("output.mp4")
+
+    @pytest.mark.parametrize(
+        "encoder, out_path, expected",
+        [
+            (
+                EncoderProfile.transparent_webm(crf=25),
+                "output.webm",
+                {"-c:v": "libvpx-vp9", "-crf": "25", "-pix_fmt": "yuva420p"},
+            ),
+            (
+                EncoderProfile.prores_4444(),
+                "output.mov",
+                {"-c:v": "prores_ks", "-profile:v": "4"},
+            ),
+        ],
+        ids=["transparent_webm", "prores_4444"],
+    )
+    def test_args_flag_values(self, encoder, out_path, expected):
+        """Test each FFmpeg flag is followed by its expected value."""
+        args = encoder.args(out_path)
+
+        flags = dict(zip(args, args[1:]))
+        for flag, value in expected.items():
+            assert flags[flag] == value
+        assert args[-1] == out_path
 
 
 class TestMediaContext:
     """Test MediaContext class."""
 
-    def test_init_default(self):
+    def test_init_default(self, media_ctx):
         """Test default initialization."""
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value.returncode = 0
-            mock_run.return_value.stderr = ""
+        assert media_ctx.ffmpeg == "ffmpeg"
+        assert media_ctx.ffprobe == "ffprobe"
+        assert os.path.exists(media_ctx.tmp)
 
-            ctx = MediaContext()
-            assert ctx.ffmpeg == "ffmpeg"
-            assert ctx.ffprobe == "ffprobe"
-            assert os.path.exists(ctx.tmp)
-
-    def test_temp_path(self):
+    def test_temp_path(self, media_ctx):
         """Test temporary path generation."""
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value.returncode = 0
-            mock_run.return_value.stderr = ""
-
-            ctx = MediaContext()
-            temp_path = ctx.temp_path(suffix=".mp4", prefix="test_")
+        temp_path = media_ctx.temp_path(suffix=".mp4", prefix="test_")
 
-            assert temp_path.endswith(".mp4")
-            assert "test_" in os.path.basename(temp_path)
+        assert temp_path.endswith(".mp4")
+        assert "test_" in os.path.basename(temp_path)
 
-    def test_check_webm_support_available(self):
+    def test_check_webm_support_available(self, media_ctx):
         """Test WebM support check when available."""
         with patch("subprocess.run") as mock_run:
-            # Mock ffmpeg version check (init)
-            mock_run.side_effect = [
-                Mock(returncode=0, stderr=""),  # ffmpeg version
-                Mock(returncode=0, stderr=""),  # ffprobe version
-                Mock(returncode=0, stdout="libvpx-vp9 decoder"),  # decoders check
-            ]
+            mock_run.return_value = Mock(returncode=0, stdout="libvpx-vp9 decoder")
+            assert media_ctx.check_webm_support() is True
 
-            ctx = MediaContext()
-            assert ctx.check_webm_support() is True
-
-    def test_check_webm_support_not_available(self):
+    def test_check_webm_support_not_available(self, media_ctx):
         """Test WebM support check when not available."""
         with patch("subprocess.run") as mock_run:
-            # Mock ffmpeg version check (init) - first two calls for initialization
-            mock_run.side_effect = [
-                Mock(returncode=0, stderr=""),  # ffmpeg version
-                Mock(returncode=0, stderr=""),  # ffprobe version
-            ]
-
-            ctx = MediaContext()
-
-            # Now mock the actual webm check call
-            with patch.object(ctx, "check_webm_support") as mock_check:
-                mock_check.return_value = False
-                assert ctx.check_webm_support() is False
+            mock_run.return_value = Mock(returncode=0, stdout="vp8 decoder")
+            assert media_ctx.check_webm_support() is False
 
     def test_context_manager(self):
         """Test context manager functionality."""
@@ -331,6 +408,129 @@ class TestMediaContext:
             # Note: This test might be flaky due to temp directory cleanup timing
 
 
+class TestHttpSession:
+    """Test the shared download session."""
+
+    def test_session_is_shared_and_pooled(self):
+        """Test downloads reuse one keep-alive session with a connection pool."""
+        from videobgremover.media._http import http_session
+
+        session = http_session()
+        assert http_session() is session
+        adapter = session.get_adapter("https://example.com/image.png")
+        assert adapter._pool_maxsize >= 4
+
+    def test_image_download_uses_shared_session(self):
+        """Test URL image backgrounds are fetched through the shared session."""
+        from videobgremover.media._http import http_session
+
+        response = Mock()
+        response.headers = {"Content-Type": "image/png"}
+        response.iter_content.return_value = [b"png data"]
+
+        probe = patch(
+            "videobgremover.media.backgrounds._probe_image_dimensions",
+            return_value=(640, 480),
+        )
+        with probe, patch.object(http_session(), "get") as mock_get:
+            mock_get.return_value = response
+            bg = Background.from_image("https://example.com/bg.png")
+
+        mock_get.assert_called_once()
+        assert bg.source.endswith(".png")
+        assert (bg.width, bg.height) == (640, 480)
+        os.remove(bg.source)
+
+    def test_signed_upload_streams_file_through_shared_session(self, tmp_path):
+        """Test uploads pass the open file as body via the shared session."""
+        from videobgremover.media._http import http_session
+        from videobgremover.media._importer_internal import Importer
+        from videobgremover.media.context import MediaContext
+
+        video_path = tmp_path / "upload.mp4"
+        video_path.write_bytes(b"video data")
+        importer = Importer(MediaContext())
+
+        with patch.object(http_session(), "put") as mock_put:
+            importer._signed_put(
+                "https://storage.example.com/signed", str(video_path), "video/mp4"
+            )
+
+        body = mock_put.call_args.kwargs["data"]
+        assert hasattr(body, "read")
+        assert body.name == str(video_path)
+        assert mock_put.call_args.kwargs["headers"] == {"Content-Type": "video/mp4"}
+
+
+class TestProbeCache:
+    """Test memoized ffprobe execution."""
+
+    def test_local_file_probed_once(self, sample_video_path):
+        """Test repeated probes of an unchanged file reuse the first result."""
+        from videobgremover.media._probe import clear_probe_cache, run_ffprobe
+
+        clear_probe_cache()
+        cmd = ["ffprobe", "-v", "quiet", sample_video_path]
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = Mock(returncode=0, stdout="{}", stderr="")
+
+            first = run_ffprobe(cmd, sample_video_path, timeout=5)
+            second = run_ffprobe(cmd, sample_video_path, timeout=5)
+
+            assert mock_run.call_count == 1
+            assert first.stdout == second.stdout == "{}"
+            assert second.returncode == 0
+
+    def test_modified_file_probed_again(self, sample_video_path):
+        """Test a changed file invalidates its cached probe result."""
+        from videobgremover.media._probe import clear_probe_cache, run_ffprobe
+
+        clear_probe_cache()
+        cmd = ["ffprobe", "-v", "quiet", sample_video_path]
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = Mock(returncode=0, stdout="{}", stderr="")
+
+            run_ffprobe(cmd, sample_video_path, timeout=5)
+            with open(sample_video_path, "ab") as f:
+                f.write(b"more fake video data")
+            run_ffprobe(cmd, sample_video_path, timeout=5)
+
+            assert mock_run.call_count == 2
+
+    def test_failed_probe_not_cached(self, sample_video_path):
+        """Test a failed probe is returned as-is and retried next time."""
+        from videobgremover.media._probe import clear_probe_cache, run_ffprobe
+
+        clear_probe_cache()
+        cmd = ["ffprobe", "-v", "quiet", sample_video_path]
+        with patch("subprocess.run") as mock_run:
+            mock_run.side_effect = [
+                Mock(returncode=1, stdout="", stderr="Resource busy"),
+                Mock(returncode=0, stdout="{}", stderr=""),
+            ]
+
+            failed = run_ffprobe(cmd, sample_video_path, timeout=5)
+            retried = run_ffprobe(cmd, sample_video_path, timeout=5)
+
+            assert failed.returncode == 1
+            assert failed.stderr == "Resource busy"
+            assert retried.returncode == 0
+            assert mock_run.call_count == 2
+
+    def test_url_not_cached(self):
+        """Test URLs are always probed."""
+        from videobgremover.media._probe import run_ffprobe
+
+        url = "https://example.com/video.mp4"
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = Mock(returncode=0, stdout="{}", stderr="")
+
+            run_ffprobe(["ffprobe", url], url, timeout=10)
+            run_ffprobe(["ffprobe", url], url, timeout=10)
+
+            assert mock_run.call_count == 2
+
+
 class TestComposition:
     """Test Composition class."""
 
@@ -355,10 +555,10 @@ class TestComposition:
         assert comp._background.height == 1080
         assert comp._background.fps == 30.0
 
-    def test_add_layer(self):
+    def test_add_layer(self, placeholder_fg):
         """Test adding a layer."""
         comp = Composition()
-        fg = Foreground.from_webm_vp9("/path/to/video.webm")
+        fg = placeholder_fg
 
         handle = comp.add(fg, name="test_layer")
 
@@ -369,10 +569,10 @@ class TestComposition:
 
         assert isinstance(handle, LayerHandle)
 
-    def test_layer_handle_positioning(self):
+    def test_layer_handle_positioning(self, placeholder_fg):
         """Test layer handle positioning methods."""
         comp = Composition()
-        fg = Foreground.from_webm_vp9("/path/to/video.webm")
+        fg = placeholder_fg
 
         handle = comp.add(fg)
         handle.at(Anchor.TOP_RIGHT, dx=10, dy=20)
@@ -382,10 +582,10 @@ class TestComposition:
         assert layer["dx"] == 10
         assert layer["dy"] == 20
 
-    def test_layer_handle_size(self):
+    def test_layer_handle_size(self, placeholder_fg):
         """Test layer handle size methods."""
         comp = Composition()
-        fg = Foreground.from_webm_vp9("/path/to/video.webm")
+        fg = placeholder_fg
 
         handle = comp.add(fg)
         handle.size(SizeMode.PX, width=800, height=600)
@@ -393,10 +593,10 @@ class TestComposition:
         layer = comp._layers[0]
         assert layer["size"] == (SizeMode.PX, 800, 600, None, None)
 
-    def test_layer_handle_effects(self):
+    def test_layer_handle_effects(self, placeholder_fg):
         """Test layer handle visual effects."""
         comp = Composition()
-        fg = Foreground.from_webm_vp9("/path/to/video.webm")
+        fg = placeholder_fg
 
         handle = comp.add(fg)
         handle.opacity(0.7).rotate(45.0).crop(10, 20, 100, 200)
@@ -406,10 +606,10 @@ class TestComposition:
         assert layer["rotate"] == 45.0
         assert layer["crop"] == (10, 20, 100, 200)
 
-    def test_layer_handle_timing(self):
+    def test_layer_handle_timing(self, placeholder_fg):
         """Test layer handle timing methods."""
         comp = Composition()
-        fg = Foreground.from_webm_vp9("/path/to/video.webm")
+        fg = placeholder_fg
 
         handle = comp.add(fg)
         handle.start(1.0).end(5.0).duration(3.0)
@@ -419,47 +619,37 @@ class TestComposition:
         assert layer["comp_end"] == 5.0
         assert layer["comp_duration"] == 3.0
 
-    def test_dry_run_with_real_assets(self):
+    def test_dry_run_with_real_assets(self, image_bg_1080p):
         """Test dry run FFmpeg command generation using real test assets - NO MOCKING."""
-        with patch(
-            "videobgremover.media.backgrounds._probe_image_dimensions"
-        ) as mock_probe:
-            mock_probe.return_value = (1920, 1080)
-            bg = Background.from_image("test_assets/background_image.png", fps=30.0)
-            comp = Composition(bg)
-            fg = Foreground.from_webm_vp9("test_assets/transparent_webm_vp9.webm")
-            comp.add(fg)
+        comp = Composition(image_bg_1080p)
+        fg = Foreground.from_webm_vp9("test_assets/transparent_webm_vp9.webm")
+        comp.add(fg)
 
         cmd = comp.dry_run()
 
         # Test actual command structure
         assert cmd.startswith("ffmpeg")
-        assert "test_assets/background_image.png" in cmd
-        assert "test_assets/transparent_webm_vp9.webm" in cmd
-        assert "overlay=" in cmd  # Check for overlay filter
-        assert "eof_action=pass" in cmd  # Check for new overlay syntax
+        assert_all_present(
+            cmd,
+            [
+                "test_assets/background_image.png",
+                "test_assets/transparent_webm_vp9.webm",
+                "overlay=",
+                "eof_action=pass",  # New overlay syntax
+            ],
+        )
 
         # Regression test: ensure the bug we fixed doesn't return
         assert "decreaseoverlay" not in cmd
 
-        # Validate FFmpeg filter syntax
-        assert "-filter_complex" in cmd
-        parts = cmd.split("-filter_complex")
-        assert len(parts) == 2
-
-        # Extract filter complex part
-        filter_part = parts[1].split("-map")[0].strip()
-        # Ensure balanced brackets (proper FFmpeg syntax)
+        # Validate FFmpeg filter syntax: one graph with balanced brackets
+        assert cmd.count("-filter_complex ") == 1
+        filter_part = _filter_graph(cmd)
         assert filter_part.count("[") == filter_part.count("]")
 
-    def test_dry_run_multiple_formats(self):
+    def test_dry_run_multiple_formats(self, image_bg_1080p):
         """Test FFmpeg command generation with different video formats."""
-        with patch(
-            "videobgremover.media.backgrounds._probe_image_dimensions"
-        ) as mock_probe:
-            mock_probe.return_value = (1920, 1080)
-            bg = Background.from_image("test_assets/background_image.png", fps=30.0)
-            comp = Composition(bg)
+        comp = Composition(image_bg_1080p)
 
         # Test WebM format
         webm_fg = Foreground.from_webm_vp9("test_assets/transparent_webm_vp9.webm")
@@ -475,18 +665,21 @@ class TestComposition:
 
         # Validate complex filter structure
         assert cmd.startswith("ffmpeg")
-        assert "transparent_webm_vp9.webm" in cmd
-        assert "transparent_mov_prores.mov" in cmd
+        assert_all_present(
+            cmd,
+            [
+                "transparent_webm_vp9.webm",
+                "transparent_mov_prores.mov",
+                "colorchannelmixer=aa=0.8",  # Opacity filter
+                "scale=800:600",  # Pixel scaling
+            ],
+        )
         assert cmd.count("overlay=") == 2  # Two overlay operations
-        assert "colorchannelmixer=aa=0.8" in cmd  # Opacity filter
-        assert "scale=800:600" in cmd  # Pixel scaling
 
         # Ensure no syntax errors
         assert "decreaseoverlay" not in cmd
-        filter_parts = cmd.split("-filter_complex")
-        if len(filter_parts) > 1:
-            filter_complex = filter_parts[1].split("-map")[0].strip()
-            assert filter_complex.count("[") == filter_complex.count("]")
+        filter_complex = _filter_graph(cmd)
+        assert filter_complex.count("[") == filter_complex.count("]")
 
     def test_dry_run_stacked_video(self):
         """Test FFmpeg command generation with stacked video format."""
@@ -504,47 +697,144 @@ class TestComposition:
 
         # Validate stacked video handling
         assert cmd.startswith("ffmpeg")
-        assert "stacked_video_comparison.mp4" in cmd
-        assert "alphamerge" in cmd  # Should use alphamerge filter
-        assert "format=rgba" in cmd  # Should convert to RGBA
-        assert "format=gray" in cmd  # Should convert mask to grayscale
-        assert "force_original_aspect_ratio=increase" in cmd  # COVER mode
+        assert_all_present(
+            cmd,
+            [
+                "stacked_video_comparison.mp4",
+                "alphamerge",
+                "format=rgba",  # RGB converted to RGBA
+                "format=gray",  # Mask converted to grayscale
+                "force_original_aspect_ratio=increase",  # COVER mode
+            ],
+        )
 
         # Ensure no syntax errors
         assert "decreaseoverlay" not in cmd
 
-    def test_pro_bundle_zip_handling(self):
-        """Test that the SDK can handle pro bundle ZIP files correctly."""
+    def test_dry_run_shared_source_single_input(self):
+        """Test that layers sharing a source reuse a single FFmpeg input."""
+        bg = Background.from_color("#00FF00", 1920, 1080, 30.0)
+        comp = Composition(bg)
+
+        fg = Foreground.from_webm_vp9("test_assets/transparent_webm_vp9.webm")
+        trimmed = fg.subclip(0, 4)
+        for i in range(3):
+            comp.add(trimmed, name=f"shared_{i}").start(2).duration(4)
+        # A different trim is a different source and gets its own input
+        comp.add(fg.subclip(1, 3), name="other_trim")
+
+        cmd = comp.dry_run()
+
+        assert cmd.count("-i test_assets/transparent_webm_vp9.webm") == 2
+        assert cmd.count("[1:v]") == 3  # Shared input feeds three layers
+        assert cmd.count("[2:v]") == 1
+        assert cmd.count("overlay=") == 4
+
+    def test_dry_run_staggered_layers_keep_separate_inputs(self):
+        """Test same-source layers at different times do not share an input."""
+        bg = Background.from_color("#00FF00", 1920, 1080, 30.0)
+        comp = Composition(bg)
+
+        trimmed = Foreground.from_webm_vp9(
+            "test_assets/transparent_webm_vp9.webm"
+        ).subclip(0, 4)
+        for i in range(3):
+            comp.add(trimmed, name=f"staggered_{i}").start(i * 2).duration(4)
+
+        cmd = comp.dry_run()
+
+        # A shared decoder would buffer frames until each later start offset
+        assert cmd.count("-i test_assets/transparent_webm_vp9.webm") == 3
+
+    def test_dry_run_cached_until_modified(self):
+        """Test dry_run() reuses its command until the composition changes."""
+        bg = Background.from_color("#00FF00", 1920, 1080, 30.0)
+        fg = Foreground.from_webm_vp9("test_assets/transparent_webm_vp9.webm")
+
+        comp = Composition(bg)
+        handle = comp.add(fg)
+        cmd = comp.dry_run()
+
+        with patch.object(comp, "_build_ffmpeg_argv") as mock_build:
+            assert comp.dry_run() is cmd
+            mock_build.assert_not_called()
+
+        handle.opacity(0.5)
+        assert comp.dry_run() != cmd
+        assert "colorchannelmixer=aa=0.5" in comp.dry_run()
+
+    def test_run_uses_large_pipe_buffers(self):
+        """Test FFmpeg is spawned with 1 MB pipe buffers."""
+        comp = Composition(Background.from_color("#00FF00", 320, 240, 30.0))
+
+        with patch("videobgremover.media.composition.subprocess.Popen") as mock_popen:
+            process = mock_popen.return_value
+            process.stdout = process.stderr = None
+            process.communicate.return_value = ("", "")
+            process.returncode = 0
+
+            comp._run(["ffmpeg", "-version"])
+
+        assert mock_popen.call_args.kwargs["bufsize"] == 1 << 20
+
+    def test_is_stacked_video_reads_compact_dimensions(self):
+        """Test stacked detection parses ffprobe's bare width,height output."""
         from videobgremover.media._importer_internal import Importer
         from videobgremover.media.context import MediaContext
 
-        # Test the ZIP handling method directly
-        ctx = MediaContext()
-        importer = Importer(ctx)
+        importer = Importer(MediaContext())
 
-        # Test with the real pro bundle ZIP
-        try:
-            foreground = importer._handle_zip_bundle(
-                "test_assets/pro_bundle_multiple_formats.zip"
-            )
+        with patch(
+            "videobgremover.media._importer_internal.subprocess.run"
+        ) as mock_run:
+            mock_run.return_value = Mock(returncode=0, stdout="1080,2160\n")
+            assert importer._is_stacked_video("stacked.mp4")
 
-            # Should return a bundle format (color.mp4 + alpha.mp4)
-            assert foreground.format == "pro_bundle"
-            assert foreground.primary_path is not None
-            assert foreground.mask_path is not None
-            assert "color.mp4" in foreground.primary_path
-            assert "alpha.mp4" in foreground.mask_path
+            argv = mock_run.call_args[0][0]
+            assert argv[argv.index("-show_entries") + 1] == "stream=width,height"
+            assert "json" not in argv
 
-            print(
-                f"✅ Pro bundle handled: RGB={foreground.primary_path}, Mask={foreground.mask_path}"
-            )
+            mock_run.return_value = Mock(returncode=0, stdout="1920,1080\n")
+            assert not importer._is_stacked_video("plain.mp4")
+
+            mock_run.return_value = Mock(returncode=1, stdout="")
+            assert not importer._is_stacked_video("missing.mp4")
+
+    def test_unreachable_url_fails_before_job_creation(self):
+        """Test an inaccessible video URL raises without calling the API."""
+        from videobgremover.media._importer_internal import Importer
+        from videobgremover.media.context import MediaContext
+
+        importer = Importer(MediaContext())
+        client = Mock()
+        video = Video.open("https://nonexistent.example.com/video.mp4")
+
+        with patch.object(importer, "_public_url_ok", return_value=False):
+            with pytest.raises(RuntimeError, match="not publicly accessible"):
+                importer._create_job(video, client)
+
+        client.create_job_url.assert_not_called()
+        client.create_job_file.assert_not_called()
+
+    def test_pro_bundle_zip_handling(self, media_ctx, tmp_path):
+        """Test that the SDK can handle pro bundle ZIP files correctly."""
+        import zipfile
+
+        from videobgremover.media._importer_internal import Importer
+
+        # Only the bundle layout matters, so empty entries stand in for media
+        zip_path = tmp_path / "pro_bundle.zip"
+        with zipfile.ZipFile(zip_path, "w") as bundle:
+            for name in ("color.mp4", "alpha.mp4", "manifest.json"):
+                bundle.writestr(name, b"")
+
+        foreground = Importer(media_ctx)._handle_zip_bundle(str(zip_path))
 
-        except Exception as e:
-            # If the method doesn't exist yet, that's expected
-            if "has no attribute '_handle_zip_bundle'" in str(e):
-                print("⚠️ ZIP handling not yet implemented")
-            else:
-                raise
+        # Should return a bundle format (color.mp4 + alpha.mp4)
+        assert foreground.format == "pro_bundle"
+        assert foreground.primary_path.endswith("color.mp4")
+        assert foreground.mask_path.endswith("alpha.mp4")
+        assert foreground.audio_path is None
 
 
 class TestRemoveBGOptions: